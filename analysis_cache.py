@@ -0,0 +1,194 @@
+import os
+import zlib
+import struct
+import marshal
+import hashlib
+from typing import Optional, Tuple, List
+
+from log_analyzer import AnalysisResult, LogTable, SectionChangeList, RowOffsetIndex
+
+# --- 캐시 파일 형식 ---
+# [MAGIC 4바이트][버전 1바이트][키 길이 4바이트][marshal(키)][marshal(이어서 분석할 상태)][zlib(marshal(결과))]
+CACHE_MAGIC = b"GRAC"
+CACHE_VERSION = 3
+CACHE_EXT = ".grac"
+
+# 파일 내용 지문 계산에 사용하는 앞/뒤 구간 크기
+FINGERPRINT_BYTES = 64 * 1024
+
+# 파일 식별 키: (절대 경로, 크기, 수정 시간(ns), 내용 지문)
+FileKey = Tuple[str, int, int, str]
+
+
+def get_file_key(csv_path: str) -> FileKey:
+    """
+    파일 경로, 크기, 수정 시간과 앞/뒤 64KB의 해시로 파일 식별 키를 만듭니다.
+    """
+    abs_path = os.path.normcase(os.path.abspath(csv_path))
+    st = os.stat(abs_path)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(st.st_size).encode())
+    with open(abs_path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if st.st_size > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, st.st_size - FINGERPRINT_BYTES))
+            digest.update(f.read(FINGERPRINT_BYTES))
+
+    return abs_path, st.st_size, st.st_mtime_ns, digest.hexdigest()
+
+
+def _encode_result(result: AnalysisResult) -> bytes:
+    """
+    AnalysisResult를 기본 타입만으로 구성된 튜플로 바꾸어 marshal + zlib으로 직렬화합니다.
+    logs와 섹션 변경 기록은 내부 배열을 그대로 bytes로 저장합니다.
+    """
+    logs = result.logs if isinstance(result.logs, LogTable) else LogTable(result.logs)
+    race_times = [(race_num, times.get("start"), times.get("end")) for race_num, times in result.race_times.items()]
+    section_changes = [
+        (race_num, (changes if isinstance(changes, SectionChangeList) else SectionChangeList(changes)).to_payload())
+        for race_num, changes in result.race_section_changes.items()
+    ]
+    row_index = result.row_index.to_payload() if result.row_index is not None else None
+    payload = (result.first_time, result.last_time, result.total_race_count, logs.to_payload(), race_times, section_changes, row_index)
+    return zlib.compress(marshal.dumps(payload), 1)
+
+
+def _decode_result(data: bytes) -> AnalysisResult:
+    """
+    _encode_result로 직렬화한 데이터를 AnalysisResult로 복원합니다.
+    """
+    first_time, last_time, total_race_count, logs, race_times, section_changes, row_index = marshal.loads(zlib.decompress(data))
+
+    result = AnalysisResult(first_time=first_time, last_time=last_time, total_race_count=total_race_count)
+    result.logs = LogTable.from_payload(logs)
+    result.race_times = {race_num: {"start": start, "end": end} for race_num, start, end in race_times}
+    result.race_section_changes = {
+        race_num: SectionChangeList.from_payload(changes)
+        for race_num, changes in section_changes
+    }
+    result.row_index = RowOffsetIndex.from_payload(row_index) if row_index is not None else None
+    return result
+
+
+class AnalysisCache:
+    """
+    로그 분석 결과(AnalysisResult)의 디스크 캐시.
+    파일 식별 키(경로, 크기, 수정 시간, 내용 지문)가 바뀌면 자동으로 무효화되며,
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다. (LRU)
+    """
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _entry_path(self, abs_path: str) -> str:
+        name = hashlib.blake2b(abs_path.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, name + CACHE_EXT)
+
+    def get(self, csv_path: str) -> Optional[AnalysisResult]:
+        """
+        캐시된 분석 결과를 반환합니다. 없거나 파일이 바뀌었으면 None.
+        """
+        entry = self.get_entry(csv_path)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, csv_path: str) -> Optional[Tuple[AnalysisResult, Optional[tuple]]]:
+        """
+        캐시된 (분석 결과, 이어서 분석할 상태)를 반환합니다. 없거나 파일이 바뀌었으면 None.
+        상태는 LogAnalyzer.restore로 분석기에 되돌릴 수 있습니다. (저장하지 않았으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            key = get_file_key(csv_path)
+            entry_path = self._entry_path(key[0])
+            if not os.path.isfile(entry_path):
+                return None
+
+            with open(entry_path, "rb") as f:
+                magic, version, key_len = struct.unpack("<4sBI", f.read(9))
+                if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                    stored_key = None
+                else:
+                    stored_key = marshal.loads(f.read(key_len))
+
+                if stored_key != key:
+                    f.close()
+                    os.remove(entry_path) # 원본 파일이 바뀌었거나 형식이 다름
+                    return None
+
+                resume_state = marshal.load(f)
+                result = _decode_result(f.read())
+
+            # LRU 갱신: 마지막 사용 시간 = 파일 수정 시간
+            os.utime(entry_path)
+            return result, resume_state
+
+        except Exception as e:
+            print(f"분석 캐시 읽기 실패: {e}")
+            return None
+
+    def put(self, csv_path: str, result: AnalysisResult, resume_state: Optional[tuple] = None) -> bool:
+        """
+        분석 결과를 캐시에 저장하고 용량 한도에 맞게 오래된 항목을 정리합니다.
+        resume_state(LogAnalyzer.resume_state)를 함께 저장하면 캐시에서 불러온 뒤에도 추가된 행만 이어서 분석할 수 있습니다.
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            key = get_file_key(csv_path)
+            encoded_key = marshal.dumps(key)
+            data = _encode_result(result)
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry_path = self._entry_path(key[0])
+            tmp_path = entry_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(struct.pack("<4sBI", CACHE_MAGIC, CACHE_VERSION, len(encoded_key)))
+                f.write(encoded_key)
+                f.write(marshal.dumps(resume_state))
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+
+            self._evict()
+            return True
+
+        except Exception as e:
+            print(f"분석 캐시 저장 실패: {e}")
+            return False
+
+    def _evict(self):
+        """
+        캐시 전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목을 삭제합니다.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(CACHE_EXT):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        캐시 항목을 모두 삭제합니다.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(CACHE_EXT):
+                os.remove(entry.path)
@@ -0,0 +1,330 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import contextlib
+import tempfile
+import platform
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import util
+import upload_pipeline
+import log_generator
+from csv_window import extract_window
+from dashboard_template import DashboardTemplate, DS_PLACEHOLDER, content_hash
+from fake_grafana import FakeGrafana
+from grafana_api import GrafanaAPI, to_korea_iso8601
+from log_analyzer import LogAnalyzer, AnalysisResult
+
+DEFAULT_TEMPLATE_PATH = os.path.join("data", "grafana_dashboard_post.json")
+
+# 기준 결과와 비교할 때 허용하는 성능 저하 비율 (0.2 = 20%)
+DEFAULT_MAX_REGRESSION = 0.2
+
+# 지표 이름 → 값이 클수록 좋은지 여부 (비교 방향)
+METRIC_HIGHER_IS_BETTER: Dict[str, bool] = {
+    "sec": False,
+    "rows_per_sec": True,
+    "mb_per_sec": True,
+    "ops_per_sec": True,
+    "us_per_op": False,
+    "requests": False,
+    "peak_rss_mb": False,
+}
+
+# 측정값이 너무 작아 비교하면 잡음만 커지는 경우 무시하는 최소 시간 (초)
+_MIN_COMPARE_SEC = 0.01
+
+MB = 1024 * 1024
+
+Metrics = Dict[str, float]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    peak = util.peak_rss_bytes()
+    return round(peak / MB, 1) if peak is not None else None
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> Tuple[float, Any]:
+    """
+    fn을 repeat번 실행하여 가장 짧은 시간과 그때의 반환값을 돌려줍니다.
+    """
+    best_sec, best_value = float("inf"), None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - started
+        if elapsed < best_sec:
+            best_sec, best_value = elapsed, value
+    return best_sec, best_value
+
+
+# --- 벤치마크 항목 ---
+
+def bench_analyze(csv_path: str, workers: int, repeat: int) -> Tuple[Metrics, AnalysisResult]:
+    """
+    LogAnalyzer.analyze 처리량 (workers가 2 이상이면 병렬 분석, 파일이 작으면 단일 프로세스로 동작)
+    """
+    def run():
+        analyzer = LogAnalyzer()
+        result = analyzer.analyze(csv_path, workers=workers)
+        return result, analyzer.last_summary
+
+    sec, (result, summary) = _best_of(repeat, run)
+    metrics = {
+        "sec": sec,
+        "rows_per_sec": summary.rows / sec if sec > 0 else 0.0,
+        "mb_per_sec": summary.bytes_read / MB / sec if sec > 0 else 0.0,
+        "parse_sec": summary.parse_sec,
+        "rows": summary.rows,
+        "races": result.total_race_count,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    return metrics, result
+
+
+def bench_window(csv_path: str, result: AnalysisResult, work_dir: str, repeat: int) -> Metrics:
+    """
+    csv 구간 추출 (가운데 레이스 하나, 분석 결과의 행 위치 인덱스 사용)
+    """
+    race = max(result.race_times) // 2 if result.race_times else 0
+    times = result.race_times.get(race) or {"start": result.first_time, "end": result.last_time}
+    dst_path = os.path.join(work_dir, "window.csv")
+
+    sec, (rows, written) = _best_of(repeat, lambda: extract_window(
+        csv_path, dst_path, times["start"], times["end"], row_index=result.row_index
+    ))
+    return {
+        "sec": sec,
+        "rows_per_sec": rows / sec if sec > 0 else 0.0,
+        "mb_per_sec": written / MB / sec if sec > 0 else 0.0,
+        "rows": rows,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def bench_render(template_path: str, result: AnalysisResult, iterations: int, repeat: int) -> Metrics:
+    """
+    post_dashboard의 로컬 처리: 템플릿 렌더링 + 내용 해시 + 요청 본문 직렬화
+    """
+    template = DashboardTemplate.load(template_path)
+    start_iso = to_korea_iso8601(result.first_time)
+    end_iso = to_korea_iso8601(result.last_time)
+
+    def run():
+        for i in range(iterations):
+            rendered = template.render(
+                {DS_PLACEHOLDER: f"bench-ds-{i}"}, title=f"bench-{i}", uid=f"bench-{i}",
+                start_iso=start_iso, end_iso=end_iso
+            )
+            db = rendered['dashboard'] if 'dashboard' in rendered else rendered
+            content_hash(db)
+            json.dumps({"dashboard": db, "folderId": 0, "overwrite": True})
+
+    sec, _ = _best_of(repeat, run)
+    return {
+        "sec": sec,
+        "ops_per_sec": iterations / sec if sec > 0 else 0.0,
+        "us_per_op": sec / iterations * 1e6 if iterations else 0.0,
+    }
+
+
+def bench_upload(csv_path: str, result: AnalysisResult, template_path: str, work_dir: str,
+                 latency_sec: float, upload_workers: int, downsample_points: int, repeat: int) -> Metrics:
+    """
+    가짜 Grafana 서버에 분석된 모든 레이스를 업로드 (레이스별 csv 준비 포함)
+    반복할 때마다 새 서버와 빈 csv 폴더에서 시작합니다. 요청 수는 마지막 실행 기준입니다.
+    """
+    template = DashboardTemplate.load(template_path)
+    jobs = upload_pipeline.race_jobs(result, "[BENCH]_bench")
+    counts: Dict[str, int] = {}
+
+    def run():
+        csv_dir = tempfile.mkdtemp(prefix="upload_", dir=work_dir)
+        options = upload_pipeline.UploadOptions(
+            json_path=template_path, csv_dir=csv_dir, downsample_points=downsample_points
+        )
+        # GrafanaAPI의 요청별 출력은 측정 결과 출력에 섞이지 않도록 버림
+        with FakeGrafana(latency_sec=latency_sec) as fake, open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull):
+            api = GrafanaAPI(api_key="bench", base_url=fake.url, pool_size=max(1, upload_workers))
+            job_results = upload_pipeline.upload_many(
+                api, template, result, csv_path, "BENCH", jobs, options,
+                max_workers=upload_workers, log=lambda message: None
+            )
+            counts.clear()
+            counts.update(fake.request_counts)
+        shutil.rmtree(csv_dir, ignore_errors=True)
+        return job_results
+
+    sec, job_results = _best_of(repeat, run)
+    failed = sum(1 for job_result in job_results if not job_result.success)
+    metrics = {
+        "sec": sec,
+        "ops_per_sec": len(jobs) / sec if sec > 0 else 0.0,
+        "dashboards": len(jobs),
+        "failed": failed,
+        "requests": sum(counts.values()),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    for route, count in sorted(counts.items()):
+        metrics[f"requests[{route}]"] = count
+    return metrics
+
+
+# --- 실행 / 기준 비교 ---
+
+def run_benchmarks(args: argparse.Namespace, log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    선택한 항목을 실행하고 {"environment": {...}, "results": {항목: 지표}}를 반환합니다.
+    """
+    work_dir = tempfile.mkdtemp(prefix="grafana_uploader_bench_")
+    try:
+        csv_path = args.log
+        if not csv_path:
+            csv_path = os.path.join(work_dir, "bench.csv")
+            log(f"로그 생성 중: {args.rows:,} 행, {args.columns} 열, 레이스 {args.races}개")
+            generated = log_generator.generate_log(
+                csv_path, rows=args.rows, columns=args.columns, races=args.races, seed=args.seed
+            )
+            log(f"  {generated.bytes / MB:,.1f} MB")
+
+        cases = set(args.cases)
+        results: Dict[str, Metrics] = {}
+
+        log("analyze (단일 프로세스)")
+        results["analyze"], result = bench_analyze(csv_path, workers=1, repeat=args.repeat)
+
+        if "analyze_parallel" in cases and args.workers > 1:
+            log(f"analyze (병렬 {args.workers}개)")
+            results["analyze_parallel"], _ = bench_analyze(csv_path, workers=args.workers, repeat=args.repeat)
+        if "window" in cases:
+            log("csv 구간 추출")
+            results["window"] = bench_window(csv_path, result, work_dir, args.repeat)
+        if "render" in cases:
+            log(f"대시보드 렌더링 ({args.render_iterations}회)")
+            results["render"] = bench_render(args.template, result, args.render_iterations, args.repeat)
+        if "upload" in cases:
+            log(f"전체 레이스 업로드 (가짜 Grafana, 지연 {args.latency_ms:g}ms, 동시 {args.upload_workers}개)")
+            results["upload"] = bench_upload(
+                csv_path, result, args.template, work_dir, args.latency_ms / 1000,
+                args.upload_workers, args.downsample, args.repeat
+            )
+
+        if "analyze" not in cases:
+            results.pop("analyze") # 다른 항목의 입력으로만 사용
+
+        return {
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "log": args.log or f"generated rows={args.rows} columns={args.columns} races={args.races} seed={args.seed}",
+            },
+            "results": results,
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare(results: Dict[str, Metrics], baseline: Dict[str, Metrics],
+            max_regression: float = DEFAULT_MAX_REGRESSION) -> Tuple[List[str], List[str]]:
+    """
+    METRIC_HIGHER_IS_BETTER에 있는 지표를 기준 결과와 비교합니다.
+    (비교 출력 줄 목록, 허용 비율보다 나빠진 지표 목록)을 반환합니다.
+    """
+    lines: List[str] = []
+    regressions: List[str] = []
+    for case, metrics in results.items():
+        base_metrics = baseline.get(case)
+        if not base_metrics:
+            lines.append(f"{case}: 기준 결과 없음")
+            continue
+        if base_metrics.get("sec", 0) < _MIN_COMPARE_SEC:
+            lines.append(f"{case}: 기준 측정 시간이 너무 짧아 비교하지 않음")
+            continue
+        for name, higher_is_better in METRIC_HIGHER_IS_BETTER.items():
+            current, base = metrics.get(name), base_metrics.get(name)
+            if current is None or not base:
+                continue
+            change = (current - base) / base
+            worse = -change if higher_is_better else change
+            mark = ""
+            if worse > max_regression:
+                mark = "  <-- 저하"
+                regressions.append(f"{case}.{name}")
+            lines.append(f"{case}.{name}: {base:,.2f} -> {current:,.2f} ({change:+.1%}){mark}")
+    return lines, regressions
+
+
+def format_results(results: Dict[str, Metrics]) -> str:
+    lines = []
+    for case, metrics in results.items():
+        values = ", ".join(
+            f"{name}={value:,.2f}" if isinstance(value, float) else f"{name}={value}"
+            for name, value in metrics.items()
+        )
+        lines.append(f"{case}: {values}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="로그 분석 → 업로드 파이프라인 벤치마크")
+    parser.add_argument("--log", help="사용할 로그 파일 (지정하지 않으면 생성)")
+    parser.add_argument("--rows", type=int, default=300_000, help="생성할 로그 행 수 (기본: 300000)")
+    parser.add_argument("--columns", type=int, default=60, help="생성할 로그 열 수 (기본: 60)")
+    parser.add_argument("--races", type=int, default=20, help="생성할 로그 레이스 수 (기본: 20)")
+    parser.add_argument("--seed", type=int, default=0, help="로그 생성 난수 시드")
+    parser.add_argument("--cases", nargs="+", default=["analyze", "analyze_parallel", "window", "render", "upload"],
+                        choices=["analyze", "analyze_parallel", "window", "render", "upload"], help="실행할 항목")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수, 가장 빠른 결과 사용 (기본: 3)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="병렬 분석 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE_PATH, help=f"대시보드 템플릿 (기본: {DEFAULT_TEMPLATE_PATH})")
+    parser.add_argument("--render-iterations", type=int, default=200, help="렌더링 반복 횟수 (기본: 200)")
+    parser.add_argument("--latency-ms", type=float, default=5, help="가짜 Grafana 응답 지연 (기본: 5ms)")
+    parser.add_argument("--upload-workers", type=int, default=upload_pipeline.DEFAULT_UPLOAD_WORKERS, help="동시 업로드 수")
+    parser.add_argument("--downsample", type=int, default=2000, help="업로드 csv 열별 최대 점 수, 0이면 원본 (기본: 2000)")
+    parser.add_argument("--output", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--save-baseline", help="결과를 기준 파일로 저장")
+    parser.add_argument("--baseline", help="비교할 기준 파일 (저하가 있으면 종료 코드 1)")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help=f"허용하는 성능 저하 비율 (기본: {DEFAULT_MAX_REGRESSION})")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    report = run_benchmarks(args)
+    print()
+    print(format_results(report["results"]))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"결과 저장: {path}")
+
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"오류: 기준 파일을 읽을 수 없습니다: {args.baseline} ({e})")
+            return 2
+
+        lines, regressions = compare(report["results"], baseline.get("results", {}), args.max_regression)
+        print(f"\n기준 비교 ({args.baseline}, 허용 저하 {args.max_regression:.0%}):")
+        for line in lines:
+            print(f"  {line}")
+        if regressions:
+            print(f"성능 저하: {', '.join(regressions)}")
+            return 1
+        print("성능 저하 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grafana_api import GrafanaAPI
+
+# 삭제 대상 종류
+DASHBOARD = "Dashboard"
+DATASOURCE = "Datasource"
+
+# 이 프로그램이 만드는 데이터 소스 타입
+CSV_DATASOURCE_TYPE = "marcusolsson-csv-datasource"
+
+# 동시에 보내는 삭제 요청 수 (GrafanaAPI 연결 풀 크기를 넘지 않게 제한)
+DEFAULT_DELETE_WORKERS = 8
+
+
+@dataclass
+class DeleteFilter:
+    """
+    일괄 삭제 대상 필터. 지정한 조건을 모두 만족하는 항목만 삭제합니다. (모두 비어 있으면 전체 삭제)
+    - title_prefix : 대시보드 제목 / 데이터 소스 이름 접두사
+    - gr_id        : GR ID (대시보드 제목 '[GR]_', 데이터 소스 이름 'GR_'로 시작)
+    - ds_type      : 데이터 소스 타입 (예: marcusolsson-csv-datasource, 대시보드에는 적용 안 함)
+    - created_before: 이 시간 이전에 생성된 항목만 (대시보드: meta.created, 데이터 소스: jsonData.createdAt)
+    """
+    title_prefix: Optional[str] = None
+    gr_id: Optional[str] = None
+    ds_type: Optional[str] = None
+    created_before: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        return not (self.title_prefix or self.gr_id or self.ds_type or self.created_before)
+
+    def match_name(self, item_type: str, name: str) -> bool:
+        name = name or ""
+        if self.title_prefix and not name.startswith(self.title_prefix):
+            return False
+        if self.gr_id:
+            gr_prefix = f"[{self.gr_id.upper()}]_" if item_type == DASHBOARD else f"{self.gr_id.upper()}_"
+            if not name.startswith(gr_prefix):
+                return False
+        return True
+
+    def match_created(self, created: Optional[datetime]) -> bool:
+        """
+        생성 시간이 기준 이전인지 확인합니다.
+        생성 시간을 알 수 없는 항목(이 프로그램이 만들지 않았거나 생성 시간 기록 이전에 만든 데이터 소스)은
+        관련 없는 항목을 지우지 않도록 삭제 대상에서 제외합니다.
+        """
+        if self.created_before is None:
+            return True
+        if created is None:
+            return False
+        return created < _as_aware(self.created_before)
+
+    def describe(self) -> str:
+        conditions = []
+        if self.title_prefix:
+            conditions.append(f"접두사='{self.title_prefix}'")
+        if self.gr_id:
+            conditions.append(f"GR='{self.gr_id.upper()}'")
+        if self.ds_type:
+            conditions.append(f"타입='{self.ds_type}'")
+        if self.created_before:
+            conditions.append(f"생성 시간<{self.created_before.isoformat(sep=' ', timespec='seconds')}")
+        return ", ".join(conditions) if conditions else "전체"
+
+
+@dataclass
+class DeleteResult:
+    """
+    항목 하나의 삭제 결과
+    """
+    item_type: str
+    key: str        # 대시보드 UID 또는 데이터 소스 ID
+    name: str       # 대시보드 제목 또는 데이터 소스 이름
+    success: bool
+    skipped: bool = False # 필터 조건에 맞지 않아 삭제하지 않음
+    message: str = ""
+
+    def log_line(self) -> str:
+        if self.item_type == DASHBOARD:
+            log_msg = f"  -> 대시보드 삭제 중: Title='{self.name}', UID='{self.key}'"
+        else:
+            log_msg = f"  -> 데이터 소스 삭제 중: Name='{self.name}', ID='{self.key}'"
+        if self.skipped:
+            return f"{log_msg} Skipped ({self.message})"
+        if self.success:
+            return f"{log_msg} Success"
+        return f"{log_msg} Failed ({self.message})"
+
+
+def _as_aware(dt: datetime) -> datetime:
+    # 시간대가 없으면 로컬 시간으로 간주
+    return dt if dt.tzinfo is not None else dt.astimezone()
+
+
+def parse_grafana_time(value: Optional[str]) -> Optional[datetime]:
+    """
+    Grafana가 돌려주는 ISO 8601 시간 문자열을 datetime으로 바꿉니다. (알 수 없으면 None)
+    """
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.year <= 1:
+        return None # Grafana의 0001-01-01 (기록 없음)
+    return _as_aware(dt)
+
+
+def parse_created_before(text: str) -> datetime:
+    """
+    'YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM:SS' 형식의 기준 시간을 읽습니다. (로컬 시간, 형식 오류 시 ValueError)
+    """
+    return _as_aware(datetime.fromisoformat(text.strip()))
+
+
+def _datasource_created(ds: Dict[str, Any]) -> Optional[datetime]:
+    return parse_grafana_time((ds.get('jsonData') or {}).get('createdAt'))
+
+
+def _iter_dashboards(api: "GrafanaAPI") -> Iterator[Dict[str, Any]]:
+    """
+    페이지 단위 검색으로 대시보드를 한 번씩 돌려줍니다.
+    삭제하면서 페이지를 넘기면 뒤 항목이 앞 페이지로 당겨져 빠질 수 있으므로,
+    새 항목이 나오지 않을 때까지 처음부터 다시 검색합니다. (이미 돌려준 UID만 기억)
+    """
+    seen = set()
+    while True:
+        new_count = 0
+        for db in api.iter_search():
+            uid = db.get('uid')
+            if uid in seen:
+                continue
+            seen.add(uid)
+            new_count += 1
+            yield db
+        if new_count == 0:
+            return
+
+
+def list_candidates(api: "GrafanaAPI", item_type: str, item_filter: DeleteFilter) -> Iterator[Dict[str, Any]]:
+    """
+    목록 조회 결과에서 이름/타입(데이터 소스는 생성 시간 포함) 조건에 맞는 항목을 돌려줍니다.
+    대시보드 생성 시간은 목록에 없으므로 삭제 작업에서 확인합니다.
+    """
+    if item_type == DASHBOARD:
+        for db in _iter_dashboards(api):
+            if item_filter.match_name(DASHBOARD, db.get('title')):
+                yield db
+    else:
+        for ds in api.get_all_datasources():
+            if item_filter.ds_type and ds.get('type') != item_filter.ds_type:
+                continue
+            if not item_filter.match_name(DATASOURCE, ds.get('name')):
+                continue
+            if not item_filter.match_created(_datasource_created(ds)):
+                continue
+            yield ds
+
+
+def _delete_one(api: "GrafanaAPI", item_type: str, item: Dict[str, Any], item_filter: DeleteFilter) -> DeleteResult:
+    if item_type == DASHBOARD:
+        uid = item.get('uid')
+        title = item.get('title')
+        if not uid:
+            return DeleteResult(DASHBOARD, "", title, success=False, message=f"경고: Title '{title}'의 UID가 없어 건너뜁니다.")
+
+        if item_filter.created_before is not None:
+            details = api.get_dashboard_by_uid(uid)
+            if details is None:
+                return DeleteResult(DASHBOARD, uid, title, success=False, message="대시보드 정보 조회 실패")
+            created = parse_grafana_time(details.get('meta', {}).get('created'))
+            if not item_filter.match_created(created):
+                return DeleteResult(DASHBOARD, uid, title, success=True, skipped=True, message=f"생성 시간 {details['meta'].get('created')}")
+
+        if api.delete_dashboard(uid):
+            return DeleteResult(DASHBOARD, uid, title, success=True)
+        return DeleteResult(DASHBOARD, uid, title, success=False, message="delete_dashboard 함수 실패")
+
+    ds_id = item.get('id')
+    ds_name = item.get('name')
+    if not ds_id:
+        return DeleteResult(DATASOURCE, "", ds_name, success=False, message=f"경고: Name '{ds_name}'의 ID가 없어 건너뜁니다.")
+    success, message = api.delete_datasource(ds_id)
+    return DeleteResult(DATASOURCE, str(ds_id), ds_name, success=success, message=message)
+
+
+def iter_bulk_delete(api: "GrafanaAPI", item_type: str, item_filter: Optional[DeleteFilter] = None,
+                     max_workers: int = DEFAULT_DELETE_WORKERS, items: Optional[Iterable[Dict[str, Any]]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> Iterator[DeleteResult]:
+    """
+    조건에 맞는 대시보드/데이터 소스를 최대 max_workers개씩 동시에 삭제하고 끝나는 순서대로 결과를 돌려줍니다.
+    동시에 진행 중인 항목 수를 제한하므로 목록이 커도 메모리 사용량이 일정합니다.
+    cancel_event가 설정되면 새 삭제 요청을 보내지 않고 진행 중인 요청만 마칩니다.
+    """
+    item_filter = item_filter or DeleteFilter()
+    if items is None:
+        items = list_candidates(api, item_type, item_filter)
+
+    max_workers = max(1, min(max_workers, api.pool_size))
+    item_iter = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_workers * 2:
+                if cancel_event is not None and cancel_event.is_set():
+                    exhausted = True
+                    break
+                item = next(item_iter, None)
+                if item is None:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(_delete_one, api, item_type, item, item_filter))
+
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def delete_items(api: "GrafanaAPI", item_type: str, item_filter: Optional[DeleteFilter] = None,
+                 max_workers: int = DEFAULT_DELETE_WORKERS,
+                 on_message: Optional[Callable[[str], None]] = None,
+                 cancel_event: Optional[threading.Event] = None) -> Tuple[bool, List[str]]:
+    """
+    iter_bulk_delete를 끝까지 실행하고 (전체 성공 여부, 작업 로그 메시지 리스트)를 반환합니다.
+    on_message가 있으면 메시지가 생길 때마다 바로 전달합니다. (항목별 진행 상황 표시용)
+    cancel_event가 설정되면 진행 중인 요청만 마치고 실패로 반환합니다.
+    """
+    item_filter = item_filter or DeleteFilter()
+    max_workers = max(1, min(max_workers, api.pool_size))
+    kind = "대시보드" if item_type == DASHBOARD else "데이터 소스"
+    messages: List[str] = []
+
+    def add_message(message: str):
+        messages.append(message)
+        if on_message is not None:
+            on_message(message)
+
+    add_message(f"{kind} 삭제 시작 (조건: {item_filter.describe()}, 동시 요청: {max_workers}개)")
+
+    success_count = 0
+    fail_count = 0
+    skip_count = 0
+    for result in iter_bulk_delete(api, item_type, item_filter, max_workers, cancel_event=cancel_event):
+        add_message(result.log_line())
+        if result.skipped:
+            skip_count += 1
+        elif result.success:
+            success_count += 1
+        else:
+            fail_count += 1
+
+    cancelled = cancel_event is not None and cancel_event.is_set()
+    if cancelled:
+        add_message(f"{kind} 삭제가 취소되었습니다.")
+        add_message(f"\n{kind} 삭제 중단. 성공: {success_count}개, 실패: {fail_count}개, 제외: {skip_count}개.")
+        return False, messages
+
+    if success_count + fail_count + skip_count == 0:
+        add_message(f"삭제할 {kind}가 없습니다. (작업 성공)")
+        return True, messages
+
+    add_message(f"\n{kind} 삭제 완료. 성공: {success_count}개, 실패: {fail_count}개, 제외: {skip_count}개.")
+    return fail_count == 0, messages
@@ -0,0 +1,282 @@
+import os
+import sys
+import glob
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import util
+import bulk_delete
+import upload_pipeline
+from config_manager import ConfigManager
+from log_analyzer import AnalysisResult, AnalysisProgress, LogAnalyzer
+
+# 기본 대시보드 제목 템플릿 ({stem}: 로그 파일 이름, {race}: R03 / ALL, {date}: 로그 시작 날짜)
+DEFAULT_TITLE_TEMPLATE = "{stem}"
+
+# --progress 출력 간격 (초)
+CLI_PROGRESS_INTERVAL_SEC = 2.0
+
+_print_lock = threading.Lock()
+
+
+def _log(prefix: str, message: str):
+    """
+    여러 파일을 동시에 처리하므로 줄 단위로 파일 이름을 붙여 출력합니다.
+    """
+    with _print_lock:
+        for line in message.split('\n'):
+            if line.strip():
+                print(f"[{prefix}] {line}")
+
+
+def expand_inputs(patterns: List[str]) -> List[str]:
+    """
+    파일 경로 또는 glob 패턴 목록을 실제 로그 파일 목록으로 바꿉니다. (중복 제거, 입력 순서 유지)
+    """
+    paths: List[str] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(p for p in glob.glob(pattern, recursive=True) if util.is_log_file_path(p))
+        else:
+            matches = [pattern]
+        for path in matches:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def parse_race_spec(spec: str, result: AnalysisResult) -> List[Optional[int]]:
+    """
+    레이스 지정 문자열을 레이스 번호 목록으로 바꿉니다.
+    - all  : 전체 로그 범위 하나 ([None])
+    - each : 분석된 모든 레이스
+    - 1,3-5: 지정한 레이스 번호 (분석 결과에 없는 번호는 ValueError)
+    """
+    spec = spec.strip().lower()
+    if spec == "all":
+        return [None]
+
+    races = sorted(
+        race_num for race_num, times in result.race_times.items()
+        if times.get("start") and times.get("end")
+    )
+    if spec == "each":
+        return races
+
+    selected: List[Optional[int]] = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = (int(v) for v in part.split('-', 1))
+            numbers = range(first, last + 1)
+        else:
+            numbers = [int(part)]
+        for race_num in numbers:
+            if race_num not in races:
+                raise ValueError(f"{race_num}번 레이스 정보가 없습니다.")
+            if race_num not in selected:
+                selected.append(race_num)
+    return selected
+
+
+def format_title(template: str, stem: str, race: Optional[int], first_time: str) -> str:
+    """
+    제목 템플릿을 채웁니다. 레이스를 지정했는데 템플릿에 {race}가 없으면 제목이 겹치지 않도록 _R03 형태로 붙입니다.
+    """
+    race_str = upload_pipeline.race_label(race)
+    title = template.format(stem=stem, race=race_str, date=(first_time or "")[:10])
+    if race is not None and "{race}" not in template:
+        title = f"{title}_{race_str}"
+    return title
+
+
+def _file_stem(path: str) -> str:
+    """
+    로그 파일 이름에서 확장자(.csv, .csv.gz 등)를 뗀 이름을 반환합니다.
+    """
+    name = os.path.basename(path)
+    for ext in sorted(util.LOG_FILE_EXTENSIONS, key=len, reverse=True):
+        if name.lower().endswith(ext):
+            return name[:-len(ext)]
+    return os.path.splitext(name)[0]
+
+
+def process_file(csv_path: str, args: argparse.Namespace, config: ConfigManager, api,
+                 options: upload_pipeline.UploadOptions, template, workers: int, upload_workers: int) -> Tuple[int, int]:
+    """
+    로그 파일 하나를 분석하고 지정한 레이스마다 대시보드를 업로드합니다. (성공 개수, 실패 개수)를 반환합니다.
+    """
+    stem = _file_stem(csv_path)
+    log = lambda message: _log(stem, message)
+
+    def log_progress(progress: AnalysisProgress):
+        if progress.done:
+            return # 마지막 결과는 요약으로 출력
+        total = f" / {progress.total_bytes / (1024 * 1024):,.1f}" if progress.total_bytes else ""
+        log(f"분석 중: {progress.bytes_done / (1024 * 1024):,.1f}{total} MB, {progress.rows:,} 행 "
+            f"({progress.rows_per_sec:,.0f} 행/s), 섹션 변경 {progress.section_changes:,}개, 레이스 {progress.races}개")
+
+    try:
+        result = upload_pipeline.analyze_log(
+            csv_path,
+            analyzer=LogAnalyzer(progress_interval_sec=CLI_PROGRESS_INTERVAL_SEC),
+            cache=upload_pipeline.create_analysis_cache(config),
+            workers=workers,
+            progress=log_progress if args.progress else None,
+            on_summary=lambda summary: log(summary.format())
+        )
+        races = parse_race_spec(args.races, result)
+    except Exception as e:
+        log(f"로그 분석 오류: {e}")
+        return 0, 1
+
+    log(f"전체 시간대: {result.first_time} - {result.last_time}, 총 레이스 횟수: {result.total_race_count}")
+    if not races:
+        log("업로드할 레이스가 없습니다.")
+        return 0, 0
+
+    jobs = []
+    for race in races:
+        if race is None:
+            start_time, end_time = result.first_time, result.last_time
+        else:
+            start_time, end_time = result.race_times[race]["start"], result.race_times[race]["end"]
+        title = upload_pipeline.make_title(args.gr, format_title(args.title, stem, race, result.first_time))
+        jobs.append(upload_pipeline.UploadJob(title, start_time, end_time, race))
+
+    # 레이스별 대시보드를 동시에 업로드 (데이터 소스 목록은 한 번만 조회)
+    job_results = upload_pipeline.upload_many(
+        api, template, result, csv_path, args.gr.upper(), jobs, options,
+        max_workers=upload_workers, log=log
+    )
+    success_count = sum(1 for job_result in job_results if job_result.success)
+    return success_count, len(job_results) - success_count
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="Grafana_Uploader",
+        description="로그 분석 후 Grafana 대시보드를 UI 없이 업로드합니다."
+    )
+    parser.add_argument("inputs", nargs="*", help="로그 파일 경로 또는 glob 패턴 (예: logs/*.csv.gz)")
+    parser.add_argument("--gr", help="GR(차량) ID, 제목 앞에 [GR] 형태로 붙음 (--delete에서는 삭제 조건)")
+    parser.add_argument("--title", default=DEFAULT_TITLE_TEMPLATE,
+                        help="대시보드 제목 템플릿 ({stem}, {race}, {date} 사용 가능, 기본: {stem})")
+    parser.add_argument("--races", default="all",
+                        help="all(전체 로그 범위), each(레이스마다 업로드) 또는 레이스 번호 (예: 1,3-5)")
+    parser.add_argument("--jobs", type=int, default=2, help="동시에 처리할 파일 수 (기본: 2)")
+    parser.add_argument("--config", default="config.ini", help="설정 파일 경로 (기본: config.ini)")
+    parser.add_argument("--progress", action="store_true",
+                        help=f"로그 분석 진행 상황을 {CLI_PROGRESS_INTERVAL_SEC:g}초마다 출력")
+
+    delete_group = parser.add_argument_group("일괄 삭제 (--delete)")
+    delete_group.add_argument("--delete", action="store_true", help="업로드 대신 조건에 맞는 대시보드/데이터 소스를 삭제")
+    delete_group.add_argument("--delete-target", choices=("all", "dashboards", "datasources"), default="all",
+                              help="삭제 대상 (기본: all)")
+    delete_group.add_argument("--title-prefix", help="대시보드 제목 / 데이터 소스 이름 접두사")
+    delete_group.add_argument("--ds-type", help=f"데이터 소스 타입 (예: {bulk_delete.CSV_DATASOURCE_TYPE})")
+    delete_group.add_argument("--created-before", help="이 날짜 이전에 생성된 항목만 (YYYY-MM-DD 또는 'YYYY-MM-DD HH:MM:SS')")
+    return parser
+
+
+def run_delete(args: argparse.Namespace, config: ConfigManager, api) -> int:
+    """
+    조건에 맞는 대시보드/데이터 소스를 동시에 삭제합니다. 조건이 하나도 없으면 실행하지 않습니다.
+    """
+    try:
+        created_before = bulk_delete.parse_created_before(args.created_before) if args.created_before else None
+    except ValueError:
+        print(f"오류: --created-before 형식이 올바르지 않습니다: {args.created_before}")
+        return 2
+
+    item_filter = bulk_delete.DeleteFilter(
+        title_prefix=args.title_prefix,
+        gr_id=args.gr,
+        ds_type=args.ds_type,
+        created_before=created_before
+    )
+    if item_filter.is_empty():
+        print("오류: 삭제 조건(--gr, --title-prefix, --ds-type, --created-before)을 하나 이상 지정해야 합니다. (전체 삭제는 UI의 All Delete 사용)")
+        return 2
+
+    delete_workers = upload_pipeline.get_delete_workers(config)
+    overall_success = True
+    if args.delete_target in ("all", "dashboards"):
+        is_success, _ = api.delete_all_dashboards(item_filter, delete_workers, on_message=print)
+        overall_success = overall_success and is_success
+    if args.delete_target in ("all", "datasources"):
+        is_success, _ = api.delete_all_datasources(item_filter, delete_workers, on_message=print)
+        overall_success = overall_success and is_success
+
+    print(upload_pipeline.format_connection_stats(api))
+    return 0 if overall_success else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.delete and (not args.inputs or not args.gr):
+        parser.error("업로드에는 로그 파일과 --gr이 필요합니다.")
+
+    try:
+        config = ConfigManager(args.config)
+    except FileNotFoundError as e:
+        print(e)
+        return 2
+
+    api, api_msg = upload_pipeline.create_api(config)
+    if api is None:
+        print(api_msg)
+        return 2
+
+    is_connected, message = api.check_connection()
+    print(message)
+    if not is_connected:
+        return 2
+
+    if args.delete:
+        return run_delete(args, config, api)
+
+    options = upload_pipeline.UploadOptions.from_config(config)
+    try:
+        template = upload_pipeline.load_dashboard_template(options.json_path)
+    except Exception as e:
+        print(f"오류: 대시보드 JSON 파일을 읽을 수 없습니다: {options.json_path} ({e})")
+        return 2
+
+    csv_paths = expand_inputs(args.inputs)
+    if not csv_paths:
+        print("처리할 로그 파일이 없습니다.")
+        return 2
+
+    # 파일 단위 동시 처리, 분석 프로세스 수는 동시 처리 파일 수로 나눔
+    jobs = max(1, min(args.jobs, len(csv_paths)))
+    workers = max(1, upload_pipeline.get_analyze_workers(config) // jobs)
+    upload_workers = max(1, upload_pipeline.get_upload_workers(config) // jobs)
+
+    # 이름이 같은 파일(a.csv, a.csv.gz 등)은 같은 제목/csv 경로를 쓰므로 한 작업에서 순서대로 처리
+    groups = {}
+    for csv_path in csv_paths:
+        groups.setdefault(_file_stem(csv_path), []).append(csv_path)
+
+    def process_group(paths: List[str]) -> List[Tuple[int, int]]:
+        return [process_file(path, args, config, api, options, template, workers, upload_workers) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(process_group, paths) for paths in groups.values()]
+        results = [result for future in futures for result in future.result()]
+
+    success_count = sum(success for success, _ in results)
+    fail_count = sum(fail for _, fail in results)
+    print(f"\n업로드 완료. 파일: {len(csv_paths)}개, 성공: {success_count}개, 실패: {fail_count}개.")
+    print(upload_pipeline.format_connection_stats(api))
+    api.close()
+    return 0 if fail_count == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,282 @@
+import os
+import json
+import stat
+import time
+import hashlib
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import util
+
+try:
+    import fcntl # reflink (Linux FICLONE), Windows에는 없음
+except ImportError:
+    fcntl = None
+
+# 저장소 파일 배치 방식
+LINK_AUTO = "auto"         # reflink 시도 후 실패하면 복사
+LINK_HARDLINK = "hardlink" # 기록이 끝난 원본이면 하드 링크, 아니면 복사 (원본을 수정하면 저장소 파일도 바뀌므로 선택 사항)
+LINK_COPY = "copy"         # 항상 복사
+LINK_MODES = (LINK_AUTO, LINK_HARDLINK, LINK_COPY)
+
+# 저장소 하위 폴더 / 인덱스 파일 이름
+STORE_DIR_NAME = "store"
+INDEX_FILE_NAME = "index.json"
+
+# 하드 링크는 이 시간(초) 이상 수정되지 않았거나 읽기 전용인 원본만 사용 (기록 중인 로그는 복사)
+HARDLINK_MIN_AGE_SEC = 300
+
+# Linux FICLONE ioctl 번호 (btrfs, xfs 등 reflink 지원 파일 시스템)
+_FICLONE = 0x40049409
+
+
+def new_hasher():
+    """
+    저장소 파일 이름에 쓰는 내용 해시 객체
+    """
+    return hashlib.blake2b(digest_size=16)
+
+
+def _reflink(src_path: str, dst_path: str) -> bool:
+    """
+    reflink(블록 공유 복사)를 시도합니다. 지원하지 않으면 False.
+    """
+    if fcntl is None:
+        return False
+    try:
+        with open(src_path, 'rb') as fin, open(dst_path, 'wb') as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+        return True
+    except OSError:
+        try:
+            os.remove(dst_path)
+        except OSError:
+            pass
+        return False
+
+
+def _is_settled(src_path: str) -> bool:
+    """
+    원본이 더 바뀌지 않을 파일인지 확인합니다. (읽기 전용이거나 HARDLINK_MIN_AGE_SEC 이상 수정되지 않음)
+    하드 링크한 저장소 파일은 원본과 같은 파일이므로 기록 중인 로그를 링크하면 해시와 내용이 달라집니다.
+    """
+    st = os.stat(src_path)
+    if not st.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH):
+        return True
+    return time.time() - st.st_mtime >= HARDLINK_MIN_AGE_SEC
+
+
+def _file_state(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _hash_file(path: str) -> str:
+    hasher = new_hasher()
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(util.COPY_BUFFER_BYTES)
+            if not block:
+                break
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _copy_with_hash(src_path: str, dst_path: str) -> str:
+    """
+    src를 dst로 복사하면서 내용 해시를 계산합니다. (압축 파일은 압축을 풀면서 복사)
+    """
+    hasher = new_hasher()
+    with util.open_log_file(src_path) as fin, open(dst_path, 'wb') as fout:
+        while True:
+            block = fin.read(util.COPY_BUFFER_BYTES)
+            if not block:
+                break
+            hasher.update(block)
+            fout.write(block)
+    return hasher.hexdigest()
+
+
+class CsvStore:
+    """
+    업로드용 csv를 내용 해시 이름(store/<hash>.csv)으로 저장하는 저장소.
+    내용이 같은 csv는 같은 경로가 되므로 데이터 소스(UID는 경로로 정해짐)도 하나만 생깁니다.
+    (원본 경로, 크기, 수정 시간, 구간/다운샘플 설정) → 해시 인덱스를 저장해 두어
+    같은 로그를 다시 업로드하면 파일을 읽지 않고 기존 파일을 사용합니다.
+    하드 링크한 파일은 링크할 때의 (크기, 수정 시간)을 기록해 두고, 원본이 바뀌었으면 사용하지 않습니다.
+    """
+    def __init__(self, root_dir: str, link_mode: str = LINK_AUTO):
+        self.root_dir = root_dir
+        self.store_dir = os.path.join(root_dir, STORE_DIR_NAME)
+        self.index_path = os.path.join(self.store_dir, INDEX_FILE_NAME)
+        self.link_mode = link_mode if link_mode in LINK_MODES else LINK_AUTO
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # --- 인덱스 ---
+
+    @staticmethod
+    def source_key(src_path: str, **params: Any) -> str:
+        """
+        원본 파일 상태(절대 경로, 크기, 수정 시간)와 생성 설정으로 인덱스 키를 만듭니다.
+        원본이 바뀌면(로그 추가 등) 키가 달라지므로 다시 만듭니다.
+        """
+        st = os.stat(src_path)
+        key = {"path": os.path.abspath(src_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        key.update(params)
+        return hashlib.blake2b(json.dumps(key, sort_keys=True).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        {"sources": 원본 키 → 해시, "links": 하드 링크한 해시 → [크기, 수정 시간(ns)]}
+        """
+        if self._index is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+            except (FileNotFoundError, ValueError):
+                index = {}
+            if not isinstance(index, dict):
+                index = {}
+            self._index = {"sources": index.get("sources") or {}, "links": index.get("links") or {}}
+        return self._index
+
+    def _save_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def object_path(self, content_hash: str) -> str:
+        return os.path.join(self.store_dir, f"{content_hash}.csv")
+
+    def _has_object(self, content_hash: str) -> bool:
+        """
+        저장소 파일이 있고 내용이 해시와 같으면 True.
+        하드 링크한 파일이 링크 이후 바뀌었으면(원본 로그에 기록 등) 링크를 지우고 False를 반환합니다.
+        """
+        path = self.object_path(content_hash)
+        with self._lock:
+            links = self._load_index()["links"]
+            linked_state = links.get(content_hash)
+            try:
+                state = _file_state(path)
+            except FileNotFoundError:
+                state = None
+            if linked_state is None or state == linked_state:
+                return state is not None
+
+            if state is not None:
+                os.remove(path) # 원본 파일은 그대로 (링크만 제거)
+            del links[content_hash]
+            self._save_index()
+            return False
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        인덱스에 있고 파일도 (내용이 바뀌지 않고) 남아 있으면 저장소 경로, 아니면 None
+        """
+        with self._lock:
+            content_hash = self._load_index()["sources"].get(key)
+        if content_hash is None or not self._has_object(content_hash):
+            return None
+        return self.object_path(content_hash)
+
+    def _remember(self, key: Optional[str], content_hash: str, linked_state: Optional[List[int]] = None):
+        with self._lock:
+            index = self._load_index()
+            changed = False
+            if key is not None and index["sources"].get(key) != content_hash:
+                index["sources"][key] = content_hash
+                changed = True
+            if linked_state is not None:
+                index["links"][content_hash] = linked_state
+                changed = True
+            if changed:
+                self._save_index()
+
+    # --- 파일 추가 ---
+
+    def temp_path(self) -> str:
+        """
+        저장소와 같은 폴더의 임시 파일 경로 (add_temp_file로 옮길 때 이름 변경만 일어나도록)
+        """
+        os.makedirs(self.store_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(suffix=".csv.tmp", dir=self.store_dir)
+        os.close(fd)
+        return path
+
+    def add_temp_file(self, tmp_path: str, content_hash: str, key: Optional[str] = None) -> str:
+        """
+        내용 해시를 계산해 둔 임시 파일을 저장소로 옮깁니다. 같은 내용이 이미 있으면 임시 파일을 지웁니다.
+        """
+        dst_path = self.object_path(content_hash)
+        if self._has_object(content_hash):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, dst_path)
+        self._remember(key, content_hash)
+        return dst_path
+
+    def add_source(self, src_path: str, key: Optional[str] = None) -> Tuple[str, str]:
+        """
+        원본 로그 전체를 저장소에 넣고 (저장소 경로, 배치 방식)을 반환합니다.
+        - 압축 파일: 압축을 풀면서 복사 (해시는 복사하면서 계산)
+        - hardlink: 기록이 끝난 원본(_is_settled)이면 해시만 계산한 뒤 하드 링크, 아니면 복사
+        - auto: reflink 후 해시 계산, 지원하지 않으면 복사하면서 해시 계산
+        """
+        if not util.is_compressed_path(src_path) and self.link_mode == LINK_HARDLINK and _is_settled(src_path):
+            src_state = _file_state(src_path)
+            content_hash = _hash_file(src_path)
+            dst_path = self.object_path(content_hash)
+            if self._has_object(content_hash):
+                self._remember(key, content_hash)
+                return dst_path, "existing"
+            os.makedirs(self.store_dir, exist_ok=True)
+            try:
+                os.link(src_path, dst_path)
+            except OSError:
+                pass # 다른 드라이브 등: 복사
+            else:
+                # 해시를 계산하는 동안 원본이 바뀌었으면 링크를 버리고 복사
+                if _file_state(dst_path) == src_state:
+                    self._remember(key, content_hash, linked_state=src_state)
+                    return dst_path, LINK_HARDLINK
+                os.remove(dst_path)
+
+        tmp_path = self.temp_path()
+        try:
+            if not util.is_compressed_path(src_path) and self.link_mode == LINK_AUTO and _reflink(src_path, tmp_path):
+                method = "reflink"
+                content_hash = _hash_file(tmp_path)
+            else:
+                method = LINK_COPY
+                content_hash = _copy_with_hash(src_path, tmp_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        existed = self._has_object(content_hash)
+        dst_path = self.add_temp_file(tmp_path, content_hash, key)
+        return dst_path, "existing" if existed else method
+
+
+_stores: Dict[str, CsvStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(root_dir: str, link_mode: str = LINK_AUTO) -> CsvStore:
+    """
+    폴더별 저장소 객체 (같은 폴더는 인덱스를 공유하도록 하나만 생성)
+    """
+    root_dir = os.path.abspath(root_dir)
+    with _stores_lock:
+        store = _stores.get(root_dir)
+        if store is None:
+            store = CsvStore(root_dir, link_mode)
+            _stores[root_dir] = store
+        else:
+            store.link_mode = link_mode if link_mode in LINK_MODES else LINK_AUTO
+        return store
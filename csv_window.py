@@ -0,0 +1,110 @@
+import csv
+from typing import Optional, Tuple
+
+import util
+from log_analyzer import RowOffsetIndex, ColumnProjection, TimeIndex
+
+# 구간 추출 시 복사 버퍼 크기
+COPY_BUFFER_BYTES = 1024 * 1024
+
+
+def _find_time_column(header_line: bytes) -> int:
+    """
+    헤더 줄에서 time 열의 인덱스를 찾습니다.
+    """
+    header = next(csv.reader((header_line.decode("utf-8"),)))
+    return ColumnProjection.from_header(header).time_index
+
+
+def _move_to_line_start(f, position: int, offset: int) -> bool:
+    """
+    데이터 시작 위치(position)에서 offset까지 이동합니다. offset이 줄의 시작 위치가 아니면 False.
+    """
+    if offset <= position:
+        return True
+    util.skip_forward(f, position, offset - 1)
+    return f.read(1) == b"\n"
+
+
+def extract_window(src_path: str, dst_path: str, start_time: str, end_time: str,
+                   row_index: Optional[RowOffsetIndex] = None, padding_ms: int = 0, hasher=None) -> Tuple[int, int]:
+    """
+    원본 CSV에서 [start_time - padding, end_time + padding] 구간의 행만 헤더와 함께 dst_path에 저장합니다.
+    압축된 원본(.csv.gz 등)은 압축을 풀면서 필요한 구간만 저장합니다.
+    row_index가 있으면 구간 시작 근처의 바이트 위치로 바로 이동(seek)하고,
+    시간이 단조 증가하는 로그면 구간을 지나는 즉시 읽기를 멈춥니다.
+    hasher(hashlib 객체)를 넘기면 저장하는 내용으로 해시를 갱신합니다.
+    (저장한 행 수, 저장한 바이트 수)를 반환합니다.
+    """
+    start_ms = TimeIndex.to_ms(start_time)
+    end_ms = TimeIndex.to_ms(end_time)
+    if start_ms is None or end_ms is None:
+        raise ValueError(f"구간 시간 형식이 올바르지 않습니다: {start_time} ~ {end_time}")
+    start_ms -= padding_ms
+    end_ms += padding_ms
+
+    rows_written = 0
+    bytes_written = 0
+
+    fin = util.open_log_file(src_path)
+    try:
+        header_line = fin.readline()
+        time_column = _find_time_column(header_line)
+        data_start = len(header_line)
+
+        sorted_times = True
+        if row_index is not None:
+            sorted_times = row_index.monotonic
+            offset = max(row_index.seek_offset(start_ms), data_start)
+            if not _move_to_line_start(fin, data_start, offset):
+                # 인덱스가 다른 파일 기준이면 처음부터 읽기 (압축 스트림은 되감기 대신 다시 열기)
+                fin.close()
+                fin = util.open_log_file(src_path)
+                fin.readline()
+
+        fout = open(dst_path, "wb")
+    except Exception:
+        fin.close()
+        raise
+
+    def write(data: bytes):
+        fout.write(data)
+        if hasher is not None:
+            hasher.update(data)
+
+    with fin, fout:
+        write(header_line)
+        bytes_written += len(header_line)
+
+        buffer = []
+        buffered = 0
+        for raw in fin:
+            if b'"' in raw:
+                time_str = next(csv.reader((raw.decode("utf-8"),)), [""] * (time_column + 1))[time_column]
+            else:
+                parts = raw.split(b",", time_column + 1)
+                time_str = parts[time_column].decode("utf-8") if len(parts) > time_column else ""
+
+            ms = util.time_str_to_ms(time_str.strip())
+            if ms is None:
+                continue # 빈 줄 또는 시간 형식이 다른 행
+            if ms < start_ms:
+                continue
+            if ms > end_ms:
+                if sorted_times:
+                    break
+                continue
+
+            buffer.append(raw)
+            buffered += len(raw)
+            rows_written += 1
+            if buffered >= COPY_BUFFER_BYTES:
+                write(b"".join(buffer))
+                bytes_written += buffered
+                buffer.clear()
+                buffered = 0
+
+        write(b"".join(buffer))
+        bytes_written += buffered
+
+    return rows_written, bytes_written
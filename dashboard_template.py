@@ -0,0 +1,155 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import tracing
+
+# 템플릿 안의 플레이스홀더
+DS_PLACEHOLDER = "${DS_MARCUSOLSSON-CSV-DATASOURCE}"
+START_TIME_PLACEHOLDER = "${DYNAMIC_START_TIME}"
+END_TIME_PLACEHOLDER = "${DYNAMIC_END_TIME}"
+
+# 업로드한 대시보드 내용의 해시를 저장하는 필드 (같은 내용이면 다시 업로드하지 않기 위함)
+UPLOADER_HASH_FIELD = "__uploader_hash"
+
+# 해시 계산에서 제외하는 필드 (Grafana가 저장할 때 바꾸는 값)
+_HASH_EXCLUDED_FIELDS = ("id", "version", UPLOADER_HASH_FIELD)
+
+_PLACEHOLDER_RE = re.compile(r"\$\{[A-Za-z0-9_\-]+\}")
+
+# JSON 경로: dict 키 또는 list 인덱스의 튜플
+JsonPath = Tuple[Union[str, int], ...]
+
+
+class DashboardTemplate:
+    """
+    대시보드 템플릿 JSON을 한 번만 파싱하고, 플레이스홀더가 들어 있는 문자열의 JSON 경로를 미리 찾아 둡니다.
+    render()는 값이 바뀌는 경로의 dict/list만 복사하고 나머지는 템플릿 객체를 그대로 공유하므로
+    업로드마다 전체 JSON을 직렬화/파싱하지 않습니다. (템플릿 payload는 읽기 전용으로 취급)
+    """
+    def __init__(self, path: str, payload: Dict[str, Any], mtime_ns: int = 0, size: int = 0):
+        self.path = path
+        self.payload = payload
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.has_dashboard_key = 'dashboard' in payload
+        self.placeholder_paths: List[Tuple[JsonPath, str]] = list(self._find_placeholders(payload, ()))
+
+    @classmethod
+    def load(cls, path: str) -> "DashboardTemplate":
+        """
+        템플릿 파일을 읽습니다. (FileNotFoundError, json.JSONDecodeError는 호출한 쪽에서 처리)
+        """
+        st = os.stat(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        return cls(path, payload, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _find_placeholders(cls, node: Any, path: JsonPath):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                yield from cls._find_placeholders(value, path + (key,))
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                yield from cls._find_placeholders(value, path + (index,))
+        elif isinstance(node, str) and _PLACEHOLDER_RE.search(node):
+            yield path, node
+
+    def _dashboard_path(self) -> JsonPath:
+        return ('dashboard',) if self.has_dashboard_key else ()
+
+    @tracing.traced("DashboardTemplate.render", cat="template")
+    def render(self, values: Dict[str, str], title: Optional[str] = None, uid: Optional[str] = None,
+               start_iso: Optional[str] = None, end_iso: Optional[str] = None,
+               extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        플레이스홀더를 values로 치환하고 제목/UID/시간 범위를 설정한 새 payload를 반환합니다.
+        - values: {플레이스홀더: 값} (예: {DS_PLACEHOLDER: 데이터소스 UID})
+        - start_iso, end_iso: 대시보드 time/timeFrom/timeTo (지정 시 시간 플레이스홀더도 같은 값으로 치환)
+        - extra: payload 최상위에 추가할 값
+        """
+        values = dict(values)
+        if start_iso is not None:
+            values.setdefault(START_TIME_PLACEHOLDER, start_iso)
+        if end_iso is not None:
+            values.setdefault(END_TIME_PLACEHOLDER, end_iso)
+
+        root = dict(self.payload)
+        copied = {id(root)}
+
+        def writable(path: JsonPath):
+            # path까지의 dict/list를 처음 수정할 때만 얕은 복사 (copy-on-write)
+            node = root
+            for key in path:
+                child = node[key]
+                if id(child) not in copied:
+                    child = child.copy()
+                    node[key] = child
+                    copied.add(id(child))
+                node = child
+            return node
+
+        for path, text in self.placeholder_paths:
+            rendered = _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(0), m.group(0)), text)
+            if rendered != text:
+                writable(path[:-1])[path[-1]] = rendered
+
+        db = writable(self._dashboard_path())
+        if title is not None:
+            db['title'] = title
+        if uid is not None:
+            db['uid'] = uid
+        if start_iso is not None and end_iso is not None:
+            time_range = dict(db.get('time') or {})
+            time_range['from'] = start_iso
+            time_range['to'] = end_iso
+            db['time'] = time_range
+            db['timeFrom'] = start_iso
+            db['timeTo'] = end_iso
+        db['refresh'] = False
+
+        if extra:
+            root.update(extra)
+        return root
+
+    def dashboard(self) -> Dict[str, Any]:
+        """
+        템플릿의 대시보드 부분 (읽기 전용)
+        """
+        return self.payload['dashboard'] if self.has_dashboard_key else self.payload
+
+
+@tracing.traced(cat="template")
+def content_hash(dashboard: Dict[str, Any]) -> str:
+    """
+    대시보드 JSON의 정규화된 해시. (키 정렬, 공백 제거, id/version/해시 필드 제외)
+    템플릿 내용, 데이터 소스 UID, 시간 범위, 제목이 같으면 같은 값이 나옵니다.
+    """
+    content = {k: v for k, v in dashboard.items() if k not in _HASH_EXCLUDED_FIELDS}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+_cache: Dict[str, DashboardTemplate] = {}
+_cache_lock = threading.Lock()
+
+
+def get_template(path: str) -> DashboardTemplate:
+    """
+    템플릿을 캐시에서 가져옵니다. 파일의 수정 시간이나 크기가 바뀐 경우에만 다시 읽습니다.
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    with _cache_lock:
+        template = _cache.get(abs_path)
+        if template is not None and template.mtime_ns == st.st_mtime_ns and template.size == st.st_size:
+            return template
+
+    template = DashboardTemplate.load(abs_path)
+    with _cache_lock:
+        _cache[abs_path] = template
+    return template
@@ -0,0 +1,234 @@
+import os
+import csv
+import math
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+
+import util
+from dashboard_template import get_template
+from log_analyzer import ColumnProjection
+
+# 한 번에 쓰는 행 버퍼 크기
+WRITE_BUFFER_ROWS = 4096
+
+
+def _iter_panels(panels: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    row 패널 안에 접힌 패널까지 포함하여 모든 패널을 순회합니다.
+    """
+    for panel in panels:
+        yield panel
+        yield from _iter_panels(panel.get('panels', []))
+
+
+def template_columns(dashboard_payload: Dict[str, Any]) -> List[str]:
+    """
+    대시보드 템플릿 패널 targets의 schema에 선언된 숫자(number) 열 이름 목록을 반환합니다. (중복 제거, 선언 순서 유지)
+    """
+    db = dashboard_payload.get('dashboard', dashboard_payload)
+
+    columns: List[str] = []
+    for panel in _iter_panels(db.get('panels', [])):
+        for target in panel.get('targets', []):
+            for column in target.get('schema', []):
+                name = column.get('name')
+                if column.get('type') == 'number' and name and name not in columns:
+                    columns.append(name)
+    return columns
+
+
+def template_columns_from_file(json_path: str) -> List[str]:
+    # 업로드할 때 쓰는 템플릿 캐시를 같이 사용 (파일이 바뀌었을 때만 다시 파싱)
+    return template_columns(get_template(json_path).payload)
+
+
+def _iter_rows(f) -> Iterator[List[str]]:
+    """
+    바이너리 파일의 줄을 열 리스트로 돌려줍니다. (따옴표가 없는 줄은 단순 분리)
+    """
+    for raw in f:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line.strip():
+            yield []
+        elif '"' in line:
+            yield next(csv.reader((line,)))
+        else:
+            yield line.split(",")
+
+
+def _to_float(row: List[str], index: int) -> float:
+    try:
+        return float(row[index])
+    except (IndexError, ValueError):
+        return math.nan
+
+
+class _LttbColumn:
+    """
+    Largest-Triangle-Three-Buckets를 한 열에 대해 스트리밍으로 계산합니다.
+    현재 버킷과 다음 버킷의 점만 메모리에 유지합니다.
+    """
+    def __init__(self):
+        self.anchor: Optional[Tuple[float, float]] = None  # 직전 버킷에서 선택된 점
+        self.current: List[Tuple[int, float, float]] = []
+        self.next: List[Tuple[int, float, float]] = []
+        self.selected: List[int] = []
+
+    def _select(self, next_avg: Optional[Tuple[float, float]]):
+        """
+        현재 버킷에서 (anchor, 현재 점, 다음 버킷 평균)이 이루는 삼각형 넓이가 가장 큰 점을 선택합니다.
+        """
+        if not self.current:
+            return
+        if self.anchor is None or next_avg is None:
+            best = self.current[0]
+        else:
+            ax, ay = self.anchor
+            cx, cy = next_avg
+            best = max(self.current, key=lambda p: abs((ax - cx) * (p[2] - ay) - (ax - p[1]) * (cy - ay)))
+        self.selected.append(best[0])
+        self.anchor = (best[1], best[2])
+
+    def add(self, row_num: int, x: float, y: float):
+        if not math.isnan(y):
+            self.next.append((row_num, x, y))
+
+    def close_bucket(self):
+        """
+        다음 버킷이 완성되면 현재 버킷의 점을 선택하고 버킷을 한 칸 옮깁니다.
+        """
+        if self.next:
+            n = len(self.next)
+            next_avg = (sum(p[1] for p in self.next) / n, sum(p[2] for p in self.next) / n)
+        else:
+            next_avg = self.anchor
+        self._select(next_avg)
+        self.current, self.next = self.next, []
+
+    def finish(self, last: Optional[Tuple[float, float]]):
+        self._select(last if last is not None else self.anchor)
+        self.current = []
+
+
+def _count_rows(path: str) -> int:
+    """
+    헤더를 제외한 데이터 행 수를 셉니다. (빈 줄은 행 선택/저장과 마찬가지로 세지 않음, 압축 파일은 압축을 풀면서 셈)
+    """
+    count = 0
+    with util.open_log_file(path) as f:
+        f.readline() # 헤더
+        for raw in f:
+            if raw.strip():
+                count += 1
+    return count
+
+
+def lttb_select_rows(src_path: str, columns: Iterable[str], points_per_column: int) -> Tuple[Set[int], int]:
+    """
+    각 열에 대해 LTTB로 points_per_column개의 행을 고르고, 섹션이 바뀌는 행을 더한 행 번호 집합을 반환합니다.
+    (선택된 데이터 행 번호 집합, 전체 데이터 행 수)를 반환합니다.
+    """
+    total_rows = _count_rows(src_path)
+    points_per_column = max(3, points_per_column)
+
+    with util.open_log_file(src_path) as f:
+        rows = _iter_rows(f)
+        header = [name.strip() for name in next(rows, [])]
+        projection = ColumnProjection.from_header(header)
+        time_idx = projection.time_index
+        section_idx = projection.section_index
+
+        column_indexes = [header.index(name) for name in columns if name in header]
+
+        # 줄일 필요가 없거나 템플릿 열이 CSV에 없으면 모든 행 유지
+        if total_rows <= points_per_column or not column_indexes:
+            return set(range(total_rows)), total_rows
+        lttb = [_LttbColumn() for _ in column_indexes]
+
+        # 첫 행과 마지막 행은 항상 포함, 나머지는 (points - 2)개의 버킷으로 나눔
+        bucket_size = (total_rows - 2) / (points_per_column - 2)
+        selected: Set[int] = {0, total_rows - 1}
+        last_values: List[Optional[Tuple[float, float]]] = [None] * len(column_indexes)
+
+        prev_section = None
+        bucket_end = 1
+        next_bucket = 0
+        row_num = -1
+        for row in rows:
+            if not row:
+                continue
+            row_num += 1
+            if row_num >= total_rows:
+                break
+
+            # 섹션이 바뀌는 행은 그대로 유지
+            section = row[section_idx].strip() if len(row) > section_idx else None
+            if section != prev_section:
+                selected.add(row_num)
+                prev_section = section
+
+            x = util.time_str_to_ms(row[time_idx].strip()) if len(row) > time_idx else None
+            x = float(row_num if x is None else x)
+
+            if row_num == 0 or row_num == total_rows - 1:
+                for i, col in enumerate(column_indexes):
+                    y = _to_float(row, col)
+                    point = None if math.isnan(y) else (x, y)
+                    if row_num == 0:
+                        lttb[i].anchor = point
+                    else:
+                        last_values[i] = point
+                continue
+
+            # 버킷 경계: 다음 버킷이 완성되면 현재 버킷의 점을 선택
+            while row_num >= bucket_end:
+                for column in lttb:
+                    column.close_bucket()
+                next_bucket += 1
+                bucket_end = int(next_bucket * bucket_size) + 1
+
+            for i, col in enumerate(column_indexes):
+                lttb[i].add(row_num, x, _to_float(row, col))
+
+        for i, column in enumerate(lttb):
+            column.close_bucket()
+            column.finish(last_values[i])
+            selected.update(column.selected)
+
+    return selected, total_rows
+
+
+def downsample_csv(src_path: str, dst_path: str, columns: Iterable[str], points_per_column: int,
+                   hasher=None) -> Tuple[int, int]:
+    """
+    src_path의 CSV를 열별 LTTB 포인트 예산(points_per_column)에 맞게 줄여 dst_path에 저장합니다.
+    섹션이 바뀌는 행과 첫/마지막 행은 항상 유지합니다. (원본 행 수, 저장한 행 수)를 반환합니다.
+    hasher(hashlib 객체)를 넘기면 저장하는 내용으로 해시를 갱신합니다.
+    """
+    selected, total_rows = lttb_select_rows(src_path, columns, points_per_column)
+
+    kept = 0
+    tmp_path = dst_path + ".tmp"
+    with util.open_log_file(src_path) as fin, open(tmp_path, "wb") as fout:
+        def write(data: bytes):
+            fout.write(data)
+            if hasher is not None:
+                hasher.update(data)
+
+        write(fin.readline())
+
+        buffer = []
+        row_num = -1
+        for raw in fin:
+            if not raw.strip():
+                continue
+            row_num += 1
+            if row_num in selected:
+                buffer.append(raw)
+                kept += 1
+                if len(buffer) >= WRITE_BUFFER_ROWS:
+                    write(b"".join(buffer))
+                    buffer.clear()
+        write(b"".join(buffer))
+
+    os.replace(tmp_path, dst_path)
+    return total_rows, kept
@@ -0,0 +1,482 @@
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import Any, Dict, List, Optional, Tuple
+
+# 라우트 이름 (요청 수 집계, 지연/오류 주입 대상 지정에 사용)
+ROUTE_USER = "GET /api/user"
+ROUTE_DS_LIST = "GET /api/datasources"
+ROUTE_DS_GET = "GET /api/datasources/{id}"
+ROUTE_DS_GET_UID = "GET /api/datasources/uid/{uid}"
+ROUTE_DS_CREATE = "POST /api/datasources"
+ROUTE_DS_DELETE = "DELETE /api/datasources/{id}"
+ROUTE_DS_DELETE_UID = "DELETE /api/datasources/uid/{uid}"
+ROUTE_SEARCH = "GET /api/search"
+ROUTE_DB_POST = "POST /api/dashboards/db"
+ROUTE_DB_GET = "GET /api/dashboards/uid/{uid}"
+ROUTE_DB_DELETE = "DELETE /api/dashboards/uid/{uid}"
+
+# 모든 라우트에 적용
+ANY_ROUTE = "*"
+
+# Grafana 검색 기본 결과 개수
+DEFAULT_SEARCH_LIMIT = 1000
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds').replace("+00:00", "Z")
+
+
+@dataclass
+class ErrorRule:
+    """
+    오류 주입 규칙. count가 남아 있는 동안(None이면 계속) rate 확률로 status를 응답합니다.
+    """
+    status: int = 503
+    count: Optional[int] = 1
+    rate: float = 1.0
+    message: str = "injected error"
+
+
+class FakeGrafana:
+    """
+    GrafanaAPI가 사용하는 엔드포인트만 구현한 테스트/벤치마크용 가짜 Grafana 서버.
+    Grafana 없이 업로드/삭제 동작과 라우트별 요청 수를 확인할 수 있습니다.
+
+        with FakeGrafana(latency_sec=0.005) as server:
+            api = GrafanaAPI(api_key="test", base_url=server.url)
+            ...
+            print(server.request_counts[ROUTE_DB_POST])
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_sec: float = 0.0,
+                 api_key: Optional[str] = None, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.api_key = api_key # 지정하면 Authorization: Bearer 값이 다를 때 401
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._latency: Dict[str, float] = {ANY_ROUTE: latency_sec}
+        self._errors: Dict[str, ErrorRule] = {}
+        self.request_counts: Counter = Counter()
+        self.error_counts: Counter = Counter()
+
+        self._datasources: Dict[int, Dict[str, Any]] = {}
+        self._dashboards: Dict[str, Dict[str, Any]] = {} # uid -> {"dashboard", "meta"}
+        self._next_id = 1
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # --- 서버 시작/종료 ---
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("서버가 시작되지 않았습니다.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGrafana":
+        """
+        백그라운드 스레드에서 서버를 시작합니다. (port=0이면 빈 포트 자동 선택)
+        """
+        handler = type("FakeGrafanaHandler", (_Handler,), {"fake": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="FakeGrafana", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self):
+        """
+        현재 스레드에서 서버를 실행합니다. (명령줄 실행용)
+        """
+        handler = type("FakeGrafanaHandler", (_Handler,), {"fake": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeGrafana":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # --- 지연/오류 주입, 요청 수 ---
+
+    def set_latency(self, latency_sec: float, route: str = ANY_ROUTE):
+        """
+        응답 지연 시간(초)을 설정합니다. route별 값이 있으면 전체 값(ANY_ROUTE) 대신 사용합니다.
+        """
+        with self._lock:
+            self._latency[route] = latency_sec
+
+    def inject_error(self, route: str = ANY_ROUTE, status: int = 503, count: Optional[int] = 1,
+                     rate: float = 1.0, message: str = "injected error"):
+        """
+        route 요청에 오류 응답을 주입합니다.
+        - count: 오류를 돌려줄 횟수 (None이면 clear_errors 전까지 계속)
+        - rate : 요청마다 오류를 돌려줄 확률 (0~1)
+        """
+        with self._lock:
+            self._errors[route] = ErrorRule(status=status, count=count, rate=rate, message=message)
+
+    def clear_errors(self):
+        with self._lock:
+            self._errors.clear()
+
+    def reset_counts(self):
+        with self._lock:
+            self.request_counts.clear()
+            self.error_counts.clear()
+
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.request_counts.values())
+
+    def _before_request(self, route: str) -> Optional[ErrorRule]:
+        """
+        요청 수를 세고, 지연 시간과 주입할 오류를 결정합니다.
+        """
+        with self._lock:
+            self.request_counts[route] += 1
+            latency = self._latency.get(route, self._latency.get(ANY_ROUTE, 0.0))
+
+            error = None
+            for key in (route, ANY_ROUTE):
+                rule = self._errors.get(key)
+                if rule is None or (rule.count is not None and rule.count <= 0):
+                    continue
+                if rule.rate < 1.0 and self._random.random() >= rule.rate:
+                    continue
+                if rule.count is not None:
+                    rule.count -= 1
+                self.error_counts[route] += 1
+                error = rule
+                break
+
+        if latency > 0:
+            time.sleep(latency)
+        return error
+
+    # --- 저장된 데이터 (확인용) ---
+
+    def datasources(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(ds) for ds in self._datasources.values()]
+
+    def dashboards(self) -> Dict[str, Dict[str, Any]]:
+        """
+        uid -> 대시보드 JSON
+        """
+        with self._lock:
+            return {uid: entry["dashboard"] for uid, entry in self._dashboards.items()}
+
+    def add_dashboard(self, dashboard: Dict[str, Any], created: Optional[str] = None) -> str:
+        """
+        대시보드를 직접 추가합니다. (삭제 벤치마크 준비용, 생성 시간 지정 가능)
+        """
+        status, body = self.save_dashboard({"dashboard": dashboard, "overwrite": True})
+        if status != 200:
+            raise ValueError(body.get("message"))
+        if created:
+            with self._lock:
+                self._dashboards[body["uid"]]["meta"]["created"] = created
+        return body["uid"]
+
+    def add_datasource(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        status, body = self.create_datasource(payload)
+        if status != 200:
+            raise ValueError(body.get("message"))
+        return body["datasource"]
+
+    # --- API 동작 (Grafana 응답 형식) ---
+
+    def _allocate_id(self) -> int:
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+
+    def create_datasource(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            name = payload.get("name")
+            uid = payload.get("uid")
+            if not name:
+                return 400, {"message": "Required data source name"}
+            for ds in self._datasources.values():
+                if ds["name"] == name:
+                    return 409, {"message": "data source with the same name already exists"}
+                if uid and ds["uid"] == uid:
+                    return 409, {"message": "data source with the same uid already exists"}
+
+            ds_id = self._allocate_id()
+            datasource = {
+                "id": ds_id,
+                "uid": uid or f"fake-ds-{ds_id}",
+                "orgId": 1,
+                "name": name,
+                "type": payload.get("type", ""),
+                "access": payload.get("access", "proxy"),
+                "url": payload.get("url", ""),
+                "isDefault": bool(payload.get("isDefault", False)),
+                "jsonData": dict(payload.get("jsonData") or {}),
+                "readOnly": False
+            }
+            self._datasources[ds_id] = datasource
+            return 200, {"datasource": dict(datasource), "id": ds_id, "name": name, "message": "Datasource added"}
+
+    def _find_datasource(self, key: str, by_uid: bool) -> Optional[Dict[str, Any]]:
+        if by_uid:
+            return next((ds for ds in self._datasources.values() if ds["uid"] == key), None)
+        try:
+            return self._datasources.get(int(key))
+        except ValueError:
+            return None
+
+    def get_datasource(self, key: str, by_uid: bool = False) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            ds = self._find_datasource(key, by_uid)
+            if ds is None:
+                return 404, {"message": "Data source not found"}
+            return 200, dict(ds)
+
+    def list_datasources(self) -> Tuple[int, List[Dict[str, Any]]]:
+        keys = ("id", "uid", "orgId", "name", "type", "access", "url", "isDefault", "jsonData", "readOnly")
+        with self._lock:
+            return 200, [{k: ds[k] for k in keys} for ds in self._datasources.values()]
+
+    def delete_datasource(self, key: str, by_uid: bool = False) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            ds = self._find_datasource(key, by_uid)
+            if ds is None:
+                return 404, {"message": "Data source not found"}
+            del self._datasources[ds["id"]]
+            return 200, {"message": "Data source deleted", "id": ds["id"]}
+
+    def save_dashboard(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        dashboard = dict(payload.get("dashboard") or {})
+        overwrite = bool(payload.get("overwrite"))
+        title = dashboard.get("title")
+        if not title:
+            return 400, {"message": "Dashboard title cannot be empty", "status": "empty-name"}
+
+        with self._lock:
+            uid = dashboard.get("uid") or f"fake-db-{self._allocate_id()}"
+            for other_uid, entry in self._dashboards.items():
+                if other_uid != uid and entry["dashboard"].get("title") == title:
+                    if not overwrite:
+                        return 412, {"message": "A dashboard with the same name in the folder already exists", "status": "name-exists"}
+                    del self._dashboards[other_uid] # 덮어쓰기: 같은 제목의 대시보드를 대체
+                    break
+
+            existing = self._dashboards.get(uid)
+            if existing is not None and not overwrite:
+                return 412, {"message": "The dashboard has been changed by someone else", "status": "version-mismatch"}
+
+            now = _now_iso()
+            version = existing["dashboard"].get("version", 0) + 1 if existing else 1
+            dashboard_id = existing["dashboard"]["id"] if existing else self._allocate_id()
+            dashboard.update({"uid": uid, "id": dashboard_id, "version": version})
+            meta = dict(existing["meta"]) if existing else {"created": now}
+            meta.update({"updated": now, "version": version, "url": f"/d/{uid}", "folderId": payload.get("folderId", 0)})
+            self._dashboards[uid] = {"dashboard": dashboard, "meta": meta}
+
+            return 200, {"id": dashboard_id, "uid": uid, "url": f"/d/{uid}", "status": "success", "version": version, "slug": uid}
+
+    def get_dashboard(self, uid: str) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            entry = self._dashboards.get(uid)
+            if entry is None:
+                return 404, {"message": "Dashboard not found"}
+            return 200, {"dashboard": dict(entry["dashboard"]), "meta": dict(entry["meta"])}
+
+    def delete_dashboard(self, uid: str) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            entry = self._dashboards.pop(uid, None)
+            if entry is None:
+                return 404, {"message": "Dashboard not found"}
+            title = entry["dashboard"].get("title")
+            return 200, {"title": title, "message": f"Dashboard {title} deleted", "id": entry["dashboard"]["id"]}
+
+    def search(self, params: Dict[str, List[str]]) -> Tuple[int, List[Dict[str, Any]]]:
+        query = (params.get("query", [""])[0] or "").lower()
+        search_type = params.get("type", [""])[0]
+        tags = params.get("tag", [])
+        folder_uids = params.get("folderUIDs", [])
+        try:
+            limit = int(params.get("limit", [DEFAULT_SEARCH_LIMIT])[0])
+            page = max(1, int(params.get("page", ["1"])[0]))
+        except ValueError:
+            return 400, [{"message": "invalid limit/page"}]
+
+        if search_type and search_type != "dash-db":
+            return 200, [] # 폴더는 만들지 않음
+
+        with self._lock:
+            results = []
+            for uid, entry in self._dashboards.items():
+                db = entry["dashboard"]
+                title = db.get("title", "")
+                if query and query not in title.lower():
+                    continue
+                if tags and not set(tags).issubset(db.get("tags") or []):
+                    continue
+                if folder_uids and "" not in folder_uids and "general" not in folder_uids:
+                    continue
+                results.append({
+                    "id": db["id"], "uid": uid, "title": title, "uri": f"db/{uid}", "url": entry["meta"]["url"],
+                    "type": "dash-db", "tags": list(db.get("tags") or []), "isStarred": False
+                })
+
+        results.sort(key=lambda item: item["title"].lower())
+        start = (page - 1) * limit
+        return 200, results[start:start + limit]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    요청 경로를 라우트로 나누어 FakeGrafana의 동작을 호출합니다.
+    """
+    protocol_version = "HTTP/1.1" # keep-alive (GrafanaAPI 연결 재사용 확인용)
+    fake: FakeGrafana
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def _route(self, method: str, path: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        (라우트 이름, 경로 인자)를 반환합니다. 알 수 없는 경로는 (None, None).
+        """
+        parts = [p for p in path.split("/") if p]
+        if parts[:2] == ["api", "user"] and len(parts) == 2 and method == "GET":
+            return ROUTE_USER, None
+        if parts[:2] == ["api", "datasources"]:
+            if len(parts) == 2:
+                return {"GET": ROUTE_DS_LIST, "POST": ROUTE_DS_CREATE}.get(method), None
+            if len(parts) == 4 and parts[2] == "uid":
+                return {"GET": ROUTE_DS_GET_UID, "DELETE": ROUTE_DS_DELETE_UID}.get(method), parts[3]
+            if len(parts) == 3:
+                return {"GET": ROUTE_DS_GET, "DELETE": ROUTE_DS_DELETE}.get(method), parts[2]
+        if parts == ["api", "search"] and method == "GET":
+            return ROUTE_SEARCH, None
+        if parts == ["api", "dashboards", "db"] and method == "POST":
+            return ROUTE_DB_POST, None
+        if parts[:3] == ["api", "dashboards", "uid"] and len(parts) == 4:
+            return {"GET": ROUTE_DB_GET, "DELETE": ROUTE_DB_DELETE}.get(method), parts[3]
+        return None, None
+
+    def _handle(self, method: str):
+        fake = self.fake
+        url = urlparse(self.path)
+        route, arg = self._route(method, url.path)
+
+        try:
+            body = self._read_json() if method == "POST" else None
+        except ValueError:
+            self._send(400, {"message": "bad request data"})
+            return
+
+        if route is None:
+            with fake._lock:
+                fake.request_counts[f"{method} {url.path}"] += 1
+            self._send(404, {"message": "Not found"})
+            return
+
+        error = fake._before_request(route)
+        if error is not None:
+            self._send(error.status, {"message": error.message})
+            return
+
+        if fake.api_key is not None and self.headers.get("Authorization") != f"Bearer {fake.api_key}":
+            self._send(401, {"message": "Unauthorized"})
+            return
+
+        if route == ROUTE_USER:
+            status, result = 200, {"id": 1, "login": "admin", "name": "admin", "isGrafanaAdmin": True}
+        elif route == ROUTE_DS_LIST:
+            status, result = fake.list_datasources()
+        elif route == ROUTE_DS_CREATE:
+            status, result = fake.create_datasource(body)
+        elif route in (ROUTE_DS_GET, ROUTE_DS_GET_UID):
+            status, result = fake.get_datasource(arg, by_uid=(route == ROUTE_DS_GET_UID))
+        elif route in (ROUTE_DS_DELETE, ROUTE_DS_DELETE_UID):
+            status, result = fake.delete_datasource(arg, by_uid=(route == ROUTE_DS_DELETE_UID))
+        elif route == ROUTE_SEARCH:
+            status, result = fake.search(parse_qs(url.query))
+        elif route == ROUTE_DB_POST:
+            status, result = fake.save_dashboard(body)
+        elif route == ROUTE_DB_GET:
+            status, result = fake.get_dashboard(arg)
+        else:
+            status, result = fake.delete_dashboard(arg)
+        self._send(status, result)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="업로더 테스트/벤치마크용 가짜 Grafana 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="모든 요청의 응답 지연 (밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0, help="모든 요청에 503을 돌려줄 확률 (0~1)")
+    parser.add_argument("--api-key", help="지정하면 이 키가 아닌 요청은 401")
+    args = parser.parse_args(argv)
+
+    fake = FakeGrafana(host=args.host, port=args.port, latency_sec=args.latency_ms / 1000, api_key=args.api_key)
+    if args.error_rate > 0:
+        fake.inject_error(ANY_ROUTE, status=503, count=None, rate=args.error_rate)
+
+    print(f"가짜 Grafana 서버 실행: http://{args.host}:{args.port} (Ctrl+C로 종료)")
+    try:
+        fake.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print("요청 수:")
+    for route, count in sorted(fake.request_counts.items()):
+        print(f"  {route}: {count}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,31 @@
 import json
+import time
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Tuple
+from typing import Callable, Iterator, List, Dict, Any, Tuple, Optional
 
+import bulk_delete
+import tracing
+from bulk_delete import DeleteFilter
+from dashboard_template import DashboardTemplate, DS_PLACEHOLDER, UPLOADER_HASH_FIELD, content_hash
+
+# --- HTTP 연결 설정 기본값 (config.ini [API] 섹션으로 변경 가능) ---
+DEFAULT_POOL_SIZE = 10          # 서버당 유지하는 keep-alive 연결 수
+DEFAULT_TIMEOUT_SEC = 10        # 요청당 타임아웃 (초)
+DEFAULT_RETRY_COUNT = 3         # 재시도 횟수
+DEFAULT_RETRY_BACKOFF_SEC = 0.5 # 재시도 간격: backoff * 2^(n-1) 초
+DEFAULT_DS_INDEX_TTL_SEC = 60   # 데이터 소스 인덱스 유효 시간 (초, 0이면 만료 없음)
+SEARCH_PAGE_SIZE = 1000         # /api/search 한 페이지 크기 (Grafana 최대 5000)
+
+# 재시도할 HTTP 상태 코드 (요청 과다, 서버 오류)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+@lru_cache(maxsize=1024)
 def to_utc_iso8601(time_str: str) -> str:
     """
     'YYYY-MM-DD HH:MM:SS.sss' → UTC ISO 8601 문자열
@@ -13,6 +36,22 @@ def to_utc_iso8601(time_str: str) -> str:
     return dt.isoformat(timespec='milliseconds').replace("+00:00", "Z")
 
 
+def dashboard_uid_for_title(title: str) -> str:
+    """
+    대시보드 제목([GR]_Title)으로 항상 같은 UID를 만듭니다. (Grafana UID 최대 40자)
+    제목만 알면 검색 없이 UID로 바로 덮어쓸 수 있습니다.
+    """
+    return "grd-" + hashlib.blake2b(title.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def datasource_uid_for_path(csv_path: str) -> str:
+    """
+    csv 경로(Grafana 경로 형식)로 항상 같은 데이터 소스 UID를 만듭니다.
+    """
+    return "grds-" + hashlib.blake2b(csv_path.encode("utf-8"), digest_size=12).hexdigest()
+
+
+@lru_cache(maxsize=1024)
 def to_korea_iso8601(time_str: str) -> str:
     """
     'YYYY-MM-DD HH:MM:SS.sss' → 한국 시간 ISO 8601 문자열
@@ -25,10 +64,24 @@ def to_korea_iso8601(time_str: str) -> str:
 
 
 class GrafanaAPI:
-    """Grafana API"""
-    def __init__(self, api_key, base_url):
+    """
+    Grafana API
+    모든 요청은 keep-alive 연결 풀을 공유하는 하나의 Session으로 보내며,
+    연결 실패/429/5xx 응답은 지수 백오프로 재시도합니다. (POST는 연결 실패만 재시도)
+    """
+    def __init__(self, api_key, base_url, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT_SEC,
+                 retries: int = DEFAULT_RETRY_COUNT, backoff: float = DEFAULT_RETRY_BACKOFF_SEC,
+                 ds_index_ttl: float = DEFAULT_DS_INDEX_TTL_SEC):
         self.api_key = api_key
         self.base_url = base_url
+        self.timeout = timeout
+        self.pool_size = pool_size
+
+        # 데이터 소스 인덱스: csv 경로(url) -> 목록 조회 항목 (id, uid, name, type, url)
+        self.ds_index_ttl = ds_index_ttl
+        self._ds_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._ds_index_time = 0.0
+        self._ds_index_lock = threading.Lock()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -38,7 +91,74 @@ class GrafanaAPI:
         self.delete_endpoint = f"{self.base_url}/api/dashboards/uid"
         self.datasource_endpoint = f"{self.base_url}/api/datasources"
 
+        # 멱등 메서드(GET/PUT/DELETE 등)만 읽기 오류와 상태 코드로 재시도, 연결 실패는 모든 메서드 재시도
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False # 재시도 후에도 실패하면 마지막 응답을 그대로 반환
+        )
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        공유 Session으로 요청을 보냅니다. timeout을 지정하지 않으면 기본 타임아웃을 사용합니다.
+        추적 중이면 메서드, 엔드포인트, 상태 코드, 요청/응답 바이트 수를 구간으로 기록합니다. (재시도 포함 전체 시간)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        endpoint = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        with tracing.span(f"{method} {endpoint}", tracing.HTTP_CATEGORY, method=method, endpoint=endpoint) as span:
+            response = self.session.request(method, url, **kwargs)
+            if span.recording:
+                body = response.request.body
+                span.set(
+                    status=response.status_code,
+                    request_bytes=len(body) if body else 0,
+                    response_bytes=len(response.content)
+                )
+                if kwargs.get("params"):
+                    span.set(params=kwargs["params"])
+            return response
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        연결 풀 사용 통계를 반환합니다.
+        - requests: 서버로 보낸 HTTP 요청 수 (재시도 포함)
+        - connections: 새로 연결한 횟수
+        - reused: 기존 연결을 재사용한 요청 수
+        """
+        total_requests = 0
+        total_connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            total_requests += pool.num_requests
+            total_connections += pool.num_connections
+        return {
+            "requests": total_requests,
+            "connections": total_connections,
+            "reused": max(0, total_requests - total_connections)
+        }
 
+    def close(self):
+        """
+        연결 풀을 닫습니다.
+        """
+        self.session.close()
+
+
+    @tracing.traced(cat="grafana")
     def check_connection(self) -> tuple[bool, str]:
         """
         Grafana 서버와의 연결 및 API Key의 유효성을 확인합니다.
@@ -48,7 +168,7 @@ class GrafanaAPI:
         
         try:
             # GET 요청을 보내 연결 상태와 인증 유효성을 동시에 확인
-            response = requests.get(user_endpoint, headers=self.headers, timeout=10)
+            response = self._request("GET", user_endpoint)
             
             # HTTP 200 (OK) 코드는 연결 성공 및 유효한 인증을 의미합니다.
             if response.status_code == 200:
@@ -62,7 +182,7 @@ class GrafanaAPI:
                 
             elif response.status_code == 404:
                 # 404 Not Found는 API URL이 잘못되었거나 엔드포인트를 찾을 수 없음을 의미
-                error_msg = f"연결 실패: API URL이 잘못되었거나 Grafana 인스턴스가 응답하지 않습니다. (HTTP 404)"
+                error_msg = "연결 실패: API URL이 잘못되었거나 Grafana 인스턴스가 응답하지 않습니다. (HTTP 404)"
                 return False, error_msg
                 
             else:
@@ -72,7 +192,7 @@ class GrafanaAPI:
                 return False, error_msg
             
         except requests.exceptions.Timeout:
-            return False, "연결 시간 초과: Grafana 서버가 지정된 시간(10초) 내에 응답하지 않았습니다."
+            return False, f"연결 시간 초과: Grafana 서버가 지정된 시간({self.timeout}초) 내에 응답하지 않았습니다."
             
         except requests.exceptions.ConnectionError:
             return False, "연결 오류: Grafana 서버에 연결할 수 없습니다. URL 또는 네트워크 상태를 확인하세요."
@@ -82,10 +202,12 @@ class GrafanaAPI:
             return False, f"일반 요청 오류 발생: {e}"
 
     # GrafanaPoster 클래스 내부에 구현되어야 할 함수 예시
-    def create_csv_datasource(self, name, csv_path):
+    @tracing.traced(cat="grafana")
+    def create_csv_datasource(self, name, csv_path, uid=None):
         """
         marcusolsson-csv-datasource 타입의 데이터 소스를 생성하고 성공 시 UID를 반환합니다.
         Storage Location을 'Local'로 설정하고, 'Path'에 CSV 경로를 입력합니다.
+        uid를 지정하면 해당 UID로 생성합니다. (datasource_uid_for_path)
         """
         url = f"{self.base_url}/api/datasources"
         
@@ -100,18 +222,32 @@ class GrafanaAPI:
                 "pdcInjected" : False,
                 #"path": csv_path,        # csv 경로
                 #"maxLines": 1000000,
-                "delimiter": ","
+                "delimiter": ",",
+                "createdAt": datetime.now(timezone.utc).isoformat(timespec='seconds') # 생성 시간 기준 일괄 삭제용
             }
         }
+        if uid:
+            payload["uid"] = uid
  
         try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(payload))
+            response = self._request("POST", url, data=json.dumps(payload))
             response.raise_for_status()
             
             # 성공 시 응답에는 ID와 UID가 포함됩니다.
             ds_data = response.json()
             print(f"데이터 소스 생성 성공: UID={ds_data.get('datasource', {}).get('uid', 'N/A')}")
-            return ds_data.get('datasource', {}).get('uid')
+
+            # 인덱스에 바로 추가 (다음 조회 시 목록을 다시 받지 않음)
+            datasource = ds_data.get('datasource', {})
+            if datasource.get('uid'):
+                self._add_to_datasource_index({
+                    'id': datasource.get('id', ds_data.get('id')),
+                    'uid': datasource.get('uid'),
+                    'name': datasource.get('name', name),
+                    'type': datasource.get('type', payload['type']),
+                    'url': datasource.get('url', csv_path)
+                })
+            return datasource.get('uid')
             
         except requests.exceptions.RequestException as e:
             # 실패 시 응답 내용도 함께 출력하여 디버깅에 도움
@@ -122,307 +258,322 @@ class GrafanaAPI:
 
     def get_all_datasources(self):
         """모든 데이터 소스 목록 조회 (ID와 NAME 포함)"""
+        return self._fetch_datasources() or []
+
+    @tracing.traced(cat="grafana")
+    def _fetch_datasources(self) -> Optional[List[Dict[str, Any]]]:
+        """데이터 소스 목록 조회, 실패 시 None"""
         url = f"{self.base_url}/api/datasources"
         # GET http://localhost:3000/api/datasources
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._request("GET", url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"데이터 소스 목록 조회 실패: {e}")
-            return []
+            return None
+
+    def _get_datasource_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        csv 경로(url)로 데이터 소스를 찾는 인덱스를 반환합니다.
+        인덱스가 없거나 TTL이 지났으면 목록 조회 한 번으로 다시 만듭니다. (조회 실패 시 None)
+        """
+        with self._ds_index_lock:
+            expired = self.ds_index_ttl > 0 and time.monotonic() - self._ds_index_time > self.ds_index_ttl
+            if self._ds_index is not None and not expired:
+                return self._ds_index
+
+            datasources = self._fetch_datasources()
+            if datasources is None:
+                return None
+
+            index: Dict[str, Dict[str, Any]] = {}
+            for ds_summary in datasources:
+                config_url = ds_summary.get('url')
+                if config_url:
+                    index.setdefault(config_url, ds_summary) # 같은 경로가 여러 개면 목록의 첫 항목
+            self._ds_index = index
+            self._ds_index_time = time.monotonic()
+            return index
+
+    def _add_to_datasource_index(self, ds_summary: Dict[str, Any]):
+        with self._ds_index_lock:
+            if self._ds_index is not None:
+                self._ds_index.setdefault(ds_summary['url'], ds_summary)
+
+    def _remove_from_datasource_index(self, ds_id):
+        with self._ds_index_lock:
+            if self._ds_index is None:
+                return
+            for config_url, ds_summary in list(self._ds_index.items()):
+                if ds_summary.get('id') == ds_id:
+                    del self._ds_index[config_url]
+
+    def invalidate_datasource_index(self):
+        """
+        데이터 소스 인덱스를 버립니다. 다음 조회 시 목록을 다시 받습니다.
+        """
+        with self._ds_index_lock:
+            self._ds_index = None
+
+    @tracing.traced(cat="grafana")
+    def get_datasource_by_uid(self, uid) -> Optional[Dict[str, Any]]:
+        """
+        UID로 데이터 소스를 조회합니다. 없거나 조회에 실패하면 None.
+        """
+        url = f"{self.datasource_endpoint}/uid/{uid}"
 
+        try:
+            response = self._request("GET", url)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"데이터 소스 UID {uid} 조회 실패: {e}")
+            return None
+
+    @tracing.traced(cat="grafana")
     def get_datasource_details(self, ds_id):
         """특정 데이터 소스의 상세 설정(JSON) 조회"""
         url = f"{self.base_url}/api/datasources/{ds_id}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._request("GET", url)
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except requests.exceptions.RequestException:
             # 401, 403 에러 등 민감한 정보는 숨김 처리
             print(f"데이터 소스 ID {ds_id}의 상세 조회 실패 (Status: {response.status_code if 'response' in locals() else 'N/A'})")
             return None
 
 
+    @tracing.traced(cat="grafana")
     def find_datasource_by_csv_path(self, csv_file_path):
         """
         주어진 CSV 경로와 일치하는 데이터 소스(UID)를 찾습니다.
         marcusolsson-csv-datasource 플러그인
+        목록 조회 결과의 url로 만든 인덱스에서 찾으므로 요청은 최대 1회입니다. (인덱스가 유효하면 0회)
         """
         print(f"CSV 경로로 데이터 소스 검색 중: '{csv_file_path}'")
         
-        all_datasources = self.get_all_datasources()
+        index = self._get_datasource_index()
         
-        if not all_datasources:
+        if not index:
             print("조회된 데이터 소스가 없습니다.")
             return None
 
-        for ds_summary in all_datasources:
-            ds_id = ds_summary.get('id')
+        ds_summary = index.get(csv_file_path)
+        if ds_summary is not None:
             ds_uid = ds_summary.get('uid')
-            ds_name = ds_summary.get('name')
-            ds_type = ds_summary.get('type') # 플러그인 타입 (예: 'marcusolsson-csv-datasource')
-
-            # CSV 데이터 소스 플러그인만 필터링 (선택 사항)
-            # if ds_type != "marcusolsson-csv-datasource": 
-            #     continue 
-
-            ds_details = self.get_datasource_details(ds_id)
-            
-            if ds_details is None:
-                continue
-
-            # 여기서 'path' 키에 CSV 경로
-            config_url = ds_details.get('url')
-            
-            if config_url and config_url == csv_file_path:
-                print(f"일치하는 데이터 소스 발견! 이름: {ds_name}, UID: {ds_uid}, 경로: {config_url}")
-                return ds_uid # 일치하는 데이터 소스의 UID 반환
+            print(f"일치하는 데이터 소스 발견! 이름: {ds_summary.get('name')}, UID: {ds_uid}, 경로: {csv_file_path}")
+            return ds_uid # 일치하는 데이터 소스의 UID 반환
 
         print(f"주어진 CSV 경로 '{csv_file_path}'에 해당하는 데이터 소스를 찾을 수 없습니다.")
         return None
 
 
-    def get_all_dashboards(self):
-        """모든 대시보드 목록 조회"""
+    def iter_search(self, query: str = '', search_type: str = 'dash-db', folder_uids: Optional[List[str]] = None,
+                    tags: Optional[List[str]] = None, page_size: int = SEARCH_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        /api/search 결과를 limit/page로 나누어 받으면서 한 항목씩 돌려줍니다.
+        Grafana 기본 결과 개수 제한에 걸리지 않고, 전체 목록을 한 번에 메모리에 올리지 않습니다.
+        folder_uids, tags를 지정하면 해당 폴더/태그의 대시보드만 검색합니다. (조회 실패 시 그때까지의 결과만)
+        """
         url = f"{self.base_url}/api/search"
-        params = {
-            'query': '',
-            'type': 'dash-db'
+        params: Dict[str, Any] = {
+            'query': query,
+            'type': search_type,
+            'limit': page_size
         }
-        
+        if folder_uids:
+            params['folderUIDs'] = list(folder_uids)
+        if tags:
+            params['tag'] = list(tags)
+
+        page = 1
+        while True:
+            params['page'] = page
+            try:
+                response = self._request("GET", url, params=params)
+                response.raise_for_status()
+                items = response.json()
+            except requests.exceptions.RequestException as e:
+                print(f"대시보드 검색 실패 (page {page}): {e}")
+                return
+
+            yield from items
+            if len(items) < page_size:
+                return
+            page += 1
+
+    def get_all_dashboards(self):
+        """모든 대시보드 목록 조회"""
+        return list(self.iter_search())
+
+    @tracing.traced(cat="grafana")
+    def get_dashboard_by_uid(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        UID로 대시보드(dashboard, meta)를 조회합니다. 없거나 조회에 실패하면 None.
+        """
         try:
-            response = requests.get(url, params=params, headers=self.headers)
-            response.raise_for_status()
+            response = self._request("GET", f"{self.delete_endpoint}/{uid}")
+            if response.status_code != 200:
+                return None
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"대시보드 목록 조회 실패: {e}")
-            return []
+            print(f"대시보드 UID {uid} 조회 실패: {e}")
+            return None
 
-    def find_dashboard_by_title(self, title):
-        """제목으로 대시보드 찾기"""
-        print(f"대시보드 검색 중: '{title}'")
-        
-        # 1. 전체 목록에서 필터링
-        all_dashboards = self.get_all_dashboards()
-        
-        for dashboard in all_dashboards:
-            if dashboard['title'] == title:
-                print(f"{title} 제목의 대시보드 발견: UID={dashboard['uid']}")
-                return dashboard['uid']
-        
-        # 못 찾은 경우 검색 쿼리 사용
-        url = f"{self.base_url}/api/search"
-        params = {
-            'query': title,
-            'type': 'dash-db'
-        }
-        
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            response.raise_for_status()
-            dashboards = response.json()
-            
-            for dashboard in dashboards:
-                if dashboard['title'] == title:
-                    print(f"{title} 제목의 대시보드 발견: UID={dashboard['uid']}")
-                    return dashboard['uid']
-            
-            print(f"대시보드를 찾을 수 없음: '{title}'")
+    @tracing.traced(cat="grafana")
+    def _find_unchanged_dashboard(self, uid: str, upload_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        UID의 대시보드에 저장된 내용 해시가 upload_hash와 같으면 POST 응답 형식의 정보를, 아니면 None을 반환합니다.
+        """
+        details = self.get_dashboard_by_uid(uid)
+        if not details:
             return None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"검색 실패: {e}")
+        dashboard = details.get('dashboard') or {}
+        if dashboard.get(UPLOADER_HASH_FIELD) != upload_hash:
             return None
+        meta = details.get('meta') or {}
+        return {
+            "uid": uid,
+            "id": dashboard.get('id'),
+            "url": meta.get('url', ''),
+            "version": dashboard.get('version', meta.get('version')),
+            "status": "unchanged"
+        }
 
+    @tracing.traced(cat="grafana")
     def delete_dashboard(self, uid: str) -> bool:
         """
         UID로 대시보드를 삭제합니다.
         """
         try:
-            response = requests.delete(
-                f"{self.delete_endpoint}/{uid}",
-                headers=self.headers,
-                timeout=10
-            )
+            response = self._request("DELETE", f"{self.delete_endpoint}/{uid}")
             return response.status_code == 200
         except requests.exceptions.RequestException as e:
             print(f"Error during delete API request: {e}")
             return False
 
-    def _get_items_for_deletion(self, search_url: str, item_type: str) -> List[Dict[str, Any]]:
+    @tracing.traced(cat="grafana")
+    def delete_datasource(self, ds_id) -> Tuple[bool, str]:
         """
-        삭제할 항목(대시보드 또는 데이터 소스)의 목록을 가져옵니다.
+        ID로 데이터 소스를 삭제합니다. (성공 여부, 실패 사유)를 반환합니다.
         """
-        print(f"[{item_type}] 목록을 가져오는 중...")
+        # 데이터 소스 삭제 엔드포인트: /api/datasources/{id}
+        delete_ds_url = f"{self.datasource_endpoint}/{ds_id}"
+
         try:
-            response = requests.get(
-                search_url,
-                headers=self.headers,
-                timeout=10
-            )
+            response = self._request("DELETE", delete_ds_url)
             if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Error getting {item_type} list. Status: {response.status_code}, Response: {response.text}")
-                return []
+                self._remove_from_datasource_index(ds_id)
+                return True, ""
+            return False, f"Status: {response.status_code}, Response: {response.text}"
         except requests.exceptions.RequestException as e:
-            print(f"Error during GET API request for {item_type}: {e}")
-            return []
+            return False, f"Error: {e}"
 
-    def delete_all_dashboards(self) -> Tuple[bool, List[str]]:
+    def delete_all_dashboards(self, item_filter: Optional[DeleteFilter] = None,
+                              max_workers: int = bulk_delete.DEFAULT_DELETE_WORKERS,
+                              on_message: Optional[Callable[[str], None]] = None,
+                              cancel_event: Optional[threading.Event] = None) -> Tuple[bool, List[str]]:
         """
-        Grafana에 있는 모든 대시보드를 삭제합니다. (bool, List[str]) 반환
+        Grafana에 있는 대시보드를 모두(또는 item_filter 조건에 맞는 것만) 동시에 삭제합니다. (bool, List[str]) 반환
         - bool: 전체 작업 성공 여부
         - List[str]: 작업 로그 메시지 리스트
+        on_message(str)는 작업 로그 메시지가 생길 때마다(항목별 삭제 완료 포함) 호출됩니다.
+        cancel_event가 설정되면 새 삭제 요청을 보내지 않습니다.
         """
-        messages: List[str] = []
-        
-        search_url = f"{self.search_endpoint}?type=dash-db"
-        dashboards = self._get_items_for_deletion(search_url, "Dashboard")
-        
-        if not dashboards:
-            messages.append("삭제할 대시보드가 없습니다. (작업 성공)")
-            return True, messages
-        
-        messages.append(f"총 {len(dashboards)}개의 대시보드 삭제를 시작합니다.")
-        
-        success_count = 0
-        fail_count = 0
-        
-        for db in dashboards:
-            # 대시보드 검색 API 결과는 UID 필드를 가집니다.
-            uid = db.get('uid')
-            title = db.get('title')
-            
-            log_msg = f"  -> 대시보드 삭제 중: Title='{title}', UID='{uid}'"
-            
-            if not uid:
-                msg = f"경고: Title '{title}'의 UID가 없어 건너뜁니다."
-                messages.append(msg)
-                fail_count += 1
-                continue
-                
-            
-            # self.delete_endpoint는 대시보드 삭제 API의 기본 URL이어야 합니다.
-            if self.delete_dashboard(uid): 
-                messages.append(f"{log_msg} Success")
-                success_count += 1
-            else:
-                messages.append(f"{log_msg} Failed (delete_dashboard 함수 실패)")
-                fail_count += 1
-                
-        final_msg = f"\n대시보드 삭제 완료. 성공: {success_count}개, 실패: {fail_count}개."
-        messages.append(final_msg)
-        
-        overall_success = fail_count == 0
-        return overall_success, messages
+        return bulk_delete.delete_items(self, bulk_delete.DASHBOARD, item_filter, max_workers, on_message, cancel_event)
 
     # --------------------------------------------------------------------------------
 
-    def delete_all_datasources(self) -> Tuple[bool, List[str]]:
+    def delete_all_datasources(self, item_filter: Optional[DeleteFilter] = None,
+                               max_workers: int = bulk_delete.DEFAULT_DELETE_WORKERS,
+                               on_message: Optional[Callable[[str], None]] = None,
+                              cancel_event: Optional[threading.Event] = None) -> Tuple[bool, List[str]]:
         """
-        Grafana에 있는 모든 데이터 소스를 삭제합니다. (bool, List[str]) 반환
+        Grafana에 있는 데이터 소스를 모두(또는 item_filter 조건에 맞는 것만) 동시에 삭제합니다. (bool, List[str]) 반환
         - bool: 전체 작업 성공 여부
         - List[str]: 작업 로그 메시지 리스트
+        on_message(str)는 작업 로그 메시지가 생길 때마다(항목별 삭제 완료 포함) 호출됩니다.
+        cancel_event가 설정되면 새 삭제 요청을 보내지 않습니다.
         """
-        messages: List[str] = []
-        
-        # 데이터 소스 목록 API URL
-        search_url = self.datasource_endpoint
-        datasources = self._get_items_for_deletion(search_url, "Datasource")
-        
-        if not datasources:
-            messages.append("삭제할 데이터 소스가 없습니다. (작업 성공)")
-            return True, messages
-
-        messages.append(f"총 {len(datasources)}개의 데이터 소스 삭제를 시작합니다.")
-        
-        success_count = 0
-        fail_count = 0
-        
-        for ds in datasources:
-            # 데이터 소스 API 결과는 ID 필드를 가집니다.
-            ds_id = ds.get('id')
-            ds_name = ds.get('name')
-            
-            log_msg = f"  -> 데이터 소스 삭제 중: Name='{ds_name}', ID='{ds_id}'"
-            
-            if not ds_id:
-                msg = f"경고: Name '{ds_name}'의 ID가 없어 건너뜁니다."
-                messages.append(msg)
-                fail_count += 1
-                continue
-
-            # 데이터 소스 삭제 엔드포인트: /api/datasources/{id}
-            delete_ds_url = f"{self.datasource_endpoint}/{ds_id}" 
-            
-            try:
-                response = requests.delete(
-                    delete_ds_url,
-                    headers=self.headers,
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    messages.append(f"{log_msg} Success")
-                    success_count += 1
-                else:
-                    messages.append(f"{log_msg} Failed (Status: {response.status_code}, Response: {response.text})")
-                    fail_count += 1
-                    
-            except requests.exceptions.RequestException as e:
-                messages.append(f"{log_msg} Failed (Error: {e})")
-                fail_count += 1
-                
-        final_msg = f"\n데이터 소스 삭제 완료. 성공: {success_count}개, 실패: {fail_count}개."
-        messages.append(final_msg)
-        
-        overall_success = fail_count == 0
-        return overall_success, messages
+        return bulk_delete.delete_items(self, bulk_delete.DATASOURCE, item_filter, max_workers, on_message, cancel_event)
 
 
-    def post_dashboard(self, dashboard_data: dict, target_uid: str, start_time: str, end_time: str, overwrite=False):
+    @tracing.traced(cat="grafana")
+    def post_dashboard(self, dashboard_data, target_uid: str, start_time: str, end_time: str, overwrite=False,
+                       title: Optional[str] = None, dashboard_uid: Optional[str] = None, skip_unchanged: bool = False):
         """
         대시보드 데이터를 Grafana에 POST/PUT 합니다.
-        :param dashboard_data: 수정된 대시보드 JSON 딕셔너리
-        :param uid_placeholder: 데이터소스 UID 플레이스홀더 문자열
+        :param dashboard_data: DashboardTemplate (미리 파싱된 템플릿) 또는 대시보드 JSON 딕셔너리
         :param target_uid: 실제 데이터소스 UID
         :param start_time: 로그 분석 시작 시간 ('YYYY-MM-DD HH:MM:SS.sss' 형식)
         :param end_time: 로그 분석 종료 시간 ('YYYY-MM-DD HH:MM:SS.sss' 형식)
         :param overwrite: 덮어쓰기 여부 (True로 설정하여 안정적인 업데이트 유도)
+        :param title: 대시보드 제목 (None이면 템플릿 값 유지)
+        :param dashboard_uid: 대시보드 UID (None이면 템플릿 값 유지)
+        :param skip_unchanged: 서버의 같은 UID 대시보드에 저장된 내용 해시가 같으면 POST하지 않음
+                               (버전 기록이 늘지 않고, 열린 탭의 시간 깨짐도 생기지 않음)
         """
         try:
-            # UID 치환 (템플릿 변수 내에서만 치환)
-            content_str = json.dumps(dashboard_data)
-            content_str = content_str.replace("${DS_MARCUSOLSSON-CSV-DATASOURCE}", target_uid)
-            
             # Grafana 대시보드 시간 범위 설정 (KST ISO 8601로 변환하여 적용)
             start_iso = to_korea_iso8601(start_time)
             end_iso   = to_korea_iso8601(end_time)
-            
-            # JSON에서 시간 범위 설정: 이 부분이 1970년 문제의 핵심 해결책입니다.
-            # 대시보드 최상위 필드 'time' 및 'timeFrom', 'timeTo'를 UTC 시간으로 명시적으로 설정합니다.
-            dashboard_data = json.loads(content_str) # 치환된 문자열로 다시 파싱
-
-            # 대시보드 JSON의 시간 범위를 강제 설정
-            if 'dashboard' in dashboard_data:
-                db = dashboard_data['dashboard']
-            else: # 기존 대시보드 JSON이 최상위 레벨에 dashboard 키를 포함하지 않는 경우를 대비
-                 db = dashboard_data
-
-            db['time']['from'] = start_iso
-            db['time']['to'] = end_iso
-            db['timeFrom'] = start_iso
-            db['timeTo'] = end_iso
-            #db['timezone'] = 'utc' # kst임!!!
-            
-            db['refresh'] = False
-            
-            
+
+            if isinstance(dashboard_data, DashboardTemplate):
+                # 미리 찾아 둔 경로만 치환 (템플릿은 수정하지 않고, 바뀌는 부분만 복사)
+                rendered = dashboard_data.render(
+                    {DS_PLACEHOLDER: target_uid},
+                    title=title,
+                    uid=dashboard_uid,
+                    start_iso=start_iso,
+                    end_iso=end_iso
+                )
+                db = rendered['dashboard'] if 'dashboard' in rendered else rendered
+            else:
+                # UID 치환 (템플릿 변수 내에서만 치환)
+                content_str = json.dumps(dashboard_data)
+                content_str = content_str.replace(DS_PLACEHOLDER, target_uid)
+
+                # JSON에서 시간 범위 설정: 이 부분이 1970년 문제의 핵심 해결책입니다.
+                # 대시보드 최상위 필드 'time' 및 'timeFrom', 'timeTo'를 UTC 시간으로 명시적으로 설정합니다.
+                dashboard_data = json.loads(content_str) # 치환된 문자열로 다시 파싱
+
+                # 대시보드 JSON의 시간 범위를 강제 설정
+                if 'dashboard' in dashboard_data:
+                    db = dashboard_data['dashboard']
+                else: # 기존 대시보드 JSON이 최상위 레벨에 dashboard 키를 포함하지 않는 경우를 대비
+                     db = dashboard_data
+
+                if title is not None:
+                    db['title'] = title
+                if dashboard_uid is not None:
+                    db['uid'] = dashboard_uid
+                db['time']['from'] = start_iso
+                db['time']['to'] = end_iso
+                db['timeFrom'] = start_iso
+                db['timeTo'] = end_iso
+                #db['timezone'] = 'utc' # kst임!!!
+
+                db['refresh'] = False
+
+            # 내용 해시 저장 (다음 업로드 때 비교)
+            upload_hash = content_hash(db)
+            db[UPLOADER_HASH_FIELD] = upload_hash
+
+            if skip_unchanged and db.get('uid'):
+                unchanged = self._find_unchanged_dashboard(db['uid'], upload_hash)
+                if unchanged is not None:
+                    result_message = "변경 사항 없음, 업로드 생략 (success)\n"
+                    result_message += f"대시보드 UID: {unchanged.get('uid')}\n"
+                    result_message += f"버전: {unchanged.get('version')}\n"
+                    result_message += f"대시보드 범위: {start_iso} ~ {end_iso}"
+                    return result_message, unchanged
+
             # API 요청 페이로드 준비
             payload = {
                 "dashboard": db,
@@ -430,12 +581,7 @@ class GrafanaAPI:
                 "overwrite": overwrite
             }
 
-            response = requests.post(
-                self.dashboard_endpoint,
-                headers=self.headers,
-                json=payload,
-                timeout=10
-            )
+            response = self._request("POST", self.dashboard_endpoint, json=payload)
             
             response_json = response.json()
             
@@ -443,7 +589,7 @@ class GrafanaAPI:
                 result_message = "POST success !!!\n"
                 result_message += f"대시보드 UID: {response_json.get('uid')}\n"
                 result_message += f"버전: {response_json.get('version')}\n"
-                result_message += f"Grafana 설정 시간대: KST\n"
+                result_message += "Grafana 설정 시간대: KST\n"
                 result_message += f"대시보드 범위: {start_iso} ~ {end_iso}"
                 
                 return result_message, response_json
@@ -1,8 +1,17 @@
 import os
 import csv
+import time as _time
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from enum import IntEnum
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, Optional, Dict, Tuple, Iterable, Iterator
+
+import util
+import tracing
 
 # --- 상수 및 열거형 정의 ---
 
@@ -51,6 +60,37 @@ MODE_TABLE: Dict[GrSections, str] = {
 
 STR_TO_ENUM: Dict[str, GrSections] = {v: k for k, v in MODE_TABLE.items()}
 
+# 병렬 분석 기준: 이보다 작은 파일은 단일 프로세스로 분석 (프로세스 기동 비용이 더 큼)
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+PARALLEL_MIN_CHUNK_BYTES = 4 * 1024 * 1024
+
+# 진행 상황 / 취소 확인 간격 (읽은 바이트 기준)
+PROGRESS_INTERVAL_BYTES = 1024 * 1024
+
+# 진행 상황 알림 최소 간격 (초). 확인은 바이트 간격마다 하지만 콜백은 이 시간이 지났을 때만 호출
+PROGRESS_MIN_INTERVAL_SEC = 0.25
+
+# 섹션/area 문자열 캐시 최대 크기 (비정상 값이 계속 들어와도 메모리가 늘지 않도록)
+_LOOKUP_CACHE_SIZE = 1024
+
+
+def _parse_area(area_raw: str) -> Tuple[Optional[int], GPS_AREA]:
+    """
+    area 열 문자열을 (area 정수값, GPS_AREA)로 변환합니다.
+    값이 비어있거나 정수가 아니면 정수값은 None (이전 값 유지)이고,
+    정수지만 GPS_AREA에 없는 값이면 GPS_UNKNOWN과 함께 정수값을 돌려줍니다.
+    """
+    if not area_raw.strip():
+        return None, GPS_AREA.GPS_UNKNOWN
+    try:
+        area_int = int(area_raw)
+    except ValueError:
+        return None, GPS_AREA.GPS_UNKNOWN
+    try:
+        return area_int, GPS_AREA(area_int)
+    except ValueError:
+        return area_int, GPS_AREA.GPS_UNKNOWN
+
 # --- 데이터 구조체 (UI 사용을 위한 로그 엔트리) ---
 
 @dataclass
@@ -65,6 +105,297 @@ class LogEntry:
     area_id: Optional[GPS_AREA] = None  # 해당 시점의 GPS_AREA (UI 표시용)
     section_id: Optional[GrSections] = None # 해당 시점의 GrSections (UI 표시용)
 
+# --- 배열 기반 저장소 (섹션 변경이 많은 로그에서도 메모리를 적게 쓰기 위함) ---
+
+# uint8 코드에서 값이 없음(None) / uint8 범위를 벗어난 값을 나타내는 코드
+_CODE_NONE = 255
+_CODE_OVERFLOW = 254
+
+
+def _to_area_value(code: int):
+    """
+    area 정수값을 GPS_AREA로 되돌립니다. (GPS_AREA에 없는 값은 정수 그대로)
+    """
+    try:
+        return GPS_AREA(code)
+    except ValueError:
+        return code
+
+
+class TimeColumn:
+    """
+    'YYYY-MM-DD HH:MM:SS.sss' 시간 문자열을 int64 epoch 밀리초 배열로 저장합니다.
+    형식이 달라 그대로 복원할 수 없는 문자열은 인덱스별로 따로 보관합니다.
+    """
+    def __init__(self):
+        self.ms = array('q')
+        self._raw: Dict[int, str] = {}
+
+    def append(self, time: str):
+        ms = util.time_str_to_ms(time)
+        if ms is None or util.ms_to_time_str(ms) != time:
+            self._raw[len(self.ms)] = time
+            ms = 0
+        self.ms.append(ms)
+
+    def ms_at(self, index: int) -> Optional[int]:
+        """
+        epoch 밀리초를 반환합니다. 밀리초로 변환할 수 없었던 시간이면 None.
+        """
+        return None if index in self._raw else self.ms[index]
+
+    def get(self, index: int) -> str:
+        raw = self._raw.get(index)
+        if raw is not None:
+            return raw
+        return util.ms_to_time_str(self.ms[index])
+
+    def truncate(self, length: int):
+        del self.ms[length:]
+        self._raw = {i: raw for i, raw in self._raw.items() if i < length}
+
+    def to_payload(self) -> tuple:
+        return self.ms.tobytes(), self._raw
+
+    @classmethod
+    def from_payload(cls, payload: tuple) -> "TimeColumn":
+        column = cls()
+        column.ms.frombytes(payload[0])
+        column._raw = dict(payload[1])
+        return column
+
+
+def _truncate_index(obj, key) -> int:
+    """
+    del obj[n:] 형태의 뒤쪽 잘라내기만 지원합니다. (분석기에서 사용하는 형태)
+    """
+    if isinstance(key, slice) and key.stop is None and key.step in (None, 1):
+        start = key.start or 0
+        if start < 0:
+            start = max(0, len(obj) + start)
+        return start
+    raise TypeError("뒤쪽 구간 삭제(del seq[n:])만 지원합니다.")
+
+
+class LogTable(Sequence):
+    """
+    AnalysisResult.logs의 배열 기반 표현 (struct-of-arrays).
+    시간은 int64 epoch 밀리초, 섹션/area/로그 유형은 uint8 코드, context 문자열은 인턴 테이블 인덱스로 저장합니다.
+    인덱스 접근/순회 시 LogEntry 객체를 그때그때 만들어 돌려주므로 기존 list[LogEntry]처럼 사용할 수 있습니다.
+    """
+    def __init__(self, entries: Iterable[LogEntry] = ()):
+        self.times = TimeColumn()
+        self.context_ids = array('I')
+        self.type_codes = array('B')
+        self.area_codes = array('B')
+        self.section_codes = array('B')
+
+        self._strings: List[str] = []          # context 문자열 인턴 테이블
+        self._string_ids: Dict[str, int] = {}
+        self._types: List[str] = []            # 로그 유형 테이블
+        self._area_overflow: Dict[int, int] = {}
+
+        for entry in entries:
+            self.append(entry)
+
+    def _intern(self, text: str) -> int:
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(text)
+            self._string_ids[text] = string_id
+        return string_id
+
+    def _type_code(self, log_type: str) -> int:
+        try:
+            return self._types.index(log_type)
+        except ValueError:
+            if len(self._types) >= _CODE_OVERFLOW:
+                raise ValueError("로그 유형 종류가 너무 많습니다.")
+            self._types.append(log_type)
+            return len(self._types) - 1
+
+    def add(self, time: str, context: str, log_type: str, area_id: Optional[int] = None, section_id: Optional[GrSections] = None):
+        """
+        LogEntry 객체를 만들지 않고 한 항목을 추가합니다.
+        """
+        index = len(self.type_codes)
+        self.times.append(time)
+        self.context_ids.append(self._intern(context))
+        self.type_codes.append(self._type_code(log_type))
+
+        if area_id is None:
+            self.area_codes.append(_CODE_NONE)
+        elif 0 <= area_id < _CODE_OVERFLOW:
+            self.area_codes.append(int(area_id))
+        else:
+            self.area_codes.append(_CODE_OVERFLOW)
+            self._area_overflow[index] = int(area_id)
+
+        self.section_codes.append(_CODE_NONE if section_id is None else int(section_id))
+
+    def append(self, entry: LogEntry):
+        self.add(entry.time, entry.context, entry.log_type, entry.area_id, entry.section_id)
+
+    def extend(self, entries: Iterable[LogEntry]):
+        for entry in entries:
+            self.append(entry)
+
+    def area_at(self, index: int):
+        code = self.area_codes[index]
+        if code == _CODE_NONE:
+            return None
+        if code == _CODE_OVERFLOW:
+            return _to_area_value(self._area_overflow[index])
+        return _to_area_value(code)
+
+    def section_at(self, index: int) -> Optional[GrSections]:
+        code = self.section_codes[index]
+        return None if code == _CODE_NONE else GrSections(code)
+
+    def context_at(self, index: int) -> str:
+        return self._strings[self.context_ids[index]]
+
+    def log_type_at(self, index: int) -> str:
+        return self._types[self.type_codes[index]]
+
+    def rows_of_type(self, log_type: str) -> array:
+        """
+        log_type 항목의 행 번호 배열 (uint8 코드 배열을 바이트 검색하므로 항목이 많아도 빠름)
+        """
+        rows = array('I')
+        if log_type not in self._types:
+            return rows
+        code = bytes((self._types.index(log_type),))
+        data = self.type_codes.tobytes()
+        pos = data.find(code)
+        while pos >= 0:
+            rows.append(pos)
+            pos = data.find(code, pos + 1)
+        return rows
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LogTable index out of range")
+        return LogEntry(
+            time=self.times.get(index),
+            context=self._strings[self.context_ids[index]],
+            log_type=self._types[self.type_codes[index]],
+            area_id=self.area_at(index),
+            section_id=self.section_at(index)
+        )
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __delitem__(self, key):
+        start = _truncate_index(self, key)
+        self.times.truncate(start)
+        del self.context_ids[start:]
+        del self.type_codes[start:]
+        del self.area_codes[start:]
+        del self.section_codes[start:]
+        self._area_overflow = {i: v for i, v in self._area_overflow.items() if i < start}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"LogTable({len(self)} entries)"
+
+    def to_payload(self) -> tuple:
+        """
+        기본 타입(bytes, list, dict)만으로 구성된 직렬화용 튜플을 반환합니다.
+        """
+        return (
+            self.times.to_payload(),
+            self.context_ids.tobytes(), self.type_codes.tobytes(),
+            self.area_codes.tobytes(), self.section_codes.tobytes(),
+            self._strings, self._types, self._area_overflow
+        )
+
+    @classmethod
+    def from_payload(cls, payload: tuple) -> "LogTable":
+        times, context_ids, type_codes, area_codes, section_codes, strings, types, area_overflow = payload
+        table = cls()
+        table.times = TimeColumn.from_payload(times)
+        table.context_ids.frombytes(context_ids)
+        table.type_codes.frombytes(type_codes)
+        table.area_codes.frombytes(area_codes)
+        table.section_codes.frombytes(section_codes)
+        table._strings = list(strings)
+        table._string_ids = {text: i for i, text in enumerate(table._strings)}
+        table._types = list(types)
+        table._area_overflow = dict(area_overflow)
+        return table
+
+
+class SectionChangeList(Sequence):
+    """
+    레이스 하나의 섹션 변경 기록 [(GrSections, 시간 문자열), ...]의 배열 기반 표현.
+    섹션은 uint8 코드, 시간은 int64 epoch 밀리초로 저장하고 접근 시 튜플로 돌려줍니다.
+    """
+    def __init__(self, changes: Iterable[Tuple[GrSections, str]] = ()):
+        self.times = TimeColumn()
+        self.section_codes = array('B')
+        for change in changes:
+            self.append(change)
+
+    def append(self, change: Tuple[GrSections, str]):
+        section_id, time = change
+        self.section_codes.append(int(section_id))
+        self.times.append(time)
+
+    def __len__(self) -> int:
+        return len(self.section_codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SectionChangeList index out of range")
+        return GrSections(self.section_codes[index]), self.times.get(index)
+
+    def __iter__(self) -> Iterator[Tuple[GrSections, str]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __delitem__(self, key):
+        start = _truncate_index(self, key)
+        del self.section_codes[start:]
+        self.times.truncate(start)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return all(a == tuple(b) for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"SectionChangeList({list(self)!r})"
+
+    def to_payload(self) -> tuple:
+        return self.times.to_payload(), self.section_codes.tobytes()
+
+    @classmethod
+    def from_payload(cls, payload: tuple) -> "SectionChangeList":
+        changes = cls()
+        changes.times = TimeColumn.from_payload(payload[0])
+        changes.section_codes.frombytes(payload[1])
+        return changes
+
+
 @dataclass
 class AnalysisResult:
     """
@@ -73,36 +404,575 @@ class AnalysisResult:
     first_time: Optional[str] = None
     last_time: Optional[str] = None
     total_race_count: int = 0
-    logs: List[LogEntry] = field(default_factory=list)
+    logs: LogTable = field(default_factory=LogTable)
     race_times: Dict[int, Dict[str, Optional[str]]] = field(default_factory=dict)
     
     # 섹션 변경 시점의 시간을 기록
     # {race_num: [(section_id_1, time_1), (section_id_2, time_2), ...]}
     # 레이스별 섹션 변경 이벤트(섹션 ID와 시간)를 시간 순서대로 저장
-    race_section_changes: Dict[int, List[Tuple[GrSections, str]]] = field(default_factory=dict)
+    race_section_changes: Dict[int, SectionChangeList] = field(default_factory=dict)
+
+    # 원본 CSV의 시간 → 바이트 위치 희소 인덱스 (구간 추출용)
+    row_index: Optional["RowOffsetIndex"] = field(default=None, compare=False)
+
+class TimeIndex:
+    """
+    섹션 변경과 레이스 경계를 epoch 밀리초로 정렬해 둔 시간 인덱스.
+    시간 문자열을 다시 파싱하지 않고 bisect로 O(log n) 조회합니다.
+    (특정 시각의 섹션, 특정 시각이 속한 레이스, 구간 내 섹션 변경 목록)
+    밀리초로 변환할 수 없는 시간 문자열을 가진 항목은 인덱스에서 제외됩니다.
+    """
+    def __init__(self):
+        self.change_ms = array('q')
+        self.change_sections = array('B')
+        self.change_races = array('i')
+
+        self.race_nums = array('i')
+        self.race_start_ms = array('q')
+        self.race_end_ms = array('q')
+
+    @classmethod
+    def from_result(cls, result: AnalysisResult) -> "TimeIndex":
+        index = cls()
+
+        changes: List[Tuple[int, int, int]] = []
+        for race_num, change_list in sorted(result.race_section_changes.items()):
+            if not isinstance(change_list, SectionChangeList):
+                change_list = SectionChangeList(change_list)
+            for i, code in enumerate(change_list.section_codes):
+                ms = change_list.times.ms_at(i)
+                if ms is not None:
+                    changes.append((ms, race_num, code))
+
+        # 로그 시간이 역행한 경우에만 정렬 (같은 시각이면 기록 순서 유지)
+        if any(changes[i][0] > changes[i + 1][0] for i in range(len(changes) - 1)):
+            changes.sort(key=lambda change: change[0])
+
+        for ms, race_num, code in changes:
+            index.change_ms.append(ms)
+            index.change_races.append(race_num)
+            index.change_sections.append(code)
+
+        races = []
+        for race_num, times in result.race_times.items():
+            start_ms = util.time_str_to_ms(times.get("start") or "")
+            end_ms = util.time_str_to_ms(times.get("end") or "")
+            if start_ms is not None:
+                races.append((start_ms, race_num, end_ms if end_ms is not None else start_ms))
+        races.sort()
+
+        for start_ms, race_num, end_ms in races:
+            index.race_nums.append(race_num)
+            index.race_start_ms.append(start_ms)
+            index.race_end_ms.append(end_ms)
+
+        return index
+
+    @staticmethod
+    def to_ms(t) -> Optional[int]:
+        """
+        시간 문자열('YYYY-MM-DD HH:MM:SS.sss') 또는 epoch 밀리초를 밀리초로 변환합니다.
+        """
+        if isinstance(t, int):
+            return t
+        return util.time_str_to_ms(t) if t else None
+
+    def section_at(self, t) -> Optional[GrSections]:
+        """
+        시각 t에 활성화되어 있던 섹션을 반환합니다. (t 이전 기록이 없으면 None)
+        """
+        ms = self.to_ms(t)
+        if ms is None:
+            return None
+        i = bisect_right(self.change_ms, ms) - 1
+        return GrSections(self.change_sections[i]) if i >= 0 else None
+
+    def race_at(self, t) -> Optional[int]:
+        """
+        시각 t가 속한 레이스 번호를 반환합니다. (경계 시각은 새로 시작하는 레이스에 속함)
+        """
+        ms = self.to_ms(t)
+        if ms is None:
+            return None
+        i = bisect_right(self.race_start_ms, ms) - 1
+        if i >= 0 and ms <= self.race_end_ms[i]:
+            return self.race_nums[i]
+        return None
+
+    def transitions_between(self, t0, t1) -> List[Tuple[int, GrSections, str]]:
+        """
+        [t0, t1] 구간의 섹션 변경 기록을 (레이스 번호, 섹션, 시간 문자열) 리스트로 반환합니다.
+        """
+        ms0, ms1 = self.to_ms(t0), self.to_ms(t1)
+        if ms0 is None or ms1 is None:
+            return []
+        lo = bisect_left(self.change_ms, ms0)
+        hi = bisect_right(self.change_ms, ms1)
+        return [
+            (self.change_races[i], GrSections(self.change_sections[i]), util.ms_to_time_str(self.change_ms[i]))
+            for i in range(lo, hi)
+        ]
+
+
+@dataclass(frozen=True)
+class ColumnProjection:
+    """
+    헤더에서 한 번만 계산한 분석용 열 인덱스 (time, section, area).
+    """
+    time_index: int
+    section_index: int
+    area_index: Optional[int] = None
+
+    @classmethod
+    def from_header(cls, fieldnames: List[str]) -> "ColumnProjection":
+        """
+        공백을 제거한 헤더 목록에서 필요한 열의 위치를 찾습니다.
+        """
+        names = [name.strip() for name in fieldnames]
+        lowered = [name.lower() for name in names]
+
+        if "section" not in lowered:
+            raise KeyError("CSV에 'section' 열이 없습니다.")
+        if "time" not in names:
+            raise KeyError("CSV에 'time' 열이 없습니다.")
+
+        return cls(
+            time_index=names.index("time"),
+            section_index=lowered.index("section"),
+            area_index=lowered.index("area") if "area" in lowered else None
+        )
+
+    @property
+    def max_index(self) -> int:
+        """
+        사용하는 열 중 가장 뒤에 있는 열의 인덱스.
+        """
+        return max(self.time_index, self.section_index, -1 if self.area_index is None else self.area_index)
+
+# 시간 → 바이트 위치 인덱스 샘플 간격 (이 간격마다 한 행의 위치를 기록)
+ROW_INDEX_INTERVAL_BYTES = 1024 * 1024
+
+
+def _line_time_str(line: str, time_index: int) -> Optional[str]:
+    """
+    CSV 한 줄에서 time 열 문자열만 꺼냅니다.
+    """
+    if '"' in line:
+        row = next(csv.reader((line,)), None)
+    else:
+        row = line.split(",", time_index + 1)
+    if not row or len(row) <= time_index:
+        return None
+    return row[time_index].strip()
+
+
+class RowOffsetIndex:
+    """
+    분석하면서 기록하는 희소 시간 → 바이트 위치 인덱스.
+    약 ROW_INDEX_INTERVAL_BYTES마다 한 행의 (epoch 밀리초, 줄 시작 위치)를 저장하여
+    원본 CSV에서 특정 시간 구간의 행으로 바로 이동(seek)할 수 있게 합니다.
+    시간이 역행하는 로그면 monotonic이 False가 되고 seek_offset은 데이터 시작 위치를 돌려줍니다.
+    """
+    def __init__(self, time_column: int = 0, data_start: int = 0, interval: int = ROW_INDEX_INTERVAL_BYTES):
+        self.time_column = time_column
+        self.data_start = data_start
+        self.interval = interval
+        self.monotonic = True
+        self.time_ms = array('q')
+        self.offsets = array('q')
+        self._next_offset = data_start
+
+    def add(self, ms: int, offset: int):
+        """
+        샘플 하나를 추가합니다. (위치는 증가하는 순서로만 추가)
+        """
+        if self.offsets and offset <= self.offsets[-1]:
+            return
+        if self.time_ms and ms < self.time_ms[-1]:
+            self.monotonic = False
+        self.time_ms.append(ms)
+        self.offsets.append(offset)
+
+    def add_line(self, offset: int, line: str):
+        """
+        줄 시작 위치가 다음 샘플 위치를 지났으면 해당 줄의 시간을 파싱하여 기록합니다.
+        """
+        if offset < self._next_offset:
+            return
+        ms = util.time_str_to_ms(_line_time_str(line, self.time_column) or "")
+        if ms is not None:
+            self.add(ms, offset)
+            self._next_offset = offset + self.interval
+
+    def extend(self, other: "RowOffsetIndex"):
+        """
+        뒤쪽 구간의 인덱스를 이어 붙입니다. (병렬 분석 결과 병합용)
+        """
+        if not other.monotonic:
+            self.monotonic = False
+        for ms, offset in zip(other.time_ms, other.offsets):
+            self.add(ms, offset)
+        self._next_offset = max(self._next_offset, other._next_offset)
+
+    def seek_offset(self, t) -> int:
+        """
+        시각 t 이전에 시작하는 가장 가까운 샘플 행의 바이트 위치를 반환합니다.
+        """
+        ms = TimeIndex.to_ms(t)
+        if ms is None or not self.monotonic:
+            return self.data_start
+        i = bisect_left(self.time_ms, ms) - 1
+        return self.offsets[i] if i >= 0 else self.data_start
+
+    def to_payload(self) -> tuple:
+        return (self.time_column, self.data_start, self.interval, self.monotonic,
+                self.time_ms.tobytes(), self.offsets.tobytes(), self._next_offset)
+
+    @classmethod
+    def from_payload(cls, payload: tuple) -> "RowOffsetIndex":
+        time_column, data_start, interval, monotonic, time_ms, offsets, next_offset = payload
+        index = cls(time_column, data_start, interval)
+        index.monotonic = monotonic
+        index.time_ms.frombytes(time_ms)
+        index.offsets.frombytes(offsets)
+        index._next_offset = next_offset
+        return index
+
+
+# 섹션이 바뀌는 행 이벤트: (구간 내 행 번호, 시간, 섹션, 해당 행의 GPS_AREA, 그 시점까지 파싱된 area 정수값)
+SectionEvent = Tuple[int, str, GrSections, GPS_AREA, Optional[int]]
+
+
+class AnalysisCancelled(Exception):
+    """
+    cancel_event로 분석이 취소되었을 때 발생합니다. (분석 상태가 불완전하므로 분석기를 다시 만들어야 함)
+    """
+
+
+@dataclass
+class AnalysisProgress:
+    """
+    분석 진행 상황. total_bytes가 0이면 전체 크기를 알 수 없음 (압축 파일은 압축을 푼 바이트 기준)
+    rows는 이번 호출에서 분석한 데이터 행 수, section_changes, races는 그때까지 찾은 섹션 변경 수 / 레이스 수 (Race 0 포함)
+    done은 마지막 알림 여부
+    """
+    bytes_done: int
+    total_bytes: int
+    rows: int
+    elapsed_sec: float
+    section_changes: int = 0
+    races: int = 0
+    done: bool = False
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes_done / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        return min(1.0, self.bytes_done / self.total_bytes) if self.total_bytes > 0 else None
+
+
+ProgressCallback = Callable[[AnalysisProgress], None]
+
+
+@dataclass
+class AnalysisSummary:
+    """
+    analyze / analyze_incremental 한 번의 측정 결과.
+    - bytes_read, rows: 이번 호출에서 읽은 바이트 / 데이터 행 수 (헤더, 빈 줄 제외, 이어서 분석하면 추가된 부분만)
+    - wall_sec: 호출 전체 시간, parse_sec: 파일을 읽고 파싱한 시간 (병렬 분석 포함)
+    - peak_rss_bytes: 프로세스 최대 메모리 (병렬 분석 프로세스 제외, 측정할 수 없으면 None)
+    """
+    csv_path: str
+    bytes_read: int
+    rows: int
+    section_changes: int
+    races: int
+    wall_sec: float
+    parse_sec: float
+    peak_rss_bytes: Optional[int] = None
+    workers: int = 1
+    incremental: bool = False
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.parse_sec if self.parse_sec > 0 else 0.0
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes_read / self.parse_sec if self.parse_sec > 0 else 0.0
+
+    def format(self) -> str:
+        mb = 1024 * 1024
+        peak = f"{self.peak_rss_bytes / mb:,.1f} MB" if self.peak_rss_bytes is not None else "N/A"
+        return (
+            f"분석 요약: {self.bytes_read / mb:,.1f} MB, {self.rows:,} 행, "
+            f"섹션 변경 {self.section_changes:,}개, 레이스 {self.races}개 | "
+            f"전체 {self.wall_sec:.2f}초, 파싱 {self.parse_sec:.2f}초 "
+            f"({self.rows_per_sec:,.0f} 행/s, {self.bytes_per_sec / mb:,.1f} MB/s) | 최대 메모리 {peak}"
+        )
+
+
+@dataclass
+class ChunkScan:
+    """
+    연속된 행 구간을 훑은 결과.
+    섹션이 바뀌는 행만 이벤트로 남기고, 구간 끝의 상태를 함께 보관합니다.
+    area 정수값이 None이면 구간 안에서 아직 파싱된 값이 없다는 의미(이전 구간 값 유지)입니다.
+    """
+    events: List[SectionEvent] = field(default_factory=list)
+    row_count: int = 0
+    last_time: Optional[str] = None
+    last_area_id: Optional[GPS_AREA] = None
+    last_area_int: Optional[int] = None
+    row_offsets: Optional[RowOffsetIndex] = None
+
+
+def _scan_lines(lines, projection: ColumnProjection, prev_section: Optional[GrSections],
+                section_cache: Dict[str, GrSections], area_cache: Dict[str, Tuple[Optional[int], GPS_AREA]]) -> ChunkScan:
+    """
+    디코딩된 줄들을 파싱하여 ChunkScan을 만듭니다. (분석 hot loop)
+    행 전체를 dict로 만들지 않고 time/section/area 열만 인덱스로 꺼내며 (따옴표가 포함된 행만 csv 모듈로 파싱),
+    직전 행과 섹션이 같은 행은 상태만 갱신하고 넘어갑니다.
+    prev_section이 None이면 구간의 첫 행은 항상 이벤트로 기록됩니다.
+    """
+    time_idx = projection.time_index
+    section_idx = projection.section_index
+    area_idx = projection.area_index
+    maxsplit = projection.max_index + 1
+
+    scan = ChunkScan()
+    events = scan.events
+    area_int = None
+    row_count = 0
+    time = None
+    current_area_id = None
+
+    for line in lines:
+        # 따옴표가 없는 행은 필요한 열까지만 잘라서 사용 (나머지 열은 분리하지 않음)
+        if '"' in line:
+            row = next(csv.reader((line,)), None)
+        else:
+            row = line.split(",", maxsplit)
+
+        if not row or (len(row) == 1 and not row[0].strip()):
+            continue # 빈 줄
+        if len(row) < maxsplit:
+            continue # 필요한 열까지 없는 행 (기록 도중 잘린 행 등)
+
+        time = row[time_idx]
+
+        # 1. 섹션 및 영역 ID 파싱 (원본 문자열 기준으로 캐시)
+        section_raw = row[section_idx]
+        section_id = section_cache.get(section_raw)
+        if section_id is None:
+            section_id = STR_TO_ENUM.get(section_raw.strip(), GrSections.SECTION_UNKNOWN)
+            if len(section_cache) < _LOOKUP_CACHE_SIZE:
+                section_cache[section_raw] = section_id
+
+        if area_idx is None:
+            current_area_id = GPS_AREA.GPS_UNKNOWN
+        else:
+            area_raw = row[area_idx]
+            parsed = area_cache.get(area_raw)
+            if parsed is None:
+                parsed = _parse_area(area_raw)
+                if len(area_cache) < _LOOKUP_CACHE_SIZE:
+                    area_cache[area_raw] = parsed
+            if parsed[0] is not None:
+                area_int = parsed[0]
+            current_area_id = parsed[1]
+
+        # 섹션 변화가 없는 행은 기록할 이벤트가 없음
+        if section_id != prev_section:
+            events.append((row_count, time.strip(), section_id, current_area_id, area_int))
+            prev_section = section_id
+        row_count += 1
+
+    scan.row_count = row_count
+    scan.last_area_int = area_int
+    scan.last_area_id = current_area_id
+    if time is not None:
+        scan.last_time = time.strip()
+    return scan
+
+
+def _iter_range(f, length: int, row_offsets: RowOffsetIndex):
+    """
+    현재 위치부터 length 바이트 안의 줄들을 디코딩하여 돌려줍니다. (개행 경계에 맞춘 구간)
+    """
+    offset = f.tell()
+    remaining = length
+    while remaining > 0:
+        raw = f.readline(remaining)
+        if not raw:
+            break
+        remaining -= len(raw)
+        line = raw.decode("utf-8")
+        row_offsets.add_line(offset, line)
+        offset += len(raw)
+        yield line
+
+
+def _scan_chunk(csv_path: str, start: int, end: int, projection: ColumnProjection) -> ChunkScan:
+    """
+    프로세스 풀 작업 함수: [start, end) 바이트 구간을 독립적으로 훑습니다.
+    이전 구간의 섹션을 모르므로 구간의 첫 행은 항상 이벤트로 남기고, 이어 붙이는 단계에서 정리합니다.
+    """
+    row_offsets = RowOffsetIndex(projection.time_index, start)
+    with open(csv_path, "rb") as f:
+        f.seek(start)
+        scan = _scan_lines(_iter_range(f, end - start, row_offsets), projection, None, {}, {})
+    scan.row_offsets = row_offsets
+    return scan
 
 # --- 메인 분석 클래스 ---
 class LogAnalyzer:
-    def __init__(self):
+    def __init__(self, progress_interval_sec: float = PROGRESS_MIN_INTERVAL_SEC):
         """
         분석기 초기화.
+        progress_interval_sec: 진행 상황 콜백의 최소 호출 간격 (초)
         """
         self.result = AnalysisResult()
         self._prev_area: Optional[GPS_AREA] = None
         self._prev_section: Optional[GrSections] = None
         self._race_count: int = 0
 
-    def _add_log(self, time: str, context: str, log_type: str, area_id: Optional[GPS_AREA] = None, section_id: Optional[GrSections] = None):
+        # 행 단위 상태 (마지막으로 파싱된 area 값과 시간)
+        self._area_int: Optional[int] = None
+        self._last_time: str = ""
+        self._row_count: int = 0
+
+        # 이어서 분석(tail 모드)을 위한 상태
+        self._csv_path: Optional[str] = None
+        self._file_id: Optional[Tuple[int, int, int]] = None
+        self._offset: int = 0            # 마지막으로 읽은 바이트 위치 (보류한 줄이 있으면 그 줄의 시작)
+        self._pending_len: int = 0       # 아직 개행이 오지 않아 읽지 않은 마지막 줄의 길이
+        self._partial_consumed: bool = False # analyze에서 개행 전의 마지막 줄까지 분석함 (이어서 분석 불가)
+        self._fieldnames: Optional[List[str]] = None
+        self._projection: Optional[ColumnProjection] = None
+        self._final_marks: Optional[Tuple[int, int, Optional[int]]] = None
+
+        # 원본 문자열 → 파싱 결과 캐시 (섹션/area 값의 종류는 몇 개 되지 않음)
+        self._section_cache: Dict[str, GrSections] = {}
+        self._area_cache: Dict[str, Tuple[Optional[int], GPS_AREA]] = {}
+
+        # 진행 상황 알림 / 취소 (analyze 호출 동안만 설정)
+        self._progress: Optional[ProgressCallback] = None
+        self._cancel_event: Optional[threading.Event] = None
+        self._next_report: float = float("inf")
+        self._start_offset: int = 0
+        self._start_rows: int = 0
+        self._total_bytes: int = 0
+        self._started_at: float = 0.0
+        self._last_report_at: float = 0.0
+        self._parse_sec: float = 0.0
+        self.progress_interval_sec = progress_interval_sec
+
+        # 마지막 analyze / analyze_incremental 호출의 측정 결과
+        self.last_summary: Optional[AnalysisSummary] = None
+
+    def _begin_run(self, csv_path: str, progress: Optional[ProgressCallback], cancel_event: Optional[threading.Event]):
+        """
+        분석 호출 시작: 진행 상황 알림과 취소 확인을 설정합니다. (둘 다 없으면 hot loop에서 확인하지 않음)
         """
-        AnalysisResult의 logs 리스트에 LogEntry를 추가합니다.
+        self._progress = progress
+        self._cancel_event = cancel_event
+        self._start_offset = self._offset
+        self._start_rows = self._row_count
+        self._total_bytes = 0 if util.is_compressed_path(csv_path) else os.path.getsize(csv_path)
+        self._started_at = self._last_report_at = _time.perf_counter()
+        self._parse_sec = 0.0
+        self.last_summary = None
+        self._next_report = self._offset + PROGRESS_INTERVAL_BYTES if (progress or cancel_event) else float("inf")
+
+    def _end_run(self, csv_path: str, workers: Optional[int], incremental: bool, completed: bool):
+        """
+        분석 호출 종료: 마지막 진행 상황을 알리고, 끝까지 분석했으면 last_summary를 기록합니다.
+        """
+        if self._progress is not None:
+            self._report_progress(check_cancel=False, final=True) # 마지막 진행 상황 (100%)
+        self._progress = None
+        self._cancel_event = None
+        self._next_report = float("inf")
+
+        tracing.annotate(
+            csv_path=csv_path, bytes_read=self._offset - self._start_offset, rows=self._row_count - self._start_rows,
+            incremental=incremental, completed=completed
+        )
+        if completed:
+            self.last_summary = AnalysisSummary(
+                csv_path=csv_path,
+                bytes_read=self._offset - self._start_offset,
+                rows=self._row_count - self._start_rows,
+                section_changes=self._section_change_count(),
+                races=len(self.result.race_times),
+                wall_sec=_time.perf_counter() - self._started_at,
+                parse_sec=self._parse_sec,
+                peak_rss_bytes=util.peak_rss_bytes(),
+                workers=workers if workers and workers > 1 and not util.is_compressed_path(csv_path) else 1,
+                incremental=incremental
+            )
+
+    def _section_change_count(self) -> int:
+        return sum(len(changes) for changes in self.result.race_section_changes.values())
+
+    def _report_progress(self, check_cancel: bool = True, final: bool = False):
+        """
+        취소 여부를 확인하고 진행 상황을 알립니다. (PROGRESS_INTERVAL_BYTES마다 호출)
+        콜백은 마지막 호출 후 progress_interval_sec가 지났을 때만 호출합니다. (final이면 항상)
         """
-        self.result.logs.append(LogEntry(
-            time=time,
-            context=context,
-            log_type=log_type,
-            area_id=area_id,
-            section_id=section_id
+        self._next_report = self._offset + PROGRESS_INTERVAL_BYTES
+        if check_cancel and self._cancel_event is not None and self._cancel_event.is_set():
+            raise AnalysisCancelled("로그 분석이 취소되었습니다.")
+        if self._progress is None:
+            return
+
+        now = _time.perf_counter()
+        if not final and now - self._last_report_at < self.progress_interval_sec:
+            return
+        self._last_report_at = now
+        self._progress(AnalysisProgress(
+            bytes_done=self._offset,
+            total_bytes=self._total_bytes,
+            rows=self._row_count - self._start_rows,
+            elapsed_sec=now - self._started_at,
+            section_changes=self._section_change_count(),
+            races=len(self.result.race_times),
+            done=final
         ))
+
+    def _reset(self, csv_path: str):
+        """
+        분석 상태를 초기화합니다.
+        """
+        self.result = AnalysisResult()
+        self._prev_area = None
+        self._prev_section = None
+        self._race_count = 0  # Race 0부터 시작
+        self._area_int = None
+        self._last_time = ""
+        self._row_count = 0
+
+        self._csv_path = os.path.abspath(csv_path)
+        self._file_id = None
+        self._offset = 0
+        self._pending_len = 0
+        self._partial_consumed = False
+        self._fieldnames = None
+        self._projection = None
+        self._final_marks = None
+
+    def _add_log(self, time: str, context: str, log_type: str, area_id: Optional[GPS_AREA] = None, section_id: Optional[GrSections] = None):
+        """
+        AnalysisResult의 logs 테이블에 항목을 추가합니다.
+        """
+        self.result.logs.add(time, context, log_type, area_id, section_id)
         
     def _add_section_change_log(self, time: str, current_area_id: GPS_AREA, section_id: GrSections):
         """
@@ -118,123 +988,424 @@ class LogAnalyzer:
         현재 레이스의 섹션 변경 리스트에 (section_id, time)을 중복 없이 기록합니다.
         """
         new_entry = (section_id, time)
-        changes_list = self.result.race_section_changes.setdefault(self._race_count, [])
+        changes_list = self.result.race_section_changes.get(self._race_count)
+        if changes_list is None:
+            changes_list = self.result.race_section_changes[self._race_count] = SectionChangeList()
         
         # 마지막 항목과 동일한 (ID, 시간)이면 추가하지 않습니다.
         if not changes_list or changes_list[-1] != new_entry:
             changes_list.append(new_entry)
+
+    def _iter_lines(self, f, include_partial: bool):
+        """
+        바이너리 파일에서 완성된 줄만 디코딩하여 돌려주고, 읽은 위치(self._offset)를 갱신합니다.
+        개행으로 끝나지 않는 마지막 줄은 include_partial이 False면 읽지 않은 것으로 두고
+        (self._offset은 그 줄의 시작) 다음 분석에서 개행까지 기록된 뒤 다시 읽습니다.
+        """
+        self._pending_len = 0
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # 기록 중인 마지막 줄 (개행 전)
+                if not include_partial:
+                    self._pending_len = len(raw)
+                    return
+                self._partial_consumed = True
+
+            line = raw.decode("utf-8")
+            if self.result.row_index is not None:
+                # 헤더 이후의 데이터 행: 시간 → 바이트 위치 샘플 기록
+                self.result.row_index.add_line(self._offset, line)
+            self._offset += len(raw)
+            yield line
+
+    def _process_row(self, time: str, section_id: GrSections, current_area_id: GPS_AREA):
+        """
+        한 행을 상태 머신에 반영합니다. (섹션 변경 / BOARDING_IC 레이스 경계 처리)
+        """
+        area_int = self._area_int
+
+        # 2. 첫 번째 로그 초기화 (Race 0 시작)
+        if self._row_count == 0:
+            # Race 0 시작. Race가 시작되기 전의 모든 로그를 포함합니다.
+            self._race_count = 0 
+            self.result.first_time = time
+            self.result.race_times[self._race_count] = {"start": time, "end": None}
+            
+            self._add_log(time, f"============== RACE {self._race_count} START ==============", "RACE_INFO", current_area_id, section_id)
+            self._add_section_change_log(time, area_int, section_id)
+
+        else:
+            # 3. Race 종료/시작 (SECTION_BOARDINGIC) 처리
+            is_boarding_ic_start = (
+                section_id == GrSections.SECTION_BOARDINGIC and self._prev_section != GrSections.SECTION_BOARDINGIC
+            )
             
-    def analyze(self, csv_path: str) -> AnalysisResult:
+            if is_boarding_ic_start:
+                # 이전 레이스 종료 시간 기록 (Race 0 또는 Race N)
+                if self._race_count in self.result.race_times:
+                    self.result.race_times[self._race_count]["end"] = time
+                
+                # 이전 레이스의 마지막 event 기록
+                self._add_section_change_log(time, area_int, section_id)
+                
+                # 새로운 레이스 시작 (Race N+1)
+                self._race_count += 1
+                self._add_log(time, f"============== RACE {self._race_count} START ==============", "RACE_INFO", current_area_id, section_id)
+                self._add_section_change_log(time, area_int, section_id)
+                
+                # 새 레이스 시간/섹션 기록
+                self.result.race_times[self._race_count] = {"start": time, "end": None}
+                
+            # 4. 일반 Section 변경 로그 및 기록
+            elif section_id != self._prev_section:
+                self._add_section_change_log(time, area_int, section_id)
+
+            # 5. Area 체크 (GPS_RACE_START/END 이벤트) - 주석 처리된 부분 복원
+            # if current_area_id != self._prev_area:
+            #     if current_area_id == GPS_AREA.GPS_RACE_START:
+            #         self._add_log(time, "GPS_RACE_START !!!", "RACE_EVENT", current_area_id, section_id)
+            #     elif current_area_id == GPS_AREA.GPS_RACE_END:
+            #         self._add_log(time, "GPS_RACE_END !!!", "RACE_EVENT", current_area_id, section_id)
+                
+        # 6. 상태 업데이트 (다음 루프를 위해)
+        self._prev_area = current_area_id
+        self._prev_section = section_id
+        self._last_time = time
+        self._row_count += 1
+
+    def _consume(self, f, include_partial: bool):
         """
-        CSV 파일을 분석하고 결과를 AnalysisResult 구조체로 반환합니다.
-        Race 0은 SECTION_BOARDINGIC (Race 1의 시작) 이전에 발생하는 모든 로그를 포괄합니다.
+        현재 읽기 위치부터 파일 끝까지의 행을 분석 상태에 반영합니다.
+        최초 분석이면 첫 줄을 헤더로 읽고, 이어서 분석하는 경우 저장된 헤더를 사용합니다.
         """
-        self.result = AnalysisResult()
-        self._prev_area = None
-        self._prev_section = None
-        self._race_count = 0  # Race 0부터 시작
+        lines = self._iter_lines(f, include_partial)
 
-        try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                reader.fieldnames = [name.strip() for name in reader.fieldnames]
+        if self._fieldnames is None:
+            header = next(csv.reader(lines), None)
+            if header is None:
+                raise KeyError("CSV에 헤더 행이 없습니다.")
+            self._set_header(header)
 
-                area_key = next((k for k in reader.fieldnames if k.strip().lower() == "area"), None)
-                section_key = next((k for k in reader.fieldnames if k.strip().lower() == "section"), None)
+        if self._next_report == float("inf"):
+            scan = _scan_lines(lines, self._projection, self._prev_section, self._section_cache, self._area_cache)
+            self._apply_scan(scan)
+            return
 
-                if not section_key:
-                    raise KeyError("CSV에 'section' 열이 없습니다.")
+        # 진행 상황/취소 확인이 필요하면 PROGRESS_INTERVAL_BYTES 단위로 나누어 분석하고 구간마다 결과를 반영
+        # (진행 중에도 섹션 변경 / 레이스 수를 알릴 수 있도록)
+        exhausted = False
 
-                time = ""
-                for i, row in enumerate(reader):
-                    time = row["time"].strip()
-                    
-                    # 1. 섹션 및 영역 ID 파싱 (기존 로직 유지)
-                    section_str = row[section_key].strip()
-                    section_id = STR_TO_ENUM.get(section_str, GrSections.SECTION_UNKNOWN)
-                    current_area_id = GPS_AREA.GPS_UNKNOWN
-                    
-                    try:
-                        if area_key and row[area_key].strip():
-                            area_int = int(row[area_key])
-                            current_area_id = GPS_AREA(area_int)
-                    except (ValueError, KeyError):
-                        pass
-
-                    # 2. 첫 번째 로그 초기화 (Race 0 시작)
-                    if i == 0:
-                        # Race 0 시작. Race가 시작되기 전의 모든 로그를 포함합니다.
-                        self._race_count = 0 
-                        self.result.first_time = time
-                        self.result.race_times[self._race_count] = {"start": time, "end": None}
-                        
-                        self._add_log(time, f"============== RACE {self._race_count} START ==============", "RACE_INFO", current_area_id, section_id)
-                        self._add_section_change_log(time, area_int, section_id)
-                        
-                        self._prev_area = current_area_id
-                        self._prev_section = section_id
-                        continue 
-
-                    # 3. Race 종료/시작 (SECTION_BOARDINGIC) 처리
-                    is_boarding_ic_start = (
-                        section_id == GrSections.SECTION_BOARDINGIC and self._prev_section != GrSections.SECTION_BOARDINGIC
-                    )
-                    
-                    if is_boarding_ic_start:
-                        # 이전 레이스 종료 시간 기록 (Race 0 또는 Race N)
-                        if self._race_count in self.result.race_times:
-                            self.result.race_times[self._race_count]["end"] = time
-                        
-                        # 이전 레이스의 마지막 event 기록
-                        self._add_section_change_log(time, area_int, section_id)
-                            
-                                            
-                        # 새로운 레이스 시작 (Race N+1)
-                        self._race_count += 1
-                        self._add_log(time, f"============== RACE {self._race_count} START ==============", "RACE_INFO", current_area_id, section_id)
-                        self._add_section_change_log(time, area_int, section_id)
-                        
-                        # 새 레이스 시간/섹션 기록
-                        self.result.race_times[self._race_count] = {"start": time, "end": None}
-                        
-                    # 4. 일반 Section 변경 로그 및 기록
-                    elif section_id != self._prev_section:
-                        self._add_section_change_log(time, area_int, section_id)
-
-                    # 5. Area 체크 (GPS_RACE_START/END 이벤트) - 주석 처리된 부분 복원
-                    # if current_area_id != self._prev_area:
-                    #     if current_area_id == GPS_AREA.GPS_RACE_START:
-                    #         self._add_log(time, "GPS_RACE_START !!!", "RACE_EVENT", current_area_id, section_id)
-                    #     elif current_area_id == GPS_AREA.GPS_RACE_END:
-                    #         self._add_log(time, "GPS_RACE_END !!!", "RACE_EVENT", current_area_id, section_id)
-                            
-                    # 6. 상태 업데이트 (다음 루프를 위해)
-                    self._prev_area = current_area_id
-                    self._prev_section = section_id
+        def batch():
+            nonlocal exhausted
+            for line in lines:
+                yield line
+                if self._offset >= self._next_report:
+                    return
+            exhausted = True
+
+        while not exhausted:
+            scan = _scan_lines(batch(), self._projection, self._prev_section, self._section_cache, self._area_cache)
+            self._apply_scan(scan)
+            if not exhausted:
+                self._report_progress()
+
+    def _set_header(self, header: List[str]):
+        """
+        헤더를 저장하고 분석에 사용할 열 인덱스를 계산합니다.
+        """
+        self._fieldnames = [name.strip() for name in header]
+        self._projection = ColumnProjection.from_header(self._fieldnames)
+        self.result.row_index = RowOffsetIndex(self._projection.time_index, self._offset)
+
+    def _apply_scan(self, scan: ChunkScan):
+        """
+        ChunkScan의 섹션 변경 이벤트를 순서대로 상태 머신에 반영합니다.
+        구간 경계에서 직전 섹션과 같은 첫 행 이벤트는 _process_row에서 자연스럽게 무시됩니다.
+        """
+        base = self._row_count
+        for row_offset, time, section_id, current_area_id, area_int in scan.events:
+            if area_int is not None:
+                self._area_int = area_int
+            self._row_count = base + row_offset
+            self._process_row(time, section_id, current_area_id)
+
+        if scan.row_offsets is not None and self.result.row_index is not None:
+            self.result.row_index.extend(scan.row_offsets)
+
+        if scan.row_count:
+            self._row_count = base + scan.row_count
+            self._last_time = scan.last_time
+            self._prev_area = scan.last_area_id
+            if scan.last_area_int is not None:
+                self._area_int = scan.last_area_int
+
+    @tracing.traced(cat="analyzer")
+    def _consume_parallel(self, f, csv_path: str, workers: int):
+        """
+        헤더 이후의 완성된 줄들을 개행 경계에 맞춘 바이트 구간으로 나누어 프로세스 풀에서 분석하고,
+        구간 순서대로 이어 붙입니다. 처리한 위치까지 self._offset과 파일 위치를 옮기며,
+        개행으로 끝나지 않는 마지막 줄은 이후 _consume에서 처리합니다.
+        파일이 작으면 아무것도 하지 않습니다 (단일 프로세스 분석).
+        """
+        size = os.fstat(f.fileno()).st_size
+        if size < PARALLEL_MIN_BYTES:
+            return
+
+        header_line = f.readline()
+        if not header_line.endswith(b"\n"):
+            f.seek(0)
+            return
+        data_start = self._offset = f.tell()
+        self._set_header(next(csv.reader((header_line.decode("utf-8"),))))
+
+        # 마지막 개행 위치까지만 병렬 처리
+        tail_len = min(size - data_start, 64 * 1024)
+        f.seek(size - tail_len)
+        tail = f.read(tail_len)
+        data_end = size - tail_len + tail.rfind(b"\n") + 1 if b"\n" in tail else data_start
+
+        chunk_count = max(1, min(workers * 4, (data_end - data_start) // PARALLEL_MIN_CHUNK_BYTES))
+        step = (data_end - data_start) // chunk_count
+        bounds = [data_start]
+        for i in range(1, chunk_count):
+            f.seek(data_start + i * step)
+            f.readline() # 다음 줄의 시작으로 정렬
+            pos = min(f.tell(), data_end)
+            if pos > bounds[-1]:
+                bounds.append(pos)
+        if data_end > bounds[-1]:
+            bounds.append(data_end)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_scan_chunk, csv_path, start, end, self._projection)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+            for future, end in zip(futures, bounds[1:]):
+                try:
+                    scan = future.result()
+                    self._apply_scan(scan)
+                    self._offset = end
+                    if self._progress is not None or self._cancel_event is not None:
+                        self._report_progress()
+                except AnalysisCancelled:
+                    # 아직 시작하지 않은 구간은 취소하고 바로 종료
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        self._offset = bounds[-1]
+        f.seek(self._offset)
+
+    @tracing.traced(cat="analyzer")
+    def _finalize(self):
+        """
+        최종 상태를 기록합니다. (루프 종료 후)
+        이어서 분석할 때 되돌릴 수 있도록 추가한 위치를 self._final_marks에 남깁니다.
+        """
+        if self._row_count == 0:
+            raise ValueError("CSV에 데이터 행이 없습니다.")
+
+        time = self._last_time
+        self.result.last_time = time # 전체 로그 최종 시간
+        
+        # 현재 활성화된 마지막 레이스(Race 0 또는 Race N)의 종료 시간 기록
+        if self._race_count in self.result.race_times:
+            self.result.race_times[self._race_count]["end"] = time 
+
+        changes_list = self.result.race_section_changes.get(self._race_count)
+        self._final_marks = (
+            len(self.result.logs),
+            self._race_count,
+            len(changes_list) if changes_list is not None else None
+        )
+
+        # 최종 섹션 상태를 명시적으로 기록 
+        self._add_section_change_log(time, self._area_int, self._prev_section)
+
+        # total_race_count는 Race 1부터 Race N까지만 세는 것이 일반적이므로, 
+        # Race 0을 제외한 레이스 개수를 계산합니다.
+        self.result.total_race_count = max(0, self._race_count)
+
+    @property
+    def has_pending_line(self) -> bool:
+        """
+        개행으로 끝나지 않아 다음 분석까지 보류한 줄이 있는지 여부 (있으면 결과에 파일 끝까지 반영되지 않음)
+        """
+        return self._pending_len > 0
+
+    def resume_state(self) -> Optional[tuple]:
+        """
+        이어서 분석하는 데 필요한 상태를 기본 타입만으로 구성된 튜플로 반환합니다. (분석 결과 캐시에 결과와 함께 저장)
+        이어서 분석할 수 없는 상태면 None을 반환합니다.
+        """
+        if self._fieldnames is None or self._final_marks is None or self._partial_consumed:
+            return None
+        return (
+            self._offset,
+            list(self._fieldnames),
+            None if self._prev_section is None else int(self._prev_section),
+            None if self._prev_area is None else int(self._prev_area),
+            self._race_count,
+            self._area_int,
+            self._last_time,
+            self._row_count,
+            tuple(self._final_marks)
+        )
+
+    def restore(self, csv_path: str, result: AnalysisResult, state: tuple):
+        """
+        resume_state로 저장한 상태와 같은 시점의 분석 결과로 분석기를 되돌립니다.
+        이후 analyze_incremental은 저장된 위치부터 추가된 행만 읽습니다.
+        """
+        offset, fieldnames, prev_section, prev_area, race_count, area_int, last_time, row_count, final_marks = state
+
+        self._reset(csv_path)
+        self.result = result
+        self._offset = offset
+        # _set_header는 row_index를 새로 만들므로 열 정보만 설정 (캐시된 row_index 유지)
+        self._fieldnames = list(fieldnames)
+        self._projection = ColumnProjection.from_header(self._fieldnames)
+        self._prev_section = None if prev_section is None else GrSections(prev_section)
+        self._prev_area = None if prev_area is None else GPS_AREA(prev_area)
+        self._race_count = race_count
+        self._area_int = area_int
+        self._last_time = last_time
+        self._row_count = row_count
+        self._final_marks = tuple(final_marks)
+        self._file_id = self._get_file_id(csv_path)
+
+    def _unfinalize(self):
+        """
+        _finalize에서 추가한 마지막 섹션 기록을 되돌려 이어서 분석할 수 있는 상태로 만듭니다.
+        """
+        if self._final_marks is None:
+            return
+
+        log_count, race_num, change_count = self._final_marks
+        del self.result.logs[log_count:]
+
+        if change_count is None:
+            self.result.race_section_changes.pop(race_num, None)
+        else:
+            del self.result.race_section_changes[race_num][change_count:]
+
+        self._final_marks = None
+
+    @staticmethod
+    def _get_file_id(csv_path: str) -> Tuple[int, int, int]:
+        """
+        파일 교체(로테이션) 감지를 위한 (장치, inode, 크기)를 반환합니다.
+        """
+        st = os.stat(csv_path)
+        return st.st_dev, st.st_ino, st.st_size
+
+    def _can_resume(self, csv_path: str) -> bool:
+        """
+        이전 분석 상태에서 이어서 분석할 수 있는지 확인합니다.
+        """
+        if self._fieldnames is None or self._file_id is None or self._partial_consumed:
+            return False
+        if util.is_compressed_path(csv_path):
+            return False # 압축 파일은 이어 읽을 수 없으므로 항상 처음부터 분석
+        if self._csv_path != os.path.abspath(csv_path):
+            return False
+
+        dev, ino, size = self._get_file_id(csv_path)
+        prev_dev, prev_ino, _ = self._file_id
+
+        # 파일이 교체되었거나 잘린 경우 처음부터 다시 분석
+        if (dev, ino) != (prev_dev, prev_ino) or size < self._offset:
+            return False
+        return True
+
+    @tracing.traced(cat="analyzer")
+    def analyze(self, csv_path: str, workers: Optional[int] = None, progress: Optional[ProgressCallback] = None,
+                cancel_event: Optional[threading.Event] = None) -> AnalysisResult:
+        """
+        CSV 파일을 분석하고 결과를 AnalysisResult 구조체로 반환합니다.
+        Race 0은 SECTION_BOARDINGIC (Race 1의 시작) 이전에 발생하는 모든 로그를 포괄합니다.
+        workers가 2 이상이면 큰 파일을 바이트 구간으로 나누어 여러 프로세스에서 분석합니다. (결과는 동일)
+        .csv.gz / .csv.xz / .csv.zst 파일은 압축을 풀면서 스트리밍으로 분석합니다. (병렬 분석 제외)
+        progress는 읽은 바이트 PROGRESS_INTERVAL_BYTES마다 확인하여 progress_interval_sec 간격으로
+        AnalysisProgress와 함께 호출되고(마지막에 done=True로 한 번 더), cancel_event가 설정되면
+        같은 간격으로 확인하여 AnalysisCancelled를 발생시킵니다.
+        끝까지 분석하면 측정 결과(AnalysisSummary)를 self.last_summary에 기록합니다.
+        """
+        self._reset(csv_path)
+        completed = False
+
+        try:
+            self._begin_run(csv_path, progress, cancel_event)
+            self._file_id = self._get_file_id(csv_path)
+            with util.open_log_file(csv_path) as f:
+                parse_started = _time.perf_counter()
+                if workers and workers > 1 and not util.is_compressed_path(csv_path):
+                    self._consume_parallel(f, csv_path, workers)
+                self._consume(f, include_partial=True)
+                self._parse_sec = _time.perf_counter() - parse_started
 
             # ===================================================
             # 7. 최종 상태 기록 (루프 종료 후)
             # ===================================================
-            self.result.last_time = time # 전체 로그 최종 시간
-            
-            # 현재 활성화된 마지막 레이스(Race 0 또는 Race N)의 종료 시간 기록
-            if self._race_count in self.result.race_times:
-                self.result.race_times[self._race_count]["end"] = time 
+            self._finalize()
 
-            # 최종 섹션 상태를 명시적으로 기록 
-            self._add_section_change_log(time, area_int, section_id)
+            completed = True
+            return self.result
+
+        except (KeyError, AnalysisCancelled) as e:
+            raise e
+        except Exception as e:
+            print(f"로그 분석 중 오류 발생: {e}")
+            raise e
+        finally:
+            self._end_run(csv_path, workers, False, completed)
+
+    @tracing.traced(cat="analyzer")
+    def analyze_incremental(self, csv_path: str, workers: Optional[int] = None, progress: Optional[ProgressCallback] = None,
+                            cancel_event: Optional[threading.Event] = None) -> AnalysisResult:
+        """
+        기록 중인(계속 커지는) CSV 파일을 이어서 분석합니다. (tail 모드)
+        이전에 같은 파일을 분석했다면 마지막으로 읽은 바이트 위치부터 새로 추가된 행만 읽어
+        기존 AnalysisResult의 race_times, race_section_changes, logs를 확장합니다.
+        파일이 교체되었거나 잘렸다면 처음부터 다시 분석합니다. (workers는 analyze와 동일)
+        개행으로 끝나지 않은 마지막 줄은 기록 중인 것으로 보고 분석하지 않으며,
+        다음 호출에서 그 줄의 시작부터 다시 읽습니다. (has_pending_line)
+        분석할 데이터 행이 없으면 ValueError가 발생합니다.
+        progress, cancel_event는 analyze와 동일합니다. (진행 바이트는 파일 처음부터의 위치)
+        """
+        completed = False
+        resume = False
+        try:
+            resume = self._can_resume(csv_path)
+            if resume:
+                self._unfinalize()
+            else:
+                self._reset(csv_path)
+            self._begin_run(csv_path, progress, cancel_event)
+
+            self._file_id = self._get_file_id(csv_path)
+            with util.open_log_file(csv_path) as f:
+                parse_started = _time.perf_counter()
+                if self._offset:
+                    f.seek(self._offset)
+                if not resume and workers and workers > 1 and not util.is_compressed_path(csv_path):
+                    self._consume_parallel(f, csv_path, workers)
+                # 압축 파일은 이어 읽지 않으므로 마지막 줄까지 모두 분석
+                self._consume(f, include_partial=util.is_compressed_path(csv_path))
+                self._parse_sec = _time.perf_counter() - parse_started
 
-            # total_race_count는 Race 1부터 Race N까지만 세는 것이 일반적이므로, 
-            # Race 0을 제외한 레이스 개수를 계산합니다.
-            self.result.total_race_count = max(0, self._race_count)
+            self._finalize()
 
+            completed = True
             return self.result
 
-        except KeyError as e:
+        except (KeyError, AnalysisCancelled) as e:
             raise e
         except Exception as e:
             print(f"로그 분석 중 오류 발생: {e}")
             raise e
+        finally:
+            self._end_run(csv_path, workers, resume, completed)
 
     def save_logs_to_txt(self, result: AnalysisResult, output_dir: str = "."):
         """
@@ -299,6 +1470,6 @@ if __name__ == '__main__':
     except KeyError as e:
         print(f"\n[오류] CSV 파일에 필수 열이 없습니다: {e}")
     except FileNotFoundError:
-        print(f"\n[오류] 파일을 찾을 수 없습니다. 경로를 확인해주세요: './csv/log_out.csv'")
+        print("\n[오류] 파일을 찾을 수 없습니다. 경로를 확인해주세요: './csv/log_out.csv'")
     except Exception as e:
         print(f"\n[오류] 분석 중 예기치 않은 오류 발생: {e}")
\ No newline at end of file
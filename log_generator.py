@@ -0,0 +1,231 @@
+import os
+import gzip
+import lzma
+import math
+import random
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import util
+from log_analyzer import GrSections, GPS_AREA, MODE_TABLE, STR_TO_ENUM
+
+# 레이스 한 바퀴의 섹션 순서 (BOARDING_IC로 들어갈 때 새 레이스가 시작됨)
+DEFAULT_SECTION_SEQUENCE = (
+    "ENTERING", "DOWNHILL", "UPHILL_STANDBY", "UPHILL", "UPHILL_SLOWDOWN",
+    "LANDING_IC", "LANDING", "BOARDING_IC", "BOARDING",
+)
+
+# 섹션별 상대 길이 (행 수 배분 비율)
+SECTION_WEIGHTS: Dict[str, float] = {
+    "ENTERING": 2, "DOWNHILL": 8, "UPHILL_STANDBY": 2, "UPHILL": 6, "UPHILL_SLOWDOWN": 2,
+    "LANDING_IC": 1, "LANDING": 3, "GARAGE": 4, "BOARDING_IC": 1, "BOARDING": 4,
+}
+
+# 템플릿 패널에서 쓰는 열 이름 (앞에서부터 사용, 부족하면 valueN 열 추가)
+DEFAULT_VALUE_COLUMNS = (
+    "speed", "rawSpeed", "cmdSpeed", "encDist", "accX", "accY", "accZ", "steer_deg",
+    "steer_refdeg", "steer_raw", "brakeValue", "brakeCmd", "brakeCmdVal", "magnet_value",
+    "gpsLat", "gpsLon", "lat", "lon", "gpsFix", "laser_id", "mode", "lks_detect",
+    "lks_left", "lks_right", "pedalStatus", "brakeCode", "vcu_ttl", "uptime", "dcuTTL",
+    "batt1_volt", "batt1_capa", "lidarLevel", "lidarLeft", "lidarRight",
+    "lidar0", "lidar1", "lidar2", "lidar3", "lidar4", "lidar5", "lidar6", "lidar7",
+    "modeButton", "magnet_detect",
+)
+
+# 매 행 계산하는 신호 열 수 (나머지 열은 미리 만든 값 묶음에서 골라 씀: 생성 속도)
+SIGNAL_COLUMNS = 8
+_TAIL_POOL_SIZE = 512
+
+# time, section, area 3개 열
+_BASE_COLUMN_COUNT = 3
+
+DEFAULT_START_TIME = "2025-10-23 15:00:00.000"
+
+
+@dataclass
+class GeneratedLog:
+    """
+    생성한 로그 정보
+    """
+    path: str
+    rows: int
+    columns: int
+    races: int
+    segments: int # 섹션 구간 수
+    bytes: int
+    first_time: str
+    last_time: str
+
+
+def _open_output(path: str):
+    """
+    확장자에 따라 압축하여 쓰는 파일 객체 (.gz / .xz, 그 외는 일반 파일)
+    """
+    lower = path.lower()
+    if lower.endswith('.gz'):
+        return gzip.open(path, 'wb', compresslevel=1)
+    if lower.endswith('.xz'):
+        return lzma.open(path, 'wb', preset=0)
+    if lower.endswith('.zst'):
+        raise ValueError(".zst 출력은 지원하지 않습니다. (.csv / .csv.gz / .csv.xz)")
+    return open(path, 'wb')
+
+
+def _segments(sequence: Sequence[str], races: int) -> List[str]:
+    """
+    섹션 순서를 반복하여 BOARDING_IC 진입이 races번 일어나는 섹션 목록을 만듭니다.
+    마지막 레이스는 BOARDING_IC 직전 섹션까지 진행합니다. (순서에 BOARDING_IC가 없으면 races+1번 반복)
+    """
+    boarding_ic = MODE_TABLE[GrSections.SECTION_BOARDINGIC]
+    segments: List[str] = []
+    if boarding_ic not in sequence:
+        return list(sequence) * (races + 1)
+
+    entered = 0
+    while True:
+        for name in sequence:
+            if name == boarding_ic:
+                if entered == races:
+                    return segments
+                entered += 1
+            segments.append(name)
+
+
+def _area_for(section: str, progress: float, rnd: random.Random) -> int:
+    """
+    섹션과 섹션 안의 진행률(0~1)로 GPS_AREA 값을 정합니다. (트랙 구간은 센서 1~9를 차례로 지남)
+    """
+    if section == "ENTERING":
+        return int(GPS_AREA.GPS_RACE_START)
+    if section in ("DOWNHILL", "UPHILL"):
+        offset = 0 if section == "DOWNHILL" else 5
+        return int(GPS_AREA.GPS_TRACKSENSOR_1) + min(8, offset + int(progress * 5))
+    if section in ("LANDING_IC", "LANDING"):
+        return int(GPS_AREA.GPS_RACE_END)
+    return int(GPS_AREA.GPS_INIT) if rnd.random() > 0.01 else int(GPS_AREA.GPS_UNKNOWN)
+
+
+def generate_log(path: str, rows: int = 100_000, columns: int = 60, sample_rate_hz: float = 20.0,
+                 races: int = 10, section_sequence: Sequence[str] = DEFAULT_SECTION_SEQUENCE,
+                 start_time: str = DEFAULT_START_TIME, seed: int = 0, blank_area_rate: float = 0.02) -> GeneratedLog:
+    """
+    GR 주행 로그와 같은 형식의 CSV를 생성합니다.
+    - rows: 데이터 행 수, columns: 전체 열 수 (time, section, area 포함, 최소 3)
+    - sample_rate_hz: 초당 행 수 (행 사이 시간 간격)
+    - races: BOARDING_IC 진입 횟수 (= 분석 결과의 총 레이스 횟수, 행 수가 부족하면 줄어듦)
+    - section_sequence: 한 레이스의 섹션 순서 (MODE_TABLE 이름)
+    - blank_area_rate: area 값을 비워 두는 행의 비율 (이전 값 유지 처리 확인용)
+    경로가 .gz / .xz로 끝나면 압축하여 저장합니다.
+    """
+    if rows <= 0:
+        raise ValueError("행 수는 1 이상이어야 합니다.")
+    unknown = [name for name in section_sequence if name not in STR_TO_ENUM]
+    if unknown:
+        raise ValueError(f"알 수 없는 섹션 이름: {', '.join(unknown)}")
+    if not section_sequence:
+        raise ValueError("섹션 순서가 비어 있습니다.")
+    start_ms = util.time_str_to_ms(start_time)
+    if start_ms is None:
+        raise ValueError(f"시작 시간 형식 오류: {start_time} (YYYY-MM-DD HH:MM:SS.sss)")
+
+    rnd = random.Random(seed)
+    columns = max(_BASE_COLUMN_COUNT, columns)
+    value_count = columns - _BASE_COLUMN_COUNT
+    value_names = list(DEFAULT_VALUE_COLUMNS[:value_count])
+    value_names += [f"value{i}" for i in range(len(value_names), value_count)]
+    signal_count = min(SIGNAL_COLUMNS, value_count)
+
+    # 신호 열 이후의 값은 미리 만든 문자열 묶음에서 골라 씀
+    tail_width = value_count - signal_count
+    tail_pool = [
+        "," + ",".join(f"{rnd.uniform(-100, 100):.3f}" for _ in range(tail_width)) if tail_width else ""
+        for _ in range(_TAIL_POOL_SIZE)
+    ]
+
+    # 섹션 구간별 행 수 (가중치 비율, 각 구간 최소 1행)
+    segments = _segments(section_sequence, races)
+    if len(segments) > rows:
+        segments = segments[:max(1, rows)]
+    weights = [SECTION_WEIGHTS.get(name, 1.0) * rnd.uniform(0.8, 1.2) for name in segments]
+    total_weight = sum(weights)
+    spare = rows - len(segments)
+    segment_rows = [1 + int(spare * w / total_weight) for w in weights]
+    segment_rows[-1] += rows - sum(segment_rows)
+
+    step_ms = 1000.0 / sample_rate_hz if sample_rate_hz > 0 else 50.0
+    boarding_ic = MODE_TABLE[GrSections.SECTION_BOARDINGIC]
+
+    row_num = 0
+    race_count = 0
+    with _open_output(path) as f:
+        header = ["time", "section", "area"] + value_names
+        f.write((",".join(header) + "\n").encode("utf-8"))
+
+        buffer: List[str] = []
+        for name, count in zip(segments, segment_rows):
+            if name == boarding_ic:
+                race_count += 1
+            for i in range(count):
+                time_str = util.ms_to_time_str(start_ms + int(row_num * step_ms))
+                area = "" if rnd.random() < blank_area_rate else str(_area_for(name, i / count, rnd))
+
+                phase = row_num * step_ms / 1000.0
+                signals = ",".join(
+                    f"{math.sin(phase / (k + 1)) * (k + 1) * 10 + rnd.gauss(0, 0.5):.3f}"
+                    for k in range(signal_count)
+                )
+                line = f"{time_str},{name},{area}"
+                if signal_count:
+                    line += "," + signals
+                buffer.append(line + tail_pool[row_num % _TAIL_POOL_SIZE] + "\n")
+                row_num += 1
+
+                if len(buffer) >= 4096:
+                    f.write("".join(buffer).encode("utf-8"))
+                    buffer.clear()
+        f.write("".join(buffer).encode("utf-8"))
+
+    return GeneratedLog(
+        path=path,
+        rows=row_num,
+        columns=columns,
+        races=race_count,
+        segments=len(segments),
+        bytes=os.path.getsize(path),
+        first_time=util.ms_to_time_str(start_ms) if row_num else "",
+        last_time=util.ms_to_time_str(start_ms + int((row_num - 1) * step_ms)) if row_num else "",
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="벤치마크/테스트용 GR 로그(csv) 생성기")
+    parser.add_argument("output", help="저장할 경로 (.csv, .csv.gz, .csv.xz)")
+    parser.add_argument("--rows", type=int, default=100_000, help="데이터 행 수 (기본: 100000)")
+    parser.add_argument("--columns", type=int, default=60, help="전체 열 수, time/section/area 포함 (기본: 60)")
+    parser.add_argument("--rate", type=float, default=20.0, help="초당 행 수 (기본: 20)")
+    parser.add_argument("--races", type=int, default=10, help="레이스 수 (기본: 10)")
+    parser.add_argument("--sections", default=",".join(DEFAULT_SECTION_SEQUENCE),
+                        help="한 레이스의 섹션 순서, 쉼표로 구분 (기본: ENTERING,DOWNHILL,...,BOARDING_IC,BOARDING)")
+    parser.add_argument("--start", default=DEFAULT_START_TIME, help=f"첫 행 시간 (기본: {DEFAULT_START_TIME})")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (같은 값이면 같은 파일)")
+    args = parser.parse_args(argv)
+
+    sequence = [name.strip().upper() for name in args.sections.split(",") if name.strip()]
+    try:
+        log = generate_log(
+            args.output, rows=args.rows, columns=args.columns, sample_rate_hz=args.rate,
+            races=args.races, section_sequence=sequence, start_time=args.start, seed=args.seed
+        )
+    except ValueError as e:
+        print(f"오류: {e}")
+        return 1
+
+    print(f"생성 완료: {log.path} ({log.bytes / (1024 * 1024):,.1f} MB)")
+    print(f"  {log.rows:,} 행, {log.columns} 열, 레이스 {log.races}개, 섹션 구간 {log.segments}개")
+    print(f"  {log.first_time} ~ {log.last_time}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+from array import array
+from bisect import bisect_right
+from itertools import compress
+from typing import Any, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor, QFont
+
+from log_analyzer import LogTable, GrSections, GPS_AREA, MODE_TABLE
+
+# 레이스 구분 행의 로그 유형
+RACE_INFO_TYPE = "RACE_INFO"
+
+# 열 번호
+COL_TIME = 0
+COL_RACE = 1
+COL_SECTION = 2
+COL_AREA = 3
+COL_TYPE = 4
+COL_CONTEXT = 5
+
+COLUMN_TITLES = ("시간", "레이스", "섹션", "Area", "유형", "내용")
+
+_RACE_INFO_BACKGROUND = QColor("#dde8ff")
+
+
+class LogTableModel(QAbstractTableModel):
+    """
+    LogTable(AnalysisResult.logs)을 QTableView에 보여 주는 모델.
+    항목을 문자열로 미리 만들지 않고 화면에 보이는 행만 data()에서 배열 값을 변환하므로
+    항목이 수백만 개여도 표시 비용은 보이는 행 수에만 비례합니다.
+    필터는 원본 행 번호 배열(array('I'))로 유지하며, 필터가 없으면 원본 행을 그대로 사용합니다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._table: Optional[LogTable] = None
+        self._count = 0                       # set_table 시점의 항목 수 (분석 중 테이블이 늘어나도 범위 고정)
+        self._race_starts = array('I')        # 레이스 N의 RACE_INFO 행 번호 (N번째 원소)
+        self._rows: Optional[array] = None    # 필터 결과 (None이면 전체)
+        self.race_filter: Optional[int] = None
+        self.section_filter: Optional[GrSections] = None
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    # --- 데이터 설정 / 필터 ---
+
+    def set_table(self, table: Optional[LogTable]):
+        """
+        표시할 LogTable을 설정합니다. (None이면 비움) 필터는 초기화됩니다.
+        """
+        self.beginResetModel()
+        self._table = table
+        self._count = len(table) if table is not None else 0
+        self._race_starts = table.rows_of_type(RACE_INFO_TYPE) if table is not None else array('I')
+        self.race_filter = None
+        self.section_filter = None
+        self._rows = None
+        self.endResetModel()
+
+    def set_filter(self, race: Optional[int] = None, section: Optional[GrSections] = None):
+        """
+        레이스 번호 / 섹션으로 표시할 행을 거릅니다. (None이면 해당 조건 없음)
+        레이스의 행은 연속 구간이므로 레이스 필터는 구간 계산만 하고, 섹션 필터는 uint8 배열을 C 수준에서 비교합니다.
+        """
+        self.beginResetModel()
+        self.race_filter = race
+        self.section_filter = section
+
+        lo, hi = self._race_range(race)
+        if section is None:
+            self._rows = None if (lo, hi) == (0, self._count) else array('I', range(lo, hi))
+        else:
+            codes = self._table.section_codes[lo:hi] if self._table is not None else array('B')
+            self._rows = array('I', compress(range(lo, hi), map(int(section).__eq__, codes)))
+        self.endResetModel()
+
+    def _race_range(self, race: Optional[int]):
+        """
+        레이스 race의 행 구간 [lo, hi). 레이스가 없으면 빈 구간
+        """
+        if race is None:
+            return 0, self._count
+        if not 0 <= race < len(self._race_starts):
+            return 0, 0
+        lo = self._race_starts[race]
+        hi = self._race_starts[race + 1] if race + 1 < len(self._race_starts) else self._count
+        # 레이스 경계의 BOARDING_IC 기록은 이전 레이스에 속하므로 다음 RACE_INFO 직전까지
+        return lo, hi
+
+    def source_row(self, row: int) -> int:
+        """
+        표시 행 번호 → LogTable 행 번호
+        """
+        return row if self._rows is None else self._rows[row]
+
+    def race_of(self, source_row: int) -> int:
+        """
+        LogTable 행이 속한 레이스 번호 (RACE_INFO 행 번호 배열에서 이분 탐색)
+        """
+        return max(0, bisect_right(self._race_starts, source_row) - 1)
+
+    def time_at(self, row: int) -> Optional[str]:
+        """
+        표시 행의 시간 문자열
+        """
+        if self._table is None or not 0 <= row < self.rowCount():
+            return None
+        return self._table.times.get(self.source_row(row))
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._count if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_TITLES)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMN_TITLES[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or self._table is None:
+            return None
+        row = self.source_row(index.row())
+        table = self._table
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == COL_TIME:
+                return table.times.get(row)
+            if column == COL_RACE:
+                return self.race_of(row)
+            if column == COL_SECTION:
+                section = table.section_at(row)
+                return MODE_TABLE.get(section, "") if section is not None else ""
+            if column == COL_AREA:
+                area = table.area_at(row)
+                if area is None:
+                    return ""
+                return area.name if isinstance(area, GPS_AREA) else str(area)
+            if column == COL_TYPE:
+                return table.log_type_at(row)
+            if column == COL_CONTEXT:
+                return table.context_at(row)
+            return None
+
+        if role in (Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.FontRole):
+            if table.log_type_at(row) != RACE_INFO_TYPE:
+                return None
+            return QBrush(_RACE_INFO_BACKGROUND) if role == Qt.ItemDataRole.BackgroundRole else self._bold
+
+        return None
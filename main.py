@@ -1,8 +1,16 @@
 import sys
-import ui_manager
+import multiprocessing
 
 if __name__ == '__main__':
-    ui_manager.QApplication
+    # PyInstaller 실행 파일에서 병렬 로그 분석(프로세스 풀)을 사용하기 위해 필요
+    multiprocessing.freeze_support()
+
+    if len(sys.argv) > 1:
+        # 인자가 있으면 UI 없이 일괄 업로드 (PySide6를 import하지 않음)
+        import cli
+        sys.exit(cli.main(sys.argv[1:]))
+
+    import ui_manager
     app = ui_manager.QApplication(sys.argv)
 
     tool = ui_manager.UI_Tool()
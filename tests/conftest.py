@@ -0,0 +1,46 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+# 저장소 최상위 모듈(log_analyzer, grafana_api 등)을 import 할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+LOG_HEADER = "time,section,area,speed\n"
+LOG_START = datetime(2025, 10, 23, 15, 0, 0)
+
+# 한 레이스의 섹션 순서와 섹션별 행 수
+RACE_SECTIONS = [("BOARDING_IC", 2), ("BOARDING", 3), ("DOWNHILL", 4), ("UPHILL", 4), ("LANDING", 3)]
+
+
+def log_rows(races: int = 3, start_row: int = 0):
+    """
+    GR 로그 형식의 데이터 행들 (50ms 간격, 레이스 앞에 ENTERING 구간)
+    """
+    sections = [("ENTERING", 3)] + RACE_SECTIONS * races
+    rows = []
+    n = start_row
+    for section, count in sections:
+        for _ in range(count):
+            time = (LOG_START + timedelta(milliseconds=50 * n)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            rows.append(f"{time},{section},{n % 10},{n * 1.5:.1f}\n")
+            n += 1
+    return rows
+
+
+@pytest.fixture
+def write_log(tmp_path):
+    """
+    tmp_path 아래에 로그 csv를 만드는 함수 (text를 주면 그대로 저장)
+    """
+    def write(name: str = "log.csv", text: str = None, races: int = 3) -> str:
+        path = tmp_path / name
+        if text is None:
+            text = LOG_HEADER + "".join(log_rows(races))
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return str(path)
+    return write
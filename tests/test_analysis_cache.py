@@ -0,0 +1,83 @@
+import os
+
+from conftest import LOG_HEADER, log_rows
+from analysis_cache import AnalysisCache
+from log_analyzer import LogAnalyzer
+
+
+def _cache(tmp_path, max_bytes=1024 * 1024):
+    return AnalysisCache(cache_dir=str(tmp_path / "cache"), max_bytes=max_bytes)
+
+
+def test_put_and_get_round_trip(write_log, tmp_path):
+    path = write_log()
+    cache = _cache(tmp_path)
+    result = LogAnalyzer().analyze(path)
+
+    assert cache.get(path) is None
+    assert cache.put(path, result)
+    assert cache.get(path) == result
+
+
+def test_entry_is_dropped_when_file_changes(write_log, tmp_path):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows[:20]))
+    cache = _cache(tmp_path)
+    cache.put(path, LogAnalyzer().analyze(path))
+
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write("".join(rows[20:]))
+    assert cache.get(path) is None
+    assert not os.listdir(tmp_path / "cache")
+
+
+def test_restored_analyzer_reads_only_appended_rows(write_log, tmp_path):
+    rows = log_rows(races=4)
+    path = write_log(text=LOG_HEADER + "".join(rows[:30]))
+    cache = _cache(tmp_path)
+
+    analyzer = LogAnalyzer()
+    cache.put(path, analyzer.analyze_incremental(path), analyzer.resume_state())
+
+    # 재시작 후: 캐시에서 결과와 읽은 위치를 되돌림
+    result, state = cache.get_entry(path)
+    restored = LogAnalyzer()
+    restored.restore(path, result, state)
+    offset = os.path.getsize(path)
+    assert restored._offset == offset
+    assert list(restored.result.row_index.offsets) == list(analyzer.result.row_index.offsets)
+
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write("".join(rows[30:]))
+    assert restored._can_resume(path)
+    assert restored.analyze_incremental(path) == LogAnalyzer().analyze(path)
+
+
+def test_analyze_result_has_no_resume_state_after_partial_line(write_log):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows).rstrip("\n"))
+    analyzer = LogAnalyzer()
+    analyzer.analyze(path)
+    assert analyzer.resume_state() is None
+
+
+def test_least_recently_used_entry_is_evicted(write_log, tmp_path):
+    first = write_log("first.csv")
+    second = write_log("second.csv")
+    cache = _cache(tmp_path)
+    cache.put(first, LogAnalyzer().analyze(first))
+    entry_size = os.path.getsize(next(os.scandir(tmp_path / "cache")).path)
+
+    # 두 항목이 다 들어가지 않는 용량: 나중에 저장한 항목만 남음
+    cache.max_bytes = entry_size + entry_size // 2
+    os.utime(next(os.scandir(tmp_path / "cache")).path, (1, 1))
+    cache.put(second, LogAnalyzer().analyze(second))
+    assert cache.get(first) is None
+    assert cache.get(second) is not None
+
+
+def test_disabled_cache(write_log, tmp_path):
+    path = write_log()
+    cache = _cache(tmp_path, max_bytes=0)
+    assert not cache.put(path, LogAnalyzer().analyze(path))
+    assert cache.get(path) is None
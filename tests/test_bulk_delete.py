@@ -0,0 +1,125 @@
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+import bulk_delete
+from bulk_delete import DeleteFilter, parse_created_before, parse_grafana_time
+
+
+class StubAPI:
+    """
+    삭제 엔진이 사용하는 GrafanaAPI 메서드만 흉내 냅니다.
+    """
+    pool_size = 4
+
+    def __init__(self, datasources):
+        self.datasources = datasources
+        self.deleted = []
+        self._lock = threading.Lock()
+
+    def get_all_datasources(self):
+        return list(self.datasources)
+
+    def delete_datasource(self, ds_id):
+        with self._lock:
+            self.deleted.append(ds_id)
+        return True, ""
+
+
+def _ds(ds_id, name, created=None, ds_type=bulk_delete.CSV_DATASOURCE_TYPE):
+    json_data = {"createdAt": created} if created else {}
+    return {"id": ds_id, "name": name, "type": ds_type, "jsonData": json_data}
+
+
+def test_match_created():
+    before = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    item_filter = DeleteFilter(created_before=before)
+
+    assert item_filter.match_created(datetime(2024, 12, 31, tzinfo=timezone.utc))
+    assert not item_filter.match_created(datetime(2025, 1, 2, tzinfo=timezone.utc))
+    # 생성 시간을 알 수 없는 항목은 삭제하지 않음
+    assert not item_filter.match_created(None)
+    assert DeleteFilter().match_created(None)
+
+
+def test_parse_times():
+    assert parse_created_before("2025-01-01") == datetime(2025, 1, 1).astimezone()
+    assert parse_created_before(" 2025-01-01 12:30:00 ") == datetime(2025, 1, 1, 12, 30).astimezone()
+    with pytest.raises(ValueError):
+        parse_created_before("01/01/2025")
+
+    assert parse_grafana_time("2024-05-01T10:00:00Z") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+    assert parse_grafana_time("0001-01-01T00:00:00Z") is None
+    assert parse_grafana_time("") is None
+
+
+def test_match_name():
+    item_filter = DeleteFilter(gr_id="gr01", title_prefix="[GR01]_Test")
+    assert item_filter.match_name(bulk_delete.DASHBOARD, "[GR01]_Test_1")
+    assert not item_filter.match_name(bulk_delete.DASHBOARD, "[GR02]_Test_1")
+    assert DeleteFilter(gr_id="gr01").match_name(bulk_delete.DATASOURCE, "GR01_2025-10-23")
+
+
+def test_delete_datasources_created_before():
+    api = StubAPI([
+        _ds(1, "GR01_old", "2024-06-01T00:00:00+00:00"),
+        _ds(2, "GR01_new", "2025-06-01T00:00:00+00:00"),
+        _ds(3, "prometheus", ds_type="prometheus"),
+        _ds(4, "GR01_unknown"),
+    ])
+    item_filter = DeleteFilter(created_before=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    success, messages = bulk_delete.delete_items(api, bulk_delete.DATASOURCE, item_filter)
+    assert success
+    assert api.deleted == [1]
+    assert "성공: 1개" in messages[-1]
+
+
+def test_cancelled_bulk_delete_sends_nothing():
+    api = StubAPI([_ds(i, f"GR01_{i}") for i in range(1, 20)])
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert list(bulk_delete.iter_bulk_delete(api, bulk_delete.DATASOURCE, cancel_event=cancel_event)) == []
+    assert api.deleted == []
+
+
+def test_bulk_delete_all_items():
+    api = StubAPI([_ds(i, f"GR01_{i}") for i in range(1, 20)])
+    results = list(bulk_delete.iter_bulk_delete(api, bulk_delete.DATASOURCE, max_workers=3))
+    assert sorted(api.deleted) == list(range(1, 20))
+    assert all(result.success for result in results)
+
+
+class PagedDashboardAPI:
+    """
+    삭제된 항목이 빠지면 뒤 항목이 앞 페이지로 당겨지는 검색 결과
+    """
+    pool_size = 2
+    page_size = 3
+
+    def __init__(self, count):
+        self.dashboards = [{"uid": f"d{i}", "title": f"[GR01]_{i}"} for i in range(count)]
+        self._lock = threading.Lock()
+
+    def iter_search(self):
+        page = 0
+        while True:
+            with self._lock:
+                items = self.dashboards[page * self.page_size:(page + 1) * self.page_size]
+            yield from items
+            if len(items) < self.page_size:
+                return
+            page += 1
+
+    def delete_dashboard(self, uid):
+        with self._lock:
+            self.dashboards = [db for db in self.dashboards if db["uid"] != uid]
+        return True
+
+
+def test_dashboard_delete_rescans_shifted_pages():
+    api = PagedDashboardAPI(10)
+    success, _ = bulk_delete.delete_items(api, bulk_delete.DASHBOARD, max_workers=1)
+    assert success
+    assert api.dashboards == []
@@ -0,0 +1,68 @@
+import gzip
+import lzma
+
+import pytest
+
+import util
+from conftest import LOG_HEADER, log_rows
+from csv_window import extract_window
+from downsample import lttb_select_rows
+from log_analyzer import LogAnalyzer
+
+
+def _compress(path, ext):
+    with open(path, "rb") as f:
+        data = f.read()
+    if ext == ".gz":
+        packed = gzip.compress(data)
+    elif ext == ".xz":
+        packed = lzma.compress(data)
+    else:
+        zstandard = pytest.importorskip("zstandard")
+        packed = zstandard.ZstdCompressor().compress(data)
+
+    compressed = path + ext
+    with open(compressed, "wb") as f:
+        f.write(packed)
+    return compressed
+
+
+@pytest.fixture(params=[".gz", ".xz", ".zst"])
+def logs(request, write_log):
+    rows = log_rows(races=4)
+    path = write_log(text=LOG_HEADER + "".join(rows))
+    return rows, path, _compress(path, request.param)
+
+
+def test_analysis_matches_plain_file(logs):
+    _, path, compressed = logs
+    expected = LogAnalyzer().analyze(path)
+
+    assert LogAnalyzer().analyze(compressed, workers=2) == expected
+    analyzer = LogAnalyzer()
+    assert analyzer.analyze_incremental(compressed) == expected
+    # 압축 파일은 이어서 분석하지 않고 항상 처음부터
+    assert not analyzer._can_resume(compressed)
+    assert analyzer.analyze_incremental(compressed) == expected
+
+
+def test_extract_window_from_compressed(logs, tmp_path):
+    rows, path, compressed = logs
+    start, end = rows[30].split(",")[0], rows[45].split(",")[0]
+    row_index = LogAnalyzer().analyze(compressed).row_index
+
+    plain_dst, packed_dst = str(tmp_path / "plain.csv"), str(tmp_path / "packed.csv")
+    assert extract_window(compressed, packed_dst, start, end, row_index=row_index) == \
+        extract_window(path, plain_dst, start, end)
+    with open(plain_dst, "rb") as a, open(packed_dst, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_downsample_and_copy_compressed(logs, tmp_path):
+    _, path, compressed = logs
+    assert lttb_select_rows(compressed, ["speed"], 5) == lttb_select_rows(path, ["speed"], 5)
+
+    copied = str(tmp_path / "copied.csv")
+    util.copy_log_file(compressed, copied)
+    with open(path, "rb") as a, open(copied, "rb") as b:
+        assert a.read() == b.read()
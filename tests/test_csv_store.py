@@ -0,0 +1,151 @@
+import gzip
+import hashlib
+import os
+import stat
+import time
+
+import pytest
+
+import csv_store
+from conftest import LOG_HEADER, log_rows
+from csv_store import CsvStore, LINK_AUTO, LINK_COPY, LINK_HARDLINK
+from log_analyzer import LogAnalyzer
+from upload_pipeline import UploadOptions, prepare_upload_csv
+
+
+def _hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _age(path, seconds):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CsvStore(str(tmp_path / "csv"), LINK_COPY)
+
+
+def test_add_source_names_file_by_content_hash(write_log, store):
+    path = write_log()
+    text = _read(path)
+
+    stored, method = store.add_source(path, store.source_key(path))
+    assert method == LINK_COPY
+    assert stored == store.object_path(_hash(text))
+    assert _read(stored) == text
+
+    # 같은 내용은 다른 원본이어도 같은 파일
+    other = write_log("other.csv", text=text)
+    assert store.add_source(other) == (stored, "existing")
+
+
+def test_lookup_by_source_key(write_log, store):
+    path = write_log()
+    key = store.source_key(path)
+    assert store.lookup(key) is None
+    stored, _ = store.add_source(path, key)
+    assert store.lookup(key) == stored
+
+    # 인덱스는 파일에 저장되어 새 저장소 객체에서도 사용
+    assert CsvStore(store.root_dir).lookup(key) == stored
+    # 설정이 다르면 다른 키
+    assert store.source_key(path, window=("a", "b")) != key
+
+
+def test_compressed_source_is_decompressed(write_log, store, tmp_path):
+    text = _read(write_log())
+    gz_path = str(tmp_path / "log.csv.gz")
+    with gzip.open(gz_path, "wt", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+    store.link_mode = LINK_HARDLINK
+    stored, method = store.add_source(gz_path)
+    assert method == LINK_COPY
+    assert _read(stored) == text
+
+
+def test_auto_falls_back_to_copy_without_reflink(write_log, store, monkeypatch):
+    monkeypatch.setattr(csv_store, "_reflink", lambda src, dst: False)
+    store.link_mode = LINK_AUTO
+    path = write_log()
+    stored, method = store.add_source(path)
+    assert method == LINK_COPY
+    assert _read(stored) == _read(path)
+    assert os.stat(stored).st_nlink == 1
+
+
+def test_hardlink_settled_source(write_log, store):
+    store.link_mode = LINK_HARDLINK
+    path = write_log()
+    _age(path, csv_store.HARDLINK_MIN_AGE_SEC + 10)
+
+    stored, method = store.add_source(path, store.source_key(path))
+    assert method == LINK_HARDLINK
+    assert os.path.samefile(stored, path)
+
+
+def test_growing_source_is_copied_not_linked(write_log, store):
+    store.link_mode = LINK_HARDLINK
+    path = write_log()
+
+    stored, method = store.add_source(path)
+    assert method == LINK_COPY
+    assert not os.path.samefile(stored, path)
+
+
+def test_read_only_source_is_linked(write_log, store):
+    store.link_mode = LINK_HARDLINK
+    path = write_log()
+    os.chmod(path, stat.S_IRUSR)
+    try:
+        stored, method = store.add_source(path)
+        assert method == LINK_HARDLINK
+    finally:
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+
+
+def test_linked_entry_is_dropped_when_source_changes(write_log, store):
+    store.link_mode = LINK_HARDLINK
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows[:20]))
+    _age(path, csv_store.HARDLINK_MIN_AGE_SEC + 10)
+    key = store.source_key(path)
+    stored, _ = store.add_source(path, key)
+
+    # 오래된 로그에 다시 기록: 링크한 저장소 파일은 더 이상 해시와 내용이 맞지 않음
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write("".join(rows[20:]))
+    assert store.lookup(key) is None
+    assert not os.path.exists(stored)
+    assert os.path.exists(path)
+
+    # 같은 내용의 다른 파일을 넣으면 새로 만듦
+    copy = write_log("copy.csv", text=LOG_HEADER + "".join(rows[:20]))
+    store.link_mode = LINK_COPY
+    assert store.add_source(copy) == (stored, LINK_COPY)
+    assert _read(stored) == _read(copy)
+
+
+def test_prepare_upload_csv_reuses_stored_file(write_log, tmp_path):
+    path = write_log()
+    result = LogAnalyzer().analyze(path)
+    options = UploadOptions(json_path="", csv_dir=str(tmp_path / "csv"), store_link_mode=LINK_COPY)
+
+    # 같은 로그를 다시 준비하면 저장소의 파일을 그대로 사용
+    first = prepare_upload_csv(result, path, result.first_time, result.last_time, options)
+    second = prepare_upload_csv(result, path, result.first_time, result.last_time, options)
+    assert first == second
+    assert _read(first) == _read(path)
+
+    start, end = result.race_times[1]["start"], result.race_times[1]["end"]
+    window = prepare_upload_csv(result, path, start, end, options)
+    text = _read(window)
+    assert window == os.path.join(options.csv_dir, "store", _hash(text) + ".csv")
+    assert text.startswith(LOG_HEADER) and len(text) < len(_read(path))
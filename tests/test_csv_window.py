@@ -0,0 +1,74 @@
+import pytest
+
+from conftest import LOG_HEADER, log_rows
+from csv_window import extract_window
+from log_analyzer import LogAnalyzer, RowOffsetIndex
+
+
+def _row_index(rows, interval=100):
+    index = RowOffsetIndex(0, len(LOG_HEADER), interval)
+    offset = len(LOG_HEADER)
+    for row in rows:
+        index.add_line(offset, row)
+        offset += len(row)
+    return index
+
+
+def _read(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_extract_window_rows(write_log, tmp_path, use_index):
+    rows = log_rows(races=4)
+    src = write_log(text=LOG_HEADER + "".join(rows))
+    dst = str(tmp_path / "window.csv")
+    start, end = rows[30].split(",")[0], rows[40].split(",")[0]
+
+    row_index = _row_index(rows) if use_index else None
+    written, size = extract_window(src, dst, start, end, row_index=row_index)
+
+    text = _read(dst)
+    assert text == LOG_HEADER + "".join(rows[30:41])
+    assert (written, size) == (11, len(text.encode("utf-8")))
+
+
+def test_extract_window_padding(write_log, tmp_path):
+    rows = log_rows(races=2)
+    src = write_log(text=LOG_HEADER + "".join(rows))
+    dst = str(tmp_path / "window.csv")
+    start = end = rows[10].split(",")[0]
+
+    # 행 간격 50ms: 앞뒤 100ms 패딩이면 2행씩 더 포함
+    written, _ = extract_window(src, dst, start, end, padding_ms=100)
+    assert written == 5
+    assert _read(dst) == LOG_HEADER + "".join(rows[8:13])
+
+
+def test_stale_index_falls_back_to_data_start(write_log, tmp_path):
+    rows = log_rows(races=3)
+    src = write_log(text=LOG_HEADER + "".join(rows))
+    dst = str(tmp_path / "window.csv")
+
+    # 다른 파일 기준의 인덱스: 줄 중간을 가리키는 위치
+    stale = RowOffsetIndex(0, len(LOG_HEADER), 100)
+    stale.add(0, len(LOG_HEADER) + 7)
+    extract_window(src, dst, rows[20].split(",")[0], rows[25].split(",")[0], row_index=stale)
+    assert _read(dst) == LOG_HEADER + "".join(rows[20:26])
+
+
+def test_analyzer_records_row_index(write_log):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows))
+    row_index = LogAnalyzer().analyze(path).row_index
+
+    # 첫 데이터 행은 항상 샘플로 기록됨
+    assert row_index.data_start == len(LOG_HEADER)
+    assert list(row_index.offsets) == [len(LOG_HEADER)]
+    assert row_index.seek_offset(rows[-1].split(",")[0]) == len(LOG_HEADER)
+
+
+def test_invalid_window_time(write_log, tmp_path):
+    with pytest.raises(ValueError):
+        extract_window(write_log(), str(tmp_path / "window.csv"), "N/A", "N/A")
@@ -0,0 +1,92 @@
+import copy
+import json
+import os
+
+import pytest
+
+import dashboard_template
+from dashboard_template import (
+    DS_PLACEHOLDER, START_TIME_PLACEHOLDER, UPLOADER_HASH_FIELD, DashboardTemplate, content_hash, get_template
+)
+
+TEMPLATE = {
+    "dashboard": {
+        "title": "template",
+        "uid": "template-uid",
+        "time": {"from": "now-6h", "to": "now"},
+        "panels": [
+            {"datasource": {"uid": DS_PLACEHOLDER}, "targets": [{"datasource": {"uid": DS_PLACEHOLDER}}]},
+            {"title": "from " + START_TIME_PLACEHOLDER, "datasource": {"uid": "fixed"}},
+        ],
+    },
+    "timezone": "Asia/Seoul",
+}
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    path = tmp_path / "template.json"
+    path.write_text(json.dumps(TEMPLATE), encoding="utf-8")
+    return str(path)
+
+
+def test_render_substitutes_placeholders(template_path):
+    template = get_template(template_path)
+    rendered = template.render(
+        {DS_PLACEHOLDER: "ds-1"}, title="[GR01]_Test", uid="db-1",
+        start_iso="2025-10-23T15:00:00.000+09:00", end_iso="2025-10-23T15:10:00.000+09:00"
+    )
+    db = rendered["dashboard"]
+
+    assert (db["title"], db["uid"], db["refresh"]) == ("[GR01]_Test", "db-1", False)
+    assert db["time"] == {"from": "2025-10-23T15:00:00.000+09:00", "to": "2025-10-23T15:10:00.000+09:00"}
+    assert (db["timeFrom"], db["timeTo"]) == ("2025-10-23T15:00:00.000+09:00", "2025-10-23T15:10:00.000+09:00")
+    assert db["panels"][0]["datasource"]["uid"] == "ds-1"
+    assert db["panels"][0]["targets"][0]["datasource"]["uid"] == "ds-1"
+    assert db["panels"][1]["title"] == "from 2025-10-23T15:00:00.000+09:00"
+    assert db["panels"][1]["datasource"]["uid"] == "fixed"
+
+    # 템플릿은 바뀌지 않고, 바뀌지 않는 부분은 공유
+    assert template.payload == TEMPLATE
+    assert db["panels"][1]["datasource"] is template.payload["dashboard"]["panels"][1]["datasource"]
+
+
+def test_render_matches_json_round_trip(template_path):
+    rendered = get_template(template_path).render({DS_PLACEHOLDER: "ds-2"})
+    expected = json.loads(json.dumps(TEMPLATE).replace(DS_PLACEHOLDER, "ds-2"))
+    expected["dashboard"]["refresh"] = False
+    assert rendered == expected
+
+
+def test_template_without_dashboard_key():
+    template = DashboardTemplate("inline", copy.deepcopy(TEMPLATE["dashboard"]))
+    rendered = template.render({DS_PLACEHOLDER: "ds-3"}, title="t")
+    assert rendered["title"] == "t"
+    assert rendered["panels"][0]["datasource"]["uid"] == "ds-3"
+
+
+def test_get_template_reloads_only_when_file_changes(template_path):
+    dashboard_template._cache.clear()
+    first = get_template(template_path)
+    assert get_template(template_path) is first
+
+    changed = copy.deepcopy(TEMPLATE)
+    changed["dashboard"]["title"] = "changed template"
+    with open(template_path, "w", encoding="utf-8") as f:
+        json.dump(changed, f)
+    st = os.stat(template_path)
+    os.utime(template_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = get_template(template_path)
+    assert second is not first
+    assert second.dashboard()["title"] == "changed template"
+
+
+def test_content_hash_ignores_key_order_and_server_fields():
+    db = copy.deepcopy(TEMPLATE["dashboard"])
+    reordered = json.loads(json.dumps(db, sort_keys=True))
+    saved = dict(db, id=12, version=3, **{UPLOADER_HASH_FIELD: "old"})
+    assert content_hash(db) == content_hash(reordered) == content_hash(saved)
+
+    db["time"] = {"from": "now-1h", "to": "now"}
+    assert content_hash(db) != content_hash(reordered)
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from conftest import LOG_HEADER, log_rows
+from downsample import downsample_csv, lttb_select_rows, template_columns
+
+
+def _reference_lttb(points, threshold):
+    # 기준 구현: 전체 점을 메모리에 두는 일반적인 LTTB
+    n = len(points)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_range = points[avg_start:avg_end] or [points[-1]]
+        avg_x = sum(p[0] for p in avg_range) / len(avg_range)
+        avg_y = sum(p[1] for p in avg_range) / len(avg_range)
+
+        ax, ay = points[a]
+        best = max(
+            range(int(i * every) + 1, int((i + 1) * every) + 1),
+            key=lambda j: abs((ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay))
+        )
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return set(selected)
+
+
+def _single_section_log(write_log, count, seed=1):
+    rng = random.Random(seed)
+    rows = [row.split(",") for row in log_rows(races=count // 16 + 1)][:count]
+    values = [rng.uniform(0, 100) for _ in rows]
+    text = LOG_HEADER + "".join(f"{row[0]},DOWNHILL,1,{value:.3f}\n" for row, value in zip(rows, values))
+    return write_log(text=text), [(float(i), value) for i, value in enumerate(values)]
+
+
+def test_single_column_matches_reference_lttb(write_log):
+    path, points = _single_section_log(write_log, 500)
+    selected, total = lttb_select_rows(path, ["speed"], 40)
+
+    assert total == 500
+    # 행 간격이 일정하므로 x를 행 번호로 두어도 선택은 같음
+    assert selected == _reference_lttb(points, 40)
+
+
+def test_first_last_and_section_change_rows_are_kept(write_log):
+    rows = log_rows(races=6)
+    path = write_log(text=LOG_HEADER + "".join(rows))
+    selected, total = lttb_select_rows(path, ["speed"], 3)
+
+    sections = [row.split(",")[1] for row in rows]
+    changes = {i for i in range(len(rows)) if i == 0 or sections[i] != sections[i - 1]}
+    assert total == len(rows)
+    assert {0, total - 1} | changes <= selected
+    assert len(selected) < total
+
+
+def test_blank_lines_are_not_counted(write_log, tmp_path):
+    rows = log_rows(races=6)
+    text = LOG_HEADER + "".join(rows[:20]) + "\n\n" + "".join(rows[20:]) + "\n"
+    path = write_log(text=text)
+    selected, total = lttb_select_rows(path, ["speed"], 3)
+
+    assert total == len(rows)
+    assert total - 1 in selected
+
+    dst = str(tmp_path / "small.csv")
+    assert downsample_csv(path, dst, ["speed"], 3) == (total, len(selected))
+    with open(dst, encoding="utf-8", newline="") as f:
+        kept = f.read().splitlines(keepends=True)
+    assert kept[0] == LOG_HEADER
+    assert kept[-1] == rows[-1]
+
+
+@pytest.mark.parametrize("columns", [["speed"], ["missing"]])
+def test_short_logs_and_unknown_columns_keep_every_row(write_log, columns):
+    rows = log_rows(races=1)
+    path = write_log(text=LOG_HEADER + "".join(rows))
+    points = 3 if columns == ["missing"] else len(rows)
+    assert lttb_select_rows(path, columns, points) == (set(range(len(rows))), len(rows))
+
+
+def test_template_columns():
+    payload = {"dashboard": {"panels": [
+        {"type": "row", "panels": [{"targets": [{"schema": [
+            {"name": "speed", "type": "number"},
+            {"name": "time", "type": "time"}
+        ]}]}]},
+        {"targets": [{"schema": [{"name": "speed", "type": "number"}, {"name": "rpm", "type": "number"}]}]}
+    ]}}
+    assert template_columns(payload) == ["speed", "rpm"]
@@ -0,0 +1,99 @@
+from grafana_api import GrafanaAPI, RETRY_STATUS_CODES, dashboard_uid_for_title, datasource_uid_for_path
+
+
+def test_session_retry_settings():
+    api = GrafanaAPI(api_key="key", base_url="http://grafana.test", pool_size=4, timeout=3, retries=2, backoff=0.1)
+    retry = api._adapter.max_retries
+
+    assert api.session.headers["Authorization"] == "Bearer key"
+    assert api.session.get_adapter("https://grafana.test") is api._adapter
+    assert (retry.total, retry.backoff_factor) == (2, 0.1)
+    assert set(retry.status_forcelist) == set(RETRY_STATUS_CODES)
+    # 생성 요청이 두 번 보내지지 않도록 POST는 상태 코드로 재시도하지 않음
+    assert "POST" not in retry.allowed_methods
+    assert retry.is_retry("GET", 503) and not retry.is_retry("POST", 503)
+    api.close()
+
+
+def test_default_timeout_is_applied(monkeypatch):
+    api = GrafanaAPI(api_key="key", base_url="http://grafana.test", timeout=7)
+    calls = []
+    monkeypatch.setattr(api.session, "request", lambda method, url, **kwargs: calls.append(kwargs))
+
+    api._request("GET", "http://grafana.test/api/user")
+    api._request("GET", "http://grafana.test/api/user", timeout=1)
+    assert [call["timeout"] for call in calls] == [7, 1]
+
+
+def test_datasource_index_lookup(monkeypatch):
+    api = GrafanaAPI(api_key="key", base_url="http://grafana.test", ds_index_ttl=0)
+    listings = []
+
+    def fetch():
+        listings.append(1)
+        return [
+            {"id": 1, "uid": "a", "name": "first", "type": "csv", "url": "/data/a.csv"},
+            {"id": 2, "uid": "b", "name": "second", "type": "csv", "url": "/data/b.csv"},
+            {"id": 3, "uid": "c", "name": "prometheus", "type": "prometheus"},
+        ]
+    monkeypatch.setattr(api, "_fetch_datasources", fetch)
+
+    assert api.find_datasource_by_csv_path("/data/b.csv") == "b"
+    assert api.find_datasource_by_csv_path("/data/a.csv") == "a"
+    assert api.find_datasource_by_csv_path("/data/x.csv") is None
+    assert len(listings) == 1 # 목록 조회 1회로 모든 조회 처리
+
+    # 생성/삭제는 인덱스에 바로 반영
+    api._add_to_datasource_index({"id": 4, "uid": "x", "name": "new", "type": "csv", "url": "/data/x.csv"})
+    api._remove_from_datasource_index(1)
+    assert api.find_datasource_by_csv_path("/data/x.csv") == "x"
+    assert api.find_datasource_by_csv_path("/data/a.csv") is None
+    assert len(listings) == 1
+
+    api.invalidate_datasource_index()
+    assert api.find_datasource_by_csv_path("/data/a.csv") == "a"
+    assert len(listings) == 2
+
+
+def test_uids_are_deterministic():
+    title_uid = dashboard_uid_for_title("[GR01]_Test")
+    assert title_uid == dashboard_uid_for_title("[GR01]_Test")
+    assert title_uid != dashboard_uid_for_title("[GR02]_Test")
+    path_uid = datasource_uid_for_path("/var/lib/grafana/csv/a.csv")
+    assert path_uid == datasource_uid_for_path("/var/lib/grafana/csv/a.csv")
+    assert path_uid != datasource_uid_for_path("/var/lib/grafana/csv/b.csv")
+    # Grafana UID 최대 길이
+    assert len(title_uid) <= 40 and len(path_uid) <= 40
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, items):
+        self.items = items
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.items
+
+
+def test_iter_search_pages(monkeypatch):
+    api = GrafanaAPI(api_key="key", base_url="http://grafana.test")
+    dashboards = [{"uid": f"d{i}", "title": f"[GR01]_{i}"} for i in range(7)]
+    pages = []
+
+    def request(method, url, params=None, **kwargs):
+        pages.append((params["page"], params["limit"], params.get("tag")))
+        start = (params["page"] - 1) * params["limit"]
+        return _Response(dashboards[start:start + params["limit"]])
+    monkeypatch.setattr(api, "_request", request)
+
+    assert list(api.iter_search(page_size=3, tags=["gr"])) == dashboards
+    assert pages == [(1, 3, ["gr"]), (2, 3, ["gr"]), (3, 3, ["gr"])]
+
+    # 필요한 만큼만 페이지를 받음
+    pages.clear()
+    assert next(api.iter_search(page_size=3))["uid"] == "d0"
+    assert len(pages) == 1
@@ -0,0 +1,165 @@
+import os
+import threading
+
+import pytest
+
+from conftest import LOG_HEADER, log_rows
+from log_analyzer import AnalysisCancelled, LogAnalyzer
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def test_incremental_matches_analyze(write_log):
+    path = write_log()
+    assert LogAnalyzer().analyze_incremental(path) == LogAnalyzer().analyze(path)
+
+
+def test_resume_after_append_matches_full_analysis(write_log):
+    rows = log_rows(races=4)
+    path = write_log(text=LOG_HEADER + "".join(rows[:30]))
+
+    analyzer = LogAnalyzer()
+    analyzer.analyze_incremental(path)
+    _append(path, "".join(rows[30:]))
+
+    assert analyzer._can_resume(path)
+    result = analyzer.analyze_incremental(path)
+    assert result == LogAnalyzer().analyze(path)
+    assert result.total_race_count == 4
+
+
+@pytest.mark.parametrize("cut", [",DOWN", ",DOWNHILL,3,1", "", "2025-10-23 15:0"])
+def test_unterminated_last_line_is_held_back(write_log, cut):
+    rows = log_rows(races=2)
+    last = rows[-1]
+    # 기록 도중의 마지막 줄: 시간만, 섹션 일부, area 없음, 시간 일부
+    partial = cut if cut.startswith("2025") else last.split(",")[0] + cut
+    path = write_log(text=LOG_HEADER + "".join(rows[:-1]) + partial)
+
+    analyzer = LogAnalyzer()
+    result = analyzer.analyze_incremental(path)
+    assert analyzer.has_pending_line
+    assert result.last_time == rows[-2].split(",")[0]
+
+    # 보류한 줄의 시작부터 이어서 분석 (처음부터 다시 읽지 않음)
+    assert analyzer._can_resume(path)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(LOG_HEADER + "".join(rows))
+    result = analyzer.analyze_incremental(path)
+    assert not analyzer.has_pending_line
+    assert result == LogAnalyzer().analyze(path)
+
+
+def test_unchanged_file_with_pending_line_stays_resumable(write_log):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows) + rows[0].split(",")[0])
+
+    analyzer = LogAnalyzer()
+    first = analyzer.analyze_incremental(path)
+    last_time = first.last_time
+    for _ in range(2):
+        result = analyzer.analyze_incremental(path)
+        assert analyzer.has_pending_line and analyzer._can_resume(path)
+    assert result.last_time == last_time
+
+
+def test_analyze_reads_unterminated_last_line(write_log):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows).rstrip("\n"))
+    assert LogAnalyzer().analyze(path).last_time == rows[-1].split(",")[0]
+
+
+def test_short_rows_are_skipped(write_log):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows[:10]) + "2025-10-23 15:00:00.480\n" + "".join(rows[10:]))
+    expected = LogAnalyzer().analyze(write_log("full.csv", text=LOG_HEADER + "".join(rows)))
+    assert LogAnalyzer().analyze(path) == expected
+
+
+@pytest.mark.parametrize("method", ["analyze", "analyze_incremental"])
+def test_header_only_raises(write_log, method):
+    path = write_log(text=LOG_HEADER)
+    with pytest.raises(ValueError):
+        getattr(LogAnalyzer(), method)(path)
+
+
+def test_replaced_file_is_analyzed_from_start(write_log, tmp_path):
+    path = write_log(races=3)
+    analyzer = LogAnalyzer()
+    analyzer.analyze_incremental(path)
+
+    # 로테이션: 다른(더 짧은) 파일로 교체
+    other = write_log("other.csv", races=1)
+    os.replace(other, path)
+    assert not analyzer._can_resume(path)
+    assert analyzer.analyze_incremental(path) == LogAnalyzer().analyze(path)
+
+
+@pytest.mark.parametrize("method", ["analyze", "analyze_incremental"])
+def test_parallel_scan_matches_serial(write_log, monkeypatch, method):
+    import log_analyzer
+
+    rows = log_rows(races=12)
+    # 구간 경계에 잘린 행이 걸려도 결과가 같아야 함
+    rows.insert(40, "2025-10-23 15:00:02.000\n")
+    path = write_log(text=LOG_HEADER + "".join(rows) + "2025-10-23 15:0")
+    expected = getattr(LogAnalyzer(), method)(path)
+
+    monkeypatch.setattr(log_analyzer, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(log_analyzer, "PARALLEL_MIN_CHUNK_BYTES", 256)
+    analyzer = LogAnalyzer()
+    result = getattr(analyzer, method)(path, workers=2)
+    assert result == expected
+    assert result.total_race_count == 12
+
+
+def test_progress_reports_bytes_and_rows(write_log, monkeypatch):
+    import log_analyzer
+
+    monkeypatch.setattr(log_analyzer, "PROGRESS_INTERVAL_BYTES", 256)
+    rows = log_rows(races=3)
+    path = write_log(text=LOG_HEADER + "".join(rows))
+    reports = []
+    LogAnalyzer(progress_interval_sec=0).analyze(path, progress=reports.append)
+
+    assert len(reports) > 2
+    assert [p.bytes_done for p in reports] == sorted(p.bytes_done for p in reports)
+    assert (reports[-1].bytes_done, reports[-1].rows) == (os.path.getsize(path), len(rows))
+    assert reports[-1].fraction == 1.0
+    assert [p.done for p in reports].count(True) == 1 and reports[-1].done
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_cancel_event_stops_analysis(write_log, monkeypatch, workers):
+    import log_analyzer
+
+    monkeypatch.setattr(log_analyzer, "PROGRESS_INTERVAL_BYTES", 256)
+    monkeypatch.setattr(log_analyzer, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(log_analyzer, "PARALLEL_MIN_CHUNK_BYTES", 256)
+    path = write_log(races=6)
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(AnalysisCancelled):
+        LogAnalyzer().analyze(path, workers=workers, cancel_event=cancel_event)
+
+
+def test_summary_counts_data_rows_and_bytes(write_log):
+    rows = log_rows(races=4)
+    path = write_log(text=LOG_HEADER + "".join(rows[:30]) + "\n" + "".join(rows[30:50]))
+
+    analyzer = LogAnalyzer()
+    result = analyzer.analyze_incremental(path)
+    summary = analyzer.last_summary
+    assert (summary.bytes_read, summary.rows) == (os.path.getsize(path), 50)
+    assert (summary.races, summary.incremental) == (len(result.race_times), False)
+
+    # 이어서 분석하면 추가된 부분만
+    appended = "".join(rows[50:])
+    _append(path, appended)
+    analyzer.analyze_incremental(path)
+    summary = analyzer.last_summary
+    assert (summary.bytes_read, summary.rows) == (len(appended.encode("utf-8")), len(rows) - 50)
+    assert summary.incremental
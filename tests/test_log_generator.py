@@ -0,0 +1,25 @@
+import pytest
+
+from log_analyzer import LogAnalyzer
+from log_generator import generate_log
+
+
+@pytest.mark.parametrize("name", ["gen.csv", "gen.csv.gz"])
+def test_generated_log_matches_analysis(tmp_path, name):
+    info = generate_log(str(tmp_path / name), rows=3000, columns=8, races=4, seed=1)
+    result = LogAnalyzer().analyze(info.path)
+
+    assert result.total_race_count == info.races == 4
+    assert (result.first_time, result.last_time) == (info.first_time, info.last_time)
+
+
+def test_same_seed_same_content(tmp_path):
+    first = generate_log(str(tmp_path / "a.csv"), rows=500, columns=5, races=2, seed=7)
+    second = generate_log(str(tmp_path / "b.csv"), rows=500, columns=5, races=2, seed=7)
+    with open(first.path, "rb") as a, open(second.path, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_invalid_section_name(tmp_path):
+    with pytest.raises(ValueError):
+        generate_log(str(tmp_path / "bad.csv"), rows=10, section_sequence=["NOT_A_SECTION"])
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from log_analyzer import GrSections, LogAnalyzer
+from log_view_model import COL_CONTEXT, COL_RACE, COL_SECTION, COL_TIME, COL_TYPE, RACE_INFO_TYPE, LogTableModel
+
+
+@pytest.fixture
+def logs(write_log):
+    return LogAnalyzer().analyze(write_log(races=3)).logs
+
+
+def _column(model, column):
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+def test_rows_of_type(logs):
+    expected = [i for i, entry in enumerate(logs) if entry.log_type == RACE_INFO_TYPE]
+    assert list(logs.rows_of_type(RACE_INFO_TYPE)) == expected
+    assert list(logs.rows_of_type("UNKNOWN")) == []
+
+
+def test_model_shows_every_entry(logs):
+    model = LogTableModel()
+    model.set_table(logs)
+
+    assert model.rowCount() == len(logs)
+    assert _column(model, COL_TIME) == [entry.time for entry in logs]
+    assert _column(model, COL_TYPE) == [entry.log_type for entry in logs]
+    assert _column(model, COL_CONTEXT) == [entry.context for entry in logs]
+
+
+def test_race_filter(logs):
+    model = LogTableModel()
+    model.set_table(logs)
+    model.set_filter(race=2)
+
+    contexts = _column(model, COL_CONTEXT)
+    assert "RACE 2 START" in contexts[0]
+    assert not any("RACE 3 START" in context for context in contexts)
+    assert set(_column(model, COL_RACE)) == {2}
+
+    model.set_filter(race=9)
+    assert model.rowCount() == 0
+
+
+def test_section_filter(logs):
+    model = LogTableModel()
+    model.set_table(logs)
+    model.set_filter(race=1, section=GrSections.SECTION_DOWNHILL)
+
+    rows = [model.source_row(row) for row in range(model.rowCount())]
+    assert rows and all(logs[row].section_id == GrSections.SECTION_DOWNHILL for row in rows)
+    assert set(_column(model, COL_SECTION)) == {"DOWNHILL"}
+    assert model.time_at(0) == logs[rows[0]].time
+    assert model.time_at(model.rowCount()) is None
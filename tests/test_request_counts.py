@@ -0,0 +1,165 @@
+"""
+가짜 Grafana 서버로 업로드/삭제 작업의 경로별 요청 수를 확인합니다.
+(요청 수가 늘어나는 변경을 잡아내기 위한 테스트)
+"""
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+import fake_grafana as fg
+from bulk_delete import CSV_DATASOURCE_TYPE, DASHBOARD, DATASOURCE, DeleteFilter, delete_items
+from grafana_api import GrafanaAPI
+from log_analyzer import LogAnalyzer
+from upload_pipeline import UploadOptions, load_dashboard_template, race_jobs, upload_dashboard, upload_many
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_PATH = os.path.join(ROOT_DIR, "data", "grafana_dashboard_post.json")
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+@pytest.fixture
+def server():
+    with fg.FakeGrafana() as fake:
+        yield fake
+
+
+@pytest.fixture
+def api(server):
+    return GrafanaAPI(api_key="test", base_url=server.url)
+
+
+@pytest.fixture
+def template():
+    return load_dashboard_template(TEMPLATE_PATH)
+
+
+def _counts(server):
+    return {route: n for route, n in server.request_counts.items() if n}
+
+
+def _upload(api, template, end_time="2025-10-23 15:01:00.000"):
+    return upload_dashboard(
+        api, template,
+        csv_path="C:/logs/gr01.csv",
+        title="[GR01]_Test",
+        gr_name="GR01",
+        first_time="20251023_150000",
+        start_time="2025-10-23 15:00:00.000",
+        end_time=end_time,
+        log=_quiet,
+    )
+
+
+def test_upload_dashboard_request_counts(server, api, template):
+    is_success, _ = _upload(api, template)
+    assert is_success
+    assert _counts(server) == {
+        fg.ROUTE_DS_LIST: 1,
+        fg.ROUTE_DS_CREATE: 1,
+        fg.ROUTE_DB_GET: 1,
+        fg.ROUTE_DB_POST: 1,
+    }
+    assert [db["title"] for db in server.dashboards().values()] == ["[GR01]_Test"]
+
+    # 같은 내용을 다시 올리면 해시 비교만 하고 POST 생략 (데이터 소스는 인덱스에서 찾음)
+    server.reset_counts()
+    is_success, dashboard_data = _upload(api, template)
+    assert is_success and dashboard_data["status"] == "unchanged"
+    assert _counts(server) == {fg.ROUTE_DB_GET: 1}
+
+    # 시간 범위가 바뀌면 덮어씀
+    server.reset_counts()
+    assert _upload(api, template, end_time="2025-10-23 15:02:00.000")[0]
+    assert _counts(server) == {fg.ROUTE_DB_GET: 1, fg.ROUTE_DB_POST: 1}
+    assert len(server.datasources()) == 1
+
+
+def test_upload_many_request_counts(server, api, template, write_log, tmp_path):
+    path = write_log(races=3)
+    result = LogAnalyzer().analyze(path)
+    jobs = race_jobs(result, "[GR01]_Test")
+    options = UploadOptions(json_path=TEMPLATE_PATH, csv_dir=str(tmp_path / "upload"))
+    assert len(jobs) > 1
+
+    job_results = upload_many(api, template, result, path, "GR01", jobs, options, max_workers=2, log=_quiet)
+    assert all(job_result.success for job_result in job_results)
+    # 데이터 소스 목록은 모든 작업이 같은 인덱스를 써서 한 번만 조회
+    n = len(jobs)
+    assert _counts(server) == {fg.ROUTE_DS_LIST: 1, fg.ROUTE_DS_CREATE: n, fg.ROUTE_DB_GET: n, fg.ROUTE_DB_POST: n}
+    assert sorted(db["title"] for db in server.dashboards().values()) == [job.title for job in jobs]
+
+    # 다시 올리면 모두 변경 없음으로 생략
+    server.reset_counts()
+    job_results = upload_many(api, template, result, path, "GR01", jobs, options, max_workers=2, log=_quiet)
+    assert all(job_result.unchanged for job_result in job_results)
+    assert _counts(server) == {fg.ROUTE_DB_GET: n}
+
+
+def test_cancelled_upload_many_sends_no_requests(server, api, template, write_log, tmp_path):
+    path = write_log(races=2)
+    result = LogAnalyzer().analyze(path)
+    jobs = race_jobs(result, "[GR01]_Test")
+    options = UploadOptions(json_path=TEMPLATE_PATH, csv_dir=str(tmp_path / "upload"))
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    job_results = upload_many(api, template, result, path, "GR01", jobs, options, log=_quiet, cancel_event=cancel_event)
+    assert [job_result.cancelled for job_result in job_results] == [True] * len(jobs)
+    assert _counts(server) == {}
+
+
+def test_delete_datasources_created_before(server, api):
+    server.add_datasource({"name": "Prometheus", "type": "prometheus"})
+    server.add_datasource({
+        "name": "GR01_old", "type": CSV_DATASOURCE_TYPE,
+        "jsonData": {"createdAt": "2020-01-01T00:00:00Z"},
+    })
+    server.add_datasource({
+        "name": "GR01_new", "type": CSV_DATASOURCE_TYPE,
+        "jsonData": {"createdAt": "2025-01-01T00:00:00Z"},
+    })
+    server.reset_counts()
+
+    success, _ = delete_items(api, DATASOURCE, DeleteFilter(created_before=datetime(2021, 1, 1)))
+    assert success
+    # 생성 시간이 없는 데이터 소스(Prometheus)는 지우지 않음
+    assert sorted(ds["name"] for ds in server.datasources()) == ["GR01_new", "Prometheus"]
+    assert _counts(server) == {fg.ROUTE_DS_LIST: 1, fg.ROUTE_DS_DELETE: 1}
+
+
+def test_delete_dashboards_request_counts(server, api):
+    server.add_dashboard({"title": "[GR01]_old"}, created="2020-01-01T00:00:00Z")
+    server.add_dashboard({"title": "[GR01]_new"}, created="2025-01-01T00:00:00Z")
+    server.add_dashboard({"title": "[GR02]_old"}, created="2020-01-01T00:00:00Z")
+    server.reset_counts()
+
+    success, _ = delete_items(api, DASHBOARD, DeleteFilter(gr_id="GR01", created_before=datetime(2021, 1, 1)))
+    assert success
+    titles = sorted(db["title"] for db in server.dashboards().values())
+    assert titles == ["[GR01]_new", "[GR02]_old"]
+    # 검색은 새 항목이 없을 때까지 반복, 생성 시간은 이름이 맞는 대시보드만 조회
+    assert _counts(server) == {fg.ROUTE_SEARCH: 2, fg.ROUTE_DB_GET: 2, fg.ROUTE_DB_DELETE: 1}
+
+
+def test_iter_search_pages(server, api):
+    for i in range(7):
+        server.add_dashboard({"title": f"[GR01]_{i:02d}"})
+    server.reset_counts()
+
+    titles = [db["title"] for db in api.iter_search(page_size=3)]
+    assert sorted(titles) == [f"[GR01]_{i:02d}" for i in range(7)]
+    assert _counts(server) == {fg.ROUTE_SEARCH: 3}
+
+
+def test_injected_errors_are_retried(server, api):
+    server.inject_error(fg.ROUTE_SEARCH, status=503, count=1)
+    server.add_dashboard({"title": "[GR01]_retry"})
+    server.reset_counts()
+
+    assert [db["title"] for db in api.iter_search()] == ["[GR01]_retry"]
+    assert _counts(server) == {fg.ROUTE_SEARCH: 2}
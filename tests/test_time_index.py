@@ -0,0 +1,34 @@
+from log_analyzer import GrSections, LogAnalyzer, TimeIndex
+
+
+def _linear_section_at(result, time):
+    # 기준: 섹션 변경 기록을 앞에서부터 훑어 time 이전의 마지막 섹션
+    section = None
+    for race_num in sorted(result.race_section_changes):
+        for section_id, changed in result.race_section_changes[race_num]:
+            if changed <= time:
+                section = section_id
+    return section
+
+
+def test_queries_match_linear_scan(write_log):
+    result = LogAnalyzer().analyze(write_log(races=3))
+    index = TimeIndex.from_result(result)
+
+    for entry in result.logs:
+        assert index.section_at(entry.time) == _linear_section_at(result, entry.time)
+
+    race = result.race_times[2]
+    assert index.race_at(race["start"]) == 2
+    assert index.race_at("2000-01-01 00:00:00.000") is None
+    assert index.section_at(race["start"]) == GrSections.SECTION_BOARDINGIC
+
+
+def test_transitions_between_race_range(write_log):
+    result = LogAnalyzer().analyze(write_log(races=3))
+    index = TimeIndex.from_result(result)
+
+    race = result.race_times[1]
+    transitions = [t for t in index.transitions_between(race["start"], race["end"]) if t[0] == 1]
+    assert [(section, time) for _, section, time in transitions] == list(result.race_section_changes[1])
+    assert index.transitions_between(None, race["end"]) == []
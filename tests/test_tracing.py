@@ -0,0 +1,57 @@
+import json
+import os
+
+import fake_grafana as fg
+import tracing
+from grafana_api import GrafanaAPI
+from conftest import LOG_HEADER, log_rows
+from log_analyzer import LogAnalyzer
+
+
+def test_nested_spans_and_chrome_trace(tmp_path):
+    tracer = tracing.Tracer("test")
+    with tracing.activate(tracer):
+        with tracing.span("outer", "pipeline", title="t"):
+            with tracing.span("inner", "pipeline") as inner:
+                inner.set(rows=3)
+    assert tracing.active_tracer() is None
+
+    records = {r.name: r for r in tracer.records}
+    assert (records["outer"].depth, records["inner"].depth) == (0, 1)
+    assert records["inner"].args == {"rows": 3}
+
+    trace = json.loads(open(tracer.write(str(tmp_path / "trace" / "t.json")), encoding="utf-8").read())
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in spans] == ["outer", "inner"]
+    assert spans[0]["ts"] <= spans[1]["ts"] and spans[1]["dur"] <= spans[0]["dur"]
+    assert tracer.summary_lines()[:2] == [
+        f"outer: {records['outer'].duration_sec:.3f}초",
+        f"  inner: {records['inner'].duration_sec:.3f}초",
+    ]
+
+
+def test_nothing_is_recorded_without_active_tracer(write_log):
+    tracer = tracing.Tracer()
+    LogAnalyzer().analyze(write_log())
+    with tracing.span("ignored") as span:
+        span.set(a=1)
+    assert tracer.records == []
+
+
+def test_analyzer_and_http_spans(write_log):
+    rows = log_rows(races=3)
+    path = write_log(text=LOG_HEADER + "".join(rows))
+    tracer = tracing.Tracer()
+    with fg.FakeGrafana() as server, tracing.activate(tracer):
+        api = GrafanaAPI(api_key="test", base_url=server.url)
+        LogAnalyzer().analyze(path)
+        assert list(api.iter_search()) == []
+
+    by_cat = {}
+    for record in tracer.records:
+        by_cat.setdefault(record.cat, []).append(record)
+    analyze = next(r for r in by_cat["analyzer"] if r.name.endswith("analyze"))
+    assert analyze.args["completed"]
+    assert (analyze.args["rows"], analyze.args["bytes_read"]) == (len(rows), os.path.getsize(path))
+    http = by_cat[tracing.HTTP_CATEGORY]
+    assert [(r.args["method"], r.args["status"]) for r in http] == [("GET", 200)]
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+import cli
+import upload_pipeline
+from analysis_cache import AnalysisCache
+from conftest import LOG_HEADER, log_rows
+from log_analyzer import LogAnalyzer
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AnalysisCache(cache_dir=str(tmp_path / "cache"), max_bytes=1024 * 1024)
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def test_cache_hit_restores_resume_state(write_log, cache):
+    rows = log_rows(races=4)
+    path = write_log(text=LOG_HEADER + "".join(rows[:30]))
+    first = upload_pipeline.analyze_log(path, cache=cache)
+
+    # 재시작 후 캐시에서 불러온 analyzer는 추가된 행만 이어서 분석
+    analyzer = LogAnalyzer()
+    assert upload_pipeline.analyze_log(path, analyzer=analyzer, cache=cache) == first
+    assert analyzer._offset == os.path.getsize(path)
+
+    _append(path, "".join(rows[30:]))
+    assert analyzer._can_resume(path)
+    assert upload_pipeline.analyze_log(path, analyzer=analyzer, cache=cache) == LogAnalyzer().analyze(path)
+
+
+def test_result_with_pending_line_is_not_cached(write_log, cache):
+    rows = log_rows(races=2)
+    path = write_log(text=LOG_HEADER + "".join(rows[:-1]) + rows[-1].split(",")[0])
+
+    upload_pipeline.analyze_log(path, cache=cache)
+    assert cache.get(path) is None
+
+
+def test_make_title():
+    assert upload_pipeline.make_title("gr01", "Test") == "[GR01]_Test"
+
+
+def test_parse_race_spec(write_log):
+    result = LogAnalyzer().analyze(write_log(races=5))
+
+    assert cli.parse_race_spec("all", result) == [None]
+    assert cli.parse_race_spec("each", result) == [0, 1, 2, 3, 4, 5]
+    assert cli.parse_race_spec("1,3-4,3", result) == [1, 3, 4]
+    with pytest.raises(ValueError):
+        cli.parse_race_spec("9", result)
+
+
+def test_format_title():
+    assert cli.format_title("{stem}_{date}", "log", None, "2025-10-23 15:00:00.000") == "log_2025-10-23"
+    assert cli.format_title("{stem}", "log", 3, "") == "log_R03"
+    assert cli.format_title("{race}-{stem}", "log", 3, "") == "R03-log"
@@ -0,0 +1,285 @@
+import os
+import json
+import time
+import threading
+import functools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# HTTP 요청 구간의 분류 이름 (요약에서 따로 집계)
+HTTP_CATEGORY = "http"
+
+# 요약에 표시하는 가장 오래 걸린 HTTP 요청 수
+SUMMARY_SLOWEST_HTTP = 3
+
+
+@dataclass
+class SpanRecord:
+    """
+    끝난 구간 하나의 기록 (시간은 time.perf_counter_ns 기준)
+    """
+    name: str
+    cat: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    thread_name: str
+    depth: int # 같은 스레드 안에서의 중첩 깊이 (0이면 최상위)
+    args: Dict[str, Any]
+
+    @property
+    def duration_sec(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class Span:
+    """
+    진행 중인 구간. set()으로 결과 정보(HTTP 상태, 바이트 수 등)를 추가합니다.
+    """
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.depth = 0
+        self.start_ns = 0
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        stack = self._tracer._stack()
+        self.depth = len(stack)
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        stack = self._tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        thread = threading.current_thread()
+        self._tracer._add(SpanRecord(
+            self.name, self.cat, self.start_ns, end_ns, thread.ident or 0, thread.name, self.depth, self.args
+        ))
+        return False
+
+
+class _NullSpan:
+    """
+    추적 중이 아닐 때 사용하는 빈 구간 (기록하지 않음)
+    """
+    recording = False
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    구간(span) 기록기. 여러 스레드에서 동시에 구간을 기록해도 되며, 중첩은 스레드마다 따로 추적합니다.
+    기록은 Chrome trace(JSON) 형식으로 저장하여 chrome://tracing 또는 https://ui.perfetto.dev 에서 볼 수 있습니다.
+    """
+    def __init__(self, name: str = "trace"):
+        self.name = name
+        self.records: List[SpanRecord] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin_ns = time.perf_counter_ns()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _add(self, record: SpanRecord):
+        with self._lock:
+            self.records.append(record)
+
+    def span(self, name: str, cat: str = "", **args) -> Span:
+        return Span(self, name, cat, args)
+
+    def current(self) -> Optional[Span]:
+        """
+        현재 스레드에서 진행 중인 가장 안쪽 구간
+        """
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    # --- 저장 ---
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Chrome trace 이벤트 형식 (구간은 "X" 이벤트, 시간 단위 us)
+        """
+        pid = os.getpid()
+        with self._lock:
+            records = list(self.records)
+
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.name}}
+        ]
+        thread_names: Dict[int, str] = {}
+        for record in sorted(records, key=lambda r: r.start_ns):
+            thread_names.setdefault(record.thread_id, record.thread_name)
+            events.append({
+                "name": record.name,
+                "cat": record.cat or "default",
+                "ph": "X",
+                "ts": (record.start_ns - self._origin_ns) / 1000,
+                "dur": (record.end_ns - record.start_ns) / 1000,
+                "pid": pid,
+                "tid": record.thread_id,
+                "args": record.args,
+            })
+        for thread_id, thread_name in thread_names.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> str:
+        """
+        Chrome trace JSON 파일로 저장하고 경로를 반환합니다. (폴더가 없으면 생성)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return path
+
+    # --- 요약 ---
+
+    def summary_lines(self) -> List[str]:
+        """
+        이벤트 로그용 요약: 최상위 구간과 그 아래 단계별 시간, HTTP 요청 수/상태/바이트, 가장 오래 걸린 요청
+        """
+        with self._lock:
+            records = sorted(self.records, key=lambda r: r.start_ns)
+        if not records:
+            return []
+
+        lines: List[str] = []
+        roots = [r for r in records if r.depth == 0 and r.cat != HTTP_CATEGORY]
+        for root in roots:
+            lines.append(f"{root.name}: {root.duration_sec:.3f}초")
+            for child in records:
+                if (child.depth == 1 and child.thread_id == root.thread_id
+                        and root.start_ns <= child.start_ns and child.end_ns <= root.end_ns):
+                    error = f" ({child.args['error']})" if "error" in child.args else ""
+                    lines.append(f"  {child.name}: {child.duration_sec:.3f}초{error}")
+
+        http = [r for r in records if r.cat == HTTP_CATEGORY]
+        if http:
+            methods = Counter(r.args.get("method", "?") for r in http)
+            statuses = Counter(str(r.args.get("status", r.args.get("error", "?"))) for r in http)
+            sent = sum(r.args.get("request_bytes", 0) for r in http)
+            received = sum(r.args.get("response_bytes", 0) for r in http)
+            lines.append(
+                f"HTTP 요청 {len(http)}회 ({', '.join(f'{m} {n}' for m, n in methods.most_common())}), "
+                f"합계 {sum(r.duration_sec for r in http):.3f}초"
+            )
+            lines.append(
+                f"  상태: {', '.join(f'{s} x{n}' for s, n in statuses.most_common())}, "
+                f"보냄 {sent / 1024:,.1f} KB, 받음 {received / 1024:,.1f} KB"
+            )
+            for r in sorted(http, key=lambda r: r.end_ns - r.start_ns, reverse=True)[:SUMMARY_SLOWEST_HTTP]:
+                lines.append(f"  {r.name} -> {r.args.get('status', r.args.get('error', '?'))}: {r.duration_sec:.3f}초")
+        return lines
+
+
+# --- 모듈 함수: 현재 활성화된 Tracer에 기록 (없으면 아무것도 하지 않음) ---
+
+_active: Optional[Tracer] = None
+_active_lock = threading.Lock()
+
+
+class activate:
+    """
+    with 블록 동안 tracer를 활성화합니다. 활성화 중에는 모든 스레드의 span()이 tracer에 기록됩니다.
+    (GUI 작업 스레드는 한 번에 하나만 실행되므로 프로세스 전체에 하나의 Tracer만 활성화)
+    """
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._previous: Optional[Tracer] = None
+
+    def __enter__(self) -> Tracer:
+        global _active
+        with _active_lock:
+            self._previous = _active
+            _active = self.tracer
+        return self.tracer
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active
+        with _active_lock:
+            _active = self._previous
+        return False
+
+
+def active_tracer() -> Optional[Tracer]:
+    return _active
+
+
+def span(name: str, cat: str = "", **args):
+    """
+    구간 기록: with tracing.span("이름", cat="분류", 키=값) as s: ... s.set(키=값)
+    활성화된 Tracer가 없으면 기록하지 않는 빈 구간을 반환합니다. (추적하지 않을 때 비용 최소화)
+    """
+    tracer = _active
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, cat, **args)
+
+
+def annotate(**args):
+    """
+    현재 스레드에서 진행 중인 구간에 정보를 추가합니다. (추적 중이 아니면 무시)
+    """
+    tracer = _active
+    if tracer is None:
+        return
+    current = tracer.current()
+    if current is not None:
+        current.set(**args)
+
+
+def traced(name: Optional[str] = None, cat: str = ""):
+    """
+    함수 호출 전체를 구간으로 기록하는 데코레이터. (이름을 생략하면 함수의 qualname 사용)
+    """
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return fn(*args, **kwargs)
+            with span(span_name, cat):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_file_path(trace_dir: str, prefix: str) -> str:
+    """
+    trace_dir/<prefix>_YYYYmmdd_HHMMSS_fff.json 경로
+    """
+    now = time.time()
+    stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}"
+    return os.path.join(trace_dir, f"{prefix}_{stamp}.json")
@@ -1,24 +1,25 @@
 import os
-import time # 쿨타임 관리를 위해 time 모듈 추가
 from PySide6.QtWidgets import ( # 💡 PyQt6 -> PySide6로 변경
     QApplication, QWidget, QPushButton, QVBoxLayout, 
     QHBoxLayout, QLabel, QLineEdit, QGridLayout, QComboBox,
-    QGroupBox, QFileDialog, QTextEdit, QMessageBox
+    QGroupBox, QFileDialog, QTextEdit, QMessageBox, QProgressBar,
+    QTableView, QHeaderView, QAbstractItemView, QMenu
 )
 from PySide6.QtGui import QIcon # PySide6 유지
-from PySide6.QtCore import Qt # 💡 PyQt6 -> PySide6로 변경
+from PySide6.QtCore import Qt, QThreadPool, QTimer # 💡 PyQt6 -> PySide6로 변경
 
-from datetime import datetime
-import shutil
 import json
 from enum import IntEnum
-import uuid
 
-from grafana_api import GrafanaAPI
 from config_manager import ConfigManager
 
-from log_analyzer import LogAnalyzer, AnalysisResult, LogEntry, GrSections, MODE_TABLE
+from log_analyzer import LogAnalyzer, AnalysisResult, AnalysisProgress, MODE_TABLE, TimeIndex
+from analysis_cache import AnalysisCache
+from ui_workers import Worker, StepProgress, TaskFailed, traced_task
+from log_view_model import LogTableModel
 import util
+import tracing
+import upload_pipeline
 
 # --- 1. 윈도우 크기 매크로(상수) 정의 ---
 WINDOW_WIDTH = 1200
@@ -36,6 +37,12 @@ DELETE_COOLDOWN_SECONDS = 2.0 # Delete 쿨타임 2초 설정
 
 INVALID_RACE_NUM = -1
 
+PROGRESS_BAR_MAX = 1000 # 분석 진행률 표시 단위 (0.1%)
+MB = 1024 * 1024
+
+# 창을 닫을 때 취소한 작업이 멈추기를 기다리는 최대 시간
+CLOSE_WAIT_MS = 5000
+
 class UI_State(IntEnum):
     INIT_STATE = 0      # 초기 상태 (로그 분석 필요)
     ANALYZE_STATE = 1   # 로그 분석 완료 상태 (업로드 가능)
@@ -63,6 +70,10 @@ class UI_Tool(QWidget):
 
         self.config = ConfigManager()
         self.analysis_result = None
+        self.time_index = None # 분석 결과의 시간 인덱스 (섹션/레이스 시간 조회용)
+        self.race_transitions = [] # 선택한 레이스의 섹션 변경 (레이스 번호, 섹션, 시간): start/end selector 항목 순서
+        self.log_analyzer = LogAnalyzer() # 같은 파일 재분석 시 추가된 부분만 읽기 위해 유지
+        self.analysis_cache = self._create_analysis_cache()
         
         
         self.setWindowTitle(WINDOW_TITLE)
@@ -73,28 +84,20 @@ class UI_Tool(QWidget):
             int(self.config.get(key="WINDOW_HEIGHT", section='DEFAULT'))
         )
 
-        api_key = self.config.get(section='API', key="api_key")
-        server_url = self.config.get(section='API', key="server_url")
-        
-        if not api_key or not server_url:
-            error_msg = (
-                "오류: API 설정이 누락되었습니다.\n\n"
-                f"- server_url: {'OK' if server_url else 'X (누락)'}\n"
-                f"- api_key: {'OK' if api_key else 'X (누락)'}\n\n"
-                "config.ini 파일의 [API] 섹션을 확인하여 입력"
-            )
+        self.api, api_msg = upload_pipeline.create_api(self.config)
+
+        if self.api is None:
+            error_msg = api_msg
             print(error_msg)
             # 사용자에게 오류 메시지 표시
             QMessageBox.critical(self, "설정 오류", error_msg)
             
             # 유효하지 않으면 API 객체를 초기화하지 않고 종료 준비
-            self.api = None 
             self._is_config_valid = False
             return 
         else:
-            self.api = GrafanaAPI(base_url=server_url, api_key=api_key)
             self._is_config_valid = True
-            print("INFO: API 설정 확인 완료. Grafana API 객체 초기화 성공.")
+            print(api_msg)
         
         
         # 상태 및 쿨타임 관리 변수
@@ -105,6 +108,11 @@ class UI_Tool(QWidget):
         
         self.btn_lock = False
         self.selected_race = INVALID_RACE_NUM
+
+        # 분석/업로드/삭제 작업 스레드 (한 번에 하나의 작업만 실행)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self._worker = None
         
         # 초기 입력값 설정
         self.last_title = self.config.get('DEFAULT_DASHBOARD_NAME')
@@ -156,12 +164,15 @@ class UI_Tool(QWidget):
         button_group = QHBoxLayout()
         self.analyze_button = QPushButton('1. 로그 분석')
         self.upload_button = QPushButton('2. 대시보드 업로드')
+        self.upload_all_button = QPushButton('전체 레이스 업로드')
         self.clear_button = QPushButton('초기화 (Clear)')
         self.analyze_button.clicked.connect(self.click_analyze)
         self.upload_button.clicked.connect(self.click_upload)
+        self.upload_all_button.clicked.connect(self.click_upload_all_races)
         self.clear_button.clicked.connect(self.click_clearbtn)
         button_group.addWidget(self.analyze_button)
         button_group.addWidget(self.upload_button)
+        button_group.addWidget(self.upload_all_button)
         button_group.addWidget(self.clear_button)
         main_layout.addLayout(button_group)
         
@@ -221,12 +232,43 @@ class UI_Tool(QWidget):
         csv_log_label_group = QGroupBox("csv 로그 분석")
         csv_log_label_layout = QVBoxLayout(csv_log_label_group)
         
-        self.csv_log_label = QTextEdit()
-        self.csv_log_label.setReadOnly(True)
+        # 분석 요약 / 상태 표시
+        self.csv_log_label = QLabel()
+        self.csv_log_label.setWordWrap(True)
+        self.csv_log_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.csv_log_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border: none;")
         self.csv_log_label.setText("")
-        
         csv_log_label_layout.addWidget(self.csv_log_label)
+
+        # 섹션 필터 (레이스 필터는 Race 선택을 따라감)
+        log_filter_layout = QHBoxLayout()
+        log_filter_layout.addWidget(QLabel('섹션 필터:'))
+        self.section_filter_selector = QComboBox()
+        self.section_filter_selector.addItem("전체 섹션", None)
+        for section_id, section_name in MODE_TABLE.items():
+            self.section_filter_selector.addItem(section_name, section_id)
+        self.section_filter_selector.currentIndexChanged.connect(self._apply_log_filter)
+        log_filter_layout.addWidget(self.section_filter_selector)
+        log_filter_layout.addStretch(1)
+        csv_log_label_layout.addLayout(log_filter_layout)
+
+        # 로그 테이블 (보이는 행만 그리는 모델/뷰, 우클릭으로 시작/종료 시간 설정)
+        self.log_model = LogTableModel(self)
+        self.log_view = QTableView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.log_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.log_view.setWordWrap(False)
+        self.log_view.verticalHeader().setVisible(False)
+        # 행 높이를 고정해야 행마다 높이를 계산하지 않음 (항목이 많을 때 스크롤 성능)
+        self.log_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.log_view.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 6)
+        self.log_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.log_view.horizontalHeader().setStretchLastSection(True)
+        self.log_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.log_view.customContextMenuRequested.connect(self._show_log_context_menu)
+        csv_log_label_layout.addWidget(self.log_view, 1)
+
         bottom_h_layout.addWidget(csv_log_label_group, 3)
 
         # ------------------ 우측: 상세 로그 이벤트 및 상태 알림 ------------------
@@ -241,6 +283,22 @@ class UI_Tool(QWidget):
         self.event_label.setText("")
         
         event_log_layout.addWidget(self.event_label)
+
+        # 작업 진행 표시 (작업 중에만 표시)
+        progress_h_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.cancel_button = QPushButton('취소')
+        self.cancel_button.setFixedWidth(80)
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.click_cancel)
+        progress_h_layout.addWidget(self.progress_bar)
+        progress_h_layout.addWidget(self.cancel_button)
+        event_log_layout.addLayout(progress_h_layout)
+
+        self.progress_label = QLabel('')
+        event_log_layout.addWidget(self.progress_label)
+
         right_panel_v_layout.addWidget(event_log_group, 5)
         
         bottom_h_layout.addLayout(right_panel_v_layout, 3)
@@ -308,8 +366,8 @@ class UI_Tool(QWidget):
         last_abs_path = os.path.abspath(last_path)
 
         if os.path.isfile(last_abs_path):
-            # csv 파일이면 파일반환, 아니라면 디렉토리 반환
-            if last_abs_path.lower().endswith('.csv'):
+            # csv(압축 포함) 파일이면 파일반환, 아니라면 디렉토리 반환
+            if util.is_log_file_path(last_abs_path):
                 return last_abs_path
             else:
                 return os.path.dirname(last_abs_path)
@@ -340,6 +398,18 @@ class UI_Tool(QWidget):
         return default_abs_path
 
 
+    def _get_analyze_workers(self) -> int:
+        """
+        설정의 ANALYZE_WORKERS 값을 읽어 로그 분석 프로세스 수를 반환합니다. (0 또는 미설정: CPU 코어 수)
+        """
+        return upload_pipeline.get_analyze_workers(self.config)
+
+    def _create_analysis_cache(self) -> AnalysisCache:
+        """
+        설정의 ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_MAX_MB로 분석 결과 캐시를 생성합니다. (MAX_MB가 0이면 사용 안 함)
+        """
+        return upload_pipeline.create_analysis_cache(self.config)
+
     def _check_lock(self):
         """중복 클릭 방지 체크"""
         return self.btn_lock
@@ -379,7 +449,7 @@ class UI_Tool(QWidget):
             self, 
             "CSV 파일 선택", 
             last_dir,
-            "CSV Files (*.csv);;All Files (*)"
+            "CSV Files (*.csv *.csv.gz *.csv.xz *.csv.zst);;All Files (*)"
         )
         
         if file_path:
@@ -402,11 +472,99 @@ class UI_Tool(QWidget):
                 case _:  # Default case 
                     QMessageBox.information(self, "Notice", msg)
         
+    def _start_task(self, fn, on_finished, on_failed=None, on_cancelled=None, busy_text=""):
+        """
+        fn(ctx)를 작업 스레드에서 실행합니다. 실행 중에는 취소 버튼과 진행 표시줄을 보여 주며,
+        결과 처리 함수(on_finished 등)는 GUI 스레드에서 호출됩니다.
+        """
+        worker = Worker(fn)
+        worker.signals.message.connect(self._append_event)
+        worker.signals.progress.connect(self._on_task_progress)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(on_failed or self._on_task_failed)
+        worker.signals.cancelled.connect(on_cancelled or self._on_task_cancelled)
+        self._worker = worker
+
+        self.progress_bar.setRange(0, 0) # 진행률을 알기 전에는 바쁨 표시
+        self.progress_label.setText(busy_text)
+        self.progress_bar.setVisible(True)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        self.thread_pool.start(worker)
+
+    def _finish_task(self, cooldown_sec: float = COOLDOWN_SECONDS):
+        """
+        작업이 끝나면 진행 표시를 숨기고 쿨타임 후 버튼을 다시 활성화합니다. (GUI 스레드를 멈추지 않도록 타이머 사용)
+        """
+        self._worker = None
+        self.cancel_button.setVisible(False)
+        self.progress_bar.setVisible(False)
+        self.event_label.ensureCursorVisible()
+        QTimer.singleShot(int(cooldown_sec * 1000), lambda: self._set_button_states(True))
+
+    def is_task_running(self) -> bool:
+        return self._worker is not None
+
+    def click_cancel(self):
+        """
+        취소 버튼 클릭 함수. 진행 중인 작업에 취소를 요청합니다. (현재 처리 중인 요청/청크가 끝나면 멈춤)
+        """
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText("취소 요청됨...")
+
+    def _append_event(self, message: str):
+        """작업 스레드에서 보낸 메시지를 상세 로그 이벤트에 추가"""
+        self.event_label.append(message)
+
+    def _on_task_progress(self, progress):
+        """
+        진행 표시줄과 속도 표시를 갱신합니다.
+        - AnalysisProgress: 읽은 바이트 / 전체 바이트, 초당 행 수
+        - StepProgress: 완료한 단계 수 / 전체 단계 수
+        """
+        if isinstance(progress, AnalysisProgress):
+            fraction = progress.fraction
+            if fraction is None:
+                self.progress_bar.setRange(0, 0)
+            else:
+                self.progress_bar.setRange(0, PROGRESS_BAR_MAX)
+                self.progress_bar.setValue(int(fraction * PROGRESS_BAR_MAX))
+            total = f" / {progress.total_bytes / MB:,.1f} MB" if progress.total_bytes else ""
+            self.progress_label.setText(
+                f"분석 {progress.bytes_done / MB:,.1f} MB{total} | "
+                f"{progress.rows:,} 행 | {progress.rows_per_sec:,.0f} 행/s | {progress.bytes_per_sec / MB:,.1f} MB/s | "
+                f"섹션 변경 {progress.section_changes:,}개, 레이스 {progress.races}개"
+            )
+        elif isinstance(progress, StepProgress):
+            self.progress_bar.setRange(0, max(1, progress.total))
+            self.progress_bar.setValue(progress.done)
+            self.progress_label.setText(f"[{progress.done}/{progress.total}] {progress.text}")
+
+    def _on_task_failed(self, error):
+        """작업 실패 공통 처리 (이벤트 로그에 오류 출력)"""
+        if isinstance(error, TaskFailed):
+            self.event_label.append(f"오류: {error.message}")
+            if error.show_dialog:
+                QMessageBox.critical(self, error.title, error.message)
+        else:
+            self.event_label.append(f"ERROR: 작업 중 예상치 못한 오류 발생: {error}")
+        self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
+        self._finish_task()
+
+    def _on_task_cancelled(self):
+        """작업 취소 공통 처리"""
+        self.event_label.append("작업이 취소되었습니다.")
+        self.event_label.setStyleSheet("padding: 10px; border: 1px solid orange; background-color: #fff8eb;")
+        self._finish_task()
+
     def click_analyze(self):
         """
-        로그 분석 버튼 클릭 함수
+        로그 분석 버튼 클릭 함수 (분석은 작업 스레드에서 실행)
         """
-        if self._check_lock():
+        if self._check_lock() or self.is_task_running():
             return
 
         csv_path = self.csv_path_input.text()
@@ -416,15 +574,44 @@ class UI_Tool(QWidget):
             self._show_messagebox(UI_NotiState.NOTI_ERR, msg)
             return
 
-        log_analyzer = LogAnalyzer()
+        # 버튼 비활성화
+        self._set_button_states(False)
+        self.csv_log_label.setText(f'로그 분석 중: {csv_path}')
+        self.csv_log_label.setStyleSheet("padding: 10px; background-color: #f0f0f0;")
+        # 이어서 분석하면 작업 스레드가 같은 logs 테이블을 수정하므로 분석 중에는 표시하지 않음
+        self.log_model.set_table(None)
+
+        analyzer = self.log_analyzer
+        cache = self.analysis_cache
+        workers = self._get_analyze_workers()
+
+        def task(ctx):
+            # 캐시 확인 후 cvs 분석 (파일이 바뀌지 않았으면 분석 생략, 이전에 분석한 파일이면 추가된 행만 이어서 분석)
+            return upload_pipeline.analyze_log(
+                csv_path,
+                analyzer=analyzer,
+                cache=cache,
+                workers=workers,
+                progress=ctx.progress,
+                cancel_event=ctx.cancel_event,
+                on_summary=lambda summary: ctx.message(summary.format())
+            )
+
+        self._start_task(
+            task,
+            on_finished=self._on_analyze_finished,
+            on_failed=self._on_analyze_failed,
+            on_cancelled=lambda: self._on_analyze_failed('사용자가 분석을 취소했습니다.'),
+            busy_text="로그 분석 중..."
+        )
 
+    def _on_analyze_finished(self, analysis_result: AnalysisResult):
+        """
+        로그 분석 완료 처리 (GUI 스레드)
+        """
         try:
-            # 버튼 비활성화
-            self._set_button_states(False)
-            self.refresh_ui()
-            
-            # cvs 분석
-            self.analysis_result = log_analyzer.analyze(csv_path)
+            self.analysis_result = analysis_result
+            self.time_index = TimeIndex.from_result(self.analysis_result)
 
             result = self.analysis_result
             
@@ -459,17 +646,15 @@ class UI_Tool(QWidget):
                 self.start_selector.addItem("전체 로그 시작")
                 self.end_selector.addItem("전체 로그 종료")
                 
-                lines = []
-                lines.append(f"전체 시간대: {result.first_time} - {result.last_time}")
-                lines.append(f"총 레이스 횟수: {result.total_race_count}\n")
-
-                for entry in result.logs:
-                    if entry.log_type == "RACE_INFO":
-                        lines.append(f"\n{entry.context}\n")
-                    else:
-                        lines.append(f"{entry.time}    {entry.context}") 
-                        
-                self.csv_log_label.setText("\n".join(lines))    
+                # 로그 항목은 문자열로 합치지 않고 테이블 모델로 표시
+                self.log_model.set_table(result.logs)
+                self._apply_log_filter()
+                self.log_view.resizeColumnsToContents()
+
+                self.csv_log_label.setText(
+                    f"전체 시간대: {result.first_time} - {result.last_time}\n"
+                    f"총 레이스 횟수: {result.total_race_count} | 로그 항목: {len(result.logs):,}개 (우클릭: 시작/종료 시간 설정)"
+                )
                 self.csv_log_label.setStyleSheet("padding: 10px; border: 1px solid green; background-color: #ebfff0;")
                 
                 # 상태 변경 to 분석 성공 단계
@@ -480,32 +665,43 @@ class UI_Tool(QWidget):
                 self.csv_log_label.setText('로그 분석 성공: 레이스가 발견되지 않았습니다. 업로드를 진행할 수 없습니다.')
                 self.csv_log_label.setStyleSheet("padding: 10px; border: 1px solid orange; background-color: #fff8eb;")
             
-            time.sleep(COOLDOWN_SECONDS)
-            self._set_button_states(True)
+            self._finish_task()
 
         except Exception as e:
-            self.analysis_result = None
-            
-            # 분석 결과 UI 초기화
-            self.log_data_range_label.setText('N/A | N/A')
-            self.dashboard_setting_range_label.setText('N/A | N/A')
-            self.race_count_label.setText('N/A')
-            self.race_selector.clear()
-            self.race_selector.addItem("분석 실패")
-            self.race_selector.setEnabled(False)
+            self._on_analyze_failed(e)
 
-            self.csv_log_label.setText(f'로그 분석 오류: {e}')
-            self.csv_log_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
-            
-            # 상태 변경 to 초기 단계 ( 분석 이전 )
-            self.current_state = UI_State.INIT_STATE
-            self._set_button_states(True)
+    def _on_analyze_failed(self, error):
+        """
+        로그 분석 실패/취소 처리 (GUI 스레드)
+        """
+        self.analysis_result = None
+        self.time_index = None
+        self.race_transitions = []
+        self.log_analyzer = LogAnalyzer() # 분석 상태가 불완전하므로 새로 시작
+        
+        # 분석 결과 UI 초기화
+        self.log_data_range_label.setText('N/A | N/A')
+        self.dashboard_setting_range_label.setText('N/A | N/A')
+        self.race_count_label.setText('N/A')
+        self.race_selector.clear()
+        self.race_selector.addItem("분석 실패")
+        self.race_selector.setEnabled(False)
+
+        self.log_model.set_table(None)
+        self.csv_log_label.setText(f'로그 분석 오류: {error}')
+        self.csv_log_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
+        
+        # 상태 변경 to 초기 단계 ( 분석 이전 )
+        self.current_state = UI_State.INIT_STATE
+        self._finish_task(cooldown_sec=0)
             
     def click_upload(self):
         """
         대쉬보드 업로드 버튼 클릭 함수
+        csv 준비, 서버 연결 확인, 대시보드 업로드는 작업 스레드에서 실행합니다.
+        각 단계와 HTTP 요청 시간은 구간 추적으로 기록하여 이벤트 로그에 요약하고 TRACE_DIR에 저장합니다.
         """
-        if self._check_lock():
+        if self._check_lock() or self.is_task_running():
             return
         
         # 버튼 비활성화
@@ -520,34 +716,9 @@ class UI_Tool(QWidget):
         json_path = self.config.get('DEFAULT_DASHBOARD_JSON_PATH')
 
         gr_name = self.gr_name_input.text().upper() # 대문자
-        title = f'[{gr_name}]_{self.title_input.text()}' # [GR_ID]_Title
+        title = upload_pipeline.make_title(gr_name, self.title_input.text()) # [GR_ID]_Title
         original_csv_path = self.csv_path_input.text()
 
-        # csv 저장 경로 
-        csv_savedir = os.path.join(os.getcwd(), "csv")
-        os.makedirs(csv_savedir, exist_ok=True)
-
-        # 로그 시작시간 문자열
-        time_str = self.analysis_result.first_time  # "2025-10-23 15:39:31.065"
-
-        # datetime 객체로 변환
-        dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S.%f")
-
-        # 파일명용 문자열로 변환 (밀리초 버림)
-        file_name_time = dt.strftime("%Y-%m-%d_%H%M")
-
-        # 복사할 파일명
-        copy_csv_path = os.path.join(csv_savedir, f"{title}_{file_name_time}.csv")
-
-        try:
-            shutil.copy(original_csv_path, copy_csv_path)
-        except Exception as e:
-            self._show_messagebox(UI_NotiState.NOTI_ERR, f"CSV 파일 복사 실패: {e}")
-            self._set_button_states(True)
-            return
-        
-        csv_path = util.normalize_path_for_grafana(absolute_path=copy_csv_path)
-
         if not self._check_input():
             self._set_button_states(True)
             return
@@ -558,187 +729,214 @@ class UI_Tool(QWidget):
             self._show_messagebox(UI_NotiState.NOTI_ERR, msg)
             self._set_button_states(True)
             return
-        
-        # 출력 메시지 누적을 위한 변수
-        output_messages = []
-        
-        def update_output(message):
-            """출력을 누적해서 업데이트"""
-            output_messages.append(message)
-            full_output = "\n".join(output_messages)
-            self.event_label.setText(full_output)
-            # UI 즉시 업데이트
-            QApplication.processEvents()
-
-
-        update_output("그라파나 서버와 연결을 시도합니다...")
-
-        is_connected, message = self.api.check_connection()
-        self.api.check_connection()
-        
-        if is_connected:
-            update_output("그라파나 서버 연결 성공")
-            update_output(message)
-        else:
-            self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
-            update_output("오류: Grafana 서버 연결 또는 인증 실패")
-            update_output(message)
-            QMessageBox.critical(self, "API 연결 오류", message)
-            self._set_button_states(True)
-            return
 
-        update_output("대시보드 업로드를 시작합니다...")
-        update_output(f"제목: {title}")
-        update_output(f"GR: {gr_name}")
-        update_output(f"JSON 파일: {json_path}")
-        update_output(f"CSV 파일: {csv_path}")
-        update_output(f"시간 범위: {self.start_time} ~ {self.end_time}")
-        
-        
-        
-        
-        # json 파일 로드
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                dashboard_payload = json.load(f)
-            dashboard_payload['timezone'] = "Asia/Seoul"
-            update_output("JSON 파일 로드 완료")
-            
-        except FileNotFoundError:
-            update_output(f'오류: 대시보드 JSON 파일 경로를 찾을 수 없습니다: {json_path}')
-            self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
-            self._set_button_states(True)
-            return
-        except json.JSONDecodeError:
-            update_output(f'오류: 대시보드 JSON 파일 형식이 올바르지 않습니다: {json_path}')
-            self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
-            self._set_button_states(True)   
-            return
+        self.event_label.clear()
+        self.event_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border: none;")
 
+        api = self.api
+        analysis_result = self.analysis_result
+        start_time = self.start_time
+        end_time = self.end_time
+        options = upload_pipeline.UploadOptions.from_config(self.config)
+        trace_dir = upload_pipeline.get_trace_dir(self.config)
+        total_steps = 4
 
-        
-        # 기존 data source 확인 
-        update_output(f"\n기존 datasource 확인...")
-        existing_ds_uid = self.api.find_datasource_by_csv_path(csv_file_path=csv_path)
-        
-        if existing_ds_uid:
-            update_output(f"기존 데이터 소스 발견 (UID: {existing_ds_uid})")
-            target_ds_uid = existing_ds_uid
-        else:
-            update_output("새로운 데이터 소스를 생성합니다...")
-        
-            new_ds_uid = self.api.create_csv_datasource(
-                name=f"{gr_name}_{self.analysis_result.first_time}_{uuid.uuid4().hex[:6]}",
-                csv_path=csv_path
+        def task(ctx):
+            ctx.step(0, total_steps, "csv 준비")
+            try:
+                copy_csv_path = upload_pipeline.prepare_upload_csv(
+                    analysis_result, original_csv_path, start_time, end_time, options
+                )
+            except Exception as e:
+                raise TaskFailed(f"CSV 파일 복사 실패: {e}", show_dialog=True)
+            csv_path = util.normalize_path_for_grafana(absolute_path=copy_csv_path)
+            ctx.check_cancelled()
+
+            ctx.step(1, total_steps, "서버 연결 확인")
+            ctx.message("그라파나 서버와 연결을 시도합니다...")
+            is_connected, message = api.check_connection()
+            if not is_connected:
+                ctx.message("오류: Grafana 서버 연결 또는 인증 실패")
+                raise TaskFailed(message, title="API 연결 오류", show_dialog=True)
+            ctx.message("그라파나 서버 연결 성공")
+            ctx.message(message)
+            ctx.check_cancelled()
+
+            ctx.message("대시보드 업로드를 시작합니다...")
+            ctx.message(f"제목: {title}")
+            ctx.message(f"GR: {gr_name}")
+            ctx.message(f"JSON 파일: {json_path}")
+            ctx.message(f"CSV 파일: {csv_path}")
+            ctx.message(f"시간 범위: {start_time} ~ {end_time}")
+
+            # json 파일 로드
+            ctx.step(2, total_steps, "대시보드 JSON 로드")
+            try:
+                with tracing.span("load_dashboard_template", "pipeline", path=json_path):
+                    template = upload_pipeline.load_dashboard_template(json_path)
+            except FileNotFoundError:
+                raise TaskFailed(f'대시보드 JSON 파일 경로를 찾을 수 없습니다: {json_path}')
+            except json.JSONDecodeError:
+                raise TaskFailed(f'대시보드 JSON 파일 형식이 올바르지 않습니다: {json_path}')
+            ctx.message("JSON 파일 로드 완료")
+            ctx.check_cancelled()
+
+            # 데이터 소스 조회/생성 및 대시보드 업로드
+            ctx.step(3, total_steps, "데이터 소스 / 대시보드 업로드")
+            is_success, dashboard_data = upload_pipeline.upload_dashboard(
+                api=api,
+                template=template,
+                csv_path=csv_path,
+                title=title,
+                gr_name=gr_name,
+                first_time=analysis_result.first_time,
+                start_time=start_time,
+                end_time=end_time,
+                log=ctx.message,
+                skip_unchanged=options.skip_unchanged
             )
-            
-            if new_ds_uid:
-                update_output(f"새로운 데이터 소스 생성 완료! (UID: {new_ds_uid})")
-                target_ds_uid = new_ds_uid
-            else:
-                error_message = f"오류: 데이터 소스 생성에 실패했습니다. (경로: {csv_path})"
-                update_output(error_message)
-                self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
-                self._set_button_states(True)   
-                return 
-            
-        
-        # 기존 대시보드 확인
-        update_output(f"\n기존 대쉬보드 확인...")
-        existing_uid = self.api.find_dashboard_by_title(title)
-        
-        overwrite_flag = False
-        if existing_uid:
-            update_output(f"기존 대시보드 발견 (UID: {existing_uid})")
-            
-            # UID 설정
-            if 'dashboard' in dashboard_payload:
-                dashboard_payload['dashboard']['uid'] = existing_uid
-                dashboard_payload['dashboard']['title'] = title  # 제목도 명시적으로 설정
-            else:
-                dashboard_payload['uid'] = existing_uid
-                dashboard_payload['title'] = title  # 제목도 명시적으로 설정
-                
-            overwrite_flag = True
-            update_output("덮어쓰기(Overwrite) 모드로 진행합니다.")
-        else:
-            update_output("새로운 대시보드를 생성합니다.")
-            
-            # 새로 생성 시 UID 제거하고 제목 설정
-            if 'dashboard' in dashboard_payload:
-                if 'uid' in dashboard_payload['dashboard']:
-                    del dashboard_payload['dashboard']['uid']
-                dashboard_payload['dashboard']['title'] = title  # 제목 설정
-            else:
-                dashboard_payload.pop('uid', None)  # 안전하게 UID 제거
-                dashboard_payload['title'] = title  # 제목 설정
-                
-            update_output("UID 초기화 및 제목 설정 완료")
+            ctx.step(total_steps, total_steps, "완료")
+            return is_success, dashboard_data
 
-        
-        # 대시보드 업로드
-        update_output(f"\n대시보드 업로드 중...")
-        result_message, dashboard_data = self.api.post_dashboard(
-            dashboard_data=dashboard_payload,
-            target_uid=target_ds_uid,
-            start_time=self.start_time,
-            end_time=self.end_time,
-            overwrite=overwrite_flag
+        self._start_task(
+            traced_task(task, "upload", trace_dir, title=title, csv_path=original_csv_path),
+            on_finished=lambda outcome: self._on_upload_finished(title, *outcome),
+            busy_text="대시보드 업로드 중..."
         )
-        
-        # result_message를 라인별로 분리하여 출력 (가독성 향상)
-        if result_message:
-            message_lines = result_message.split('\n')
-            for line in message_lines:
-                if line.strip():  # 빈 줄이 아닌 경우만 출력
-                    update_output(line)
-        
-        # 성공/실패 판단
-        success_indicators = ['성공', 'success']
-        is_success = dashboard_data and any(indicator in result_message for indicator in success_indicators)
-        
+
+    def _on_upload_finished(self, title: str, is_success: bool, dashboard_data):
+        """
+        대시보드 업로드 완료 처리 (GUI 스레드)
+        """
         if is_success:
-            update_output("대시보드 업로드 완료!")
-            update_output(f"대시보드 제목: {title}")
+            self.event_label.append("대시보드 업로드 완료!")
+            self.event_label.append(f"대시보드 제목: {title}")
             
             # 생성된 대시보드 정보 출력
             if isinstance(dashboard_data, dict):
                 if 'uid' in dashboard_data:
-                    update_output(f"대시보드 UID: {dashboard_data['uid']}")
+                    self.event_label.append(f"대시보드 UID: {dashboard_data['uid']}")
                 if 'url' in dashboard_data:
-                    update_output(f"대시보드 URL: {dashboard_data['url']}")
+                    self.event_label.append(f"대시보드 URL: {dashboard_data['url']}")
             
             # last input 갱신
             self.last_title = self.title_input.text()
             self.last_gr_name = self.gr_name_input.text()
             self.event_label.setStyleSheet("padding: 10px; border: 2px solid green; background-color: #f0fff0; min-height: 100px; font-family: monospace;")
-            update_output("대시보드 업로드 완료!!!")
+            self.event_label.append("대시보드 업로드 완료!!!")
             
         else:
             # 실패 시 추가 디버깅 정보
             if hasattr(self.api, 'last_response'):
-                update_output(f"HTTP 상태 코드: {self.api.last_response.status_code}")
+                self.event_label.append(f"HTTP 상태 코드: {self.api.last_response.status_code}")
                 if hasattr(self.api.last_response, 'text'):
-                    update_output(f"응답 내용: {self.api.last_response.text[:200]}...")
+                    self.event_label.append(f"응답 내용: {self.api.last_response.text[:200]}...")
             
             self.event_label.setStyleSheet("padding: 10px; border: 2px solid red; background-color: #fff0f0; min-height: 100px; font-family: monospace;")
             
-            update_output("대시보드 업로드 실패!!!")
+            self.event_label.append("대시보드 업로드 실패!!!")
             
+        # 연결 풀 재사용 통계
+        self.event_label.append(upload_pipeline.format_connection_stats(self.api))
+        self._finish_task()
 
+    def click_upload_all_races(self):
+        """
+        전체 레이스 업로드 버튼 클릭 함수
+        분석된 모든 레이스를 [GR]_Title_R03 형태의 제목으로 레이스마다 구간 csv와 대시보드를 만들어 동시에 업로드합니다.
+        취소하면 아직 시작하지 않은 레이스는 업로드하지 않습니다.
+        """
+        if self._check_lock() or self.is_task_running():
+            return
 
-        self.event_label.ensureCursorVisible()
-        time.sleep(COOLDOWN_SECONDS)
-        self._set_button_states(True)
-        self.refresh_ui()
-        
-        
+        self._set_button_states(False)
+
+        if self.current_state != UI_State.ANALYZE_STATE:
+            self._show_messagebox(UI_NotiState.NOTI_ERR, '먼저 로그 분석 성공적으로 완료하세요')
+            self._set_button_states(True)
+            return
+
+        if not self._check_input():
+            self._set_button_states(True)
+            return
+
+        gr_name = self.gr_name_input.text().upper() # 대문자
+        title = upload_pipeline.make_title(gr_name, self.title_input.text()) # [GR_ID]_Title
+        original_csv_path = self.csv_path_input.text()
+        json_path = self.config.get('DEFAULT_DASHBOARD_JSON_PATH')
+
+        jobs = upload_pipeline.race_jobs(self.analysis_result, title)
+        if not jobs:
+            self._show_messagebox(UI_NotiState.NOTI_WARN, '업로드할 레이스가 없습니다.')
+            self._set_button_states(True)
+            return
+
+        self.event_label.clear()
+        self.event_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border: none;")
+
+        api = self.api
+        analysis_result = self.analysis_result
+        options = upload_pipeline.UploadOptions.from_config(self.config)
+        max_workers = upload_pipeline.get_upload_workers(self.config)
+
+        def task(ctx):
+            is_connected, message = api.check_connection()
+            if not is_connected:
+                ctx.message("오류: Grafana 서버 연결 또는 인증 실패")
+                raise TaskFailed(message, title="API 연결 오류", show_dialog=True)
+
+            try:
+                template = upload_pipeline.load_dashboard_template(json_path)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                raise TaskFailed(f'대시보드 JSON 파일을 읽을 수 없습니다: {json_path} ({e})')
+
+            ctx.message(f"전체 레이스 업로드: {jobs[0].title} ~ {jobs[-1].title} ({len(jobs)}개)")
+            ctx.step(0, len(jobs), "레이스 업로드")
+            return upload_pipeline.upload_many(
+                api,
+                template,
+                analysis_result,
+                original_csv_path,
+                gr_name,
+                jobs,
+                options,
+                max_workers=max_workers,
+                log=ctx.message,
+                cancel_event=ctx.cancel_event,
+                progress=lambda done, total: ctx.step(done, total, "레이스 업로드")
+            )
+
+        self._start_task(task, on_finished=self._on_upload_all_finished, busy_text="전체 레이스 업로드 중...")
+
+    def _on_upload_all_finished(self, job_results):
+        """
+        전체 레이스 업로드 완료 처리 (GUI 스레드)
+        """
+        success_count = sum(1 for job_result in job_results if job_result.success)
+        cancel_count = sum(1 for job_result in job_results if job_result.cancelled)
+        fail_count = len(job_results) - success_count - cancel_count
+        summary = f"\n전체 레이스 업로드 완료. 성공: {success_count}개, 실패: {fail_count}개."
+        if cancel_count:
+            summary += f" 취소: {cancel_count}개."
+        self.event_label.append(summary)
+        self.event_label.append(upload_pipeline.format_connection_stats(self.api))
+
+        if fail_count == 0 and cancel_count == 0:
+            self.last_title = self.title_input.text()
+            self.last_gr_name = self.gr_name_input.text()
+            self.event_label.setStyleSheet("padding: 10px; border: 2px solid green; background-color: #f0fff0; min-height: 100px; font-family: monospace;")
+        elif fail_count == 0:
+            self.event_label.setStyleSheet("padding: 10px; border: 2px solid orange; background-color: #fff8eb; min-height: 100px; font-family: monospace;")
+        else:
+            self.event_label.setStyleSheet("padding: 10px; border: 2px solid red; background-color: #fff0f0; min-height: 100px; font-family: monospace;")
+
+        self._finish_task()
 
     def click_clearbtn(self):
         """
         '초기화' 버튼이 눌렸을 때 모든 입력 필드를 초기화
         """
-        if self._check_lock():
+        if self._check_lock() or self.is_task_running():
             return
         
         # 상태 초기화
@@ -770,7 +968,8 @@ class UI_Tool(QWidget):
         self.end_selector.addItem("분석 후 선택 가능")
         self.end_selector.setEnabled(False)
 
-        # csv log 라벨 초기화 및 스타일 복원
+        # csv log 라벨/테이블 초기화 및 스타일 복원
+        self.log_model.set_table(None)
         self.csv_log_label.setText('csv 파일을 선택 후 로그분석을 하시오')
         self.csv_log_label.setStyleSheet("padding: 10px; background-color: #f0f0f0;") # 스크롤 영역에 테두리가 적용되므로 라벨의 min-height 및 border 제거
         
@@ -781,14 +980,23 @@ csv는 경로나 이름을 다르게 하면 여러개 업로드 가능\n\n \
 all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모두 삭제함 \
     ')
         self.event_label.setStyleSheet("padding: 10px; background-color: #f0f0f0;") # 스크롤 영역에 테두리가 적용되므로 라벨의 min-height 및 border 제거
+        self.progress_label.setText('')
         
-        time.sleep(COOLDOWN_SECONDS)
-        self._set_button_states(True)
+        QTimer.singleShot(int(COOLDOWN_SECONDS * 1000), lambda: self._set_button_states(True))
         
         
     def refresh_ui(self):
         QApplication.processEvents()
 
+    def closeEvent(self, event):
+        """
+        창을 닫을 때 진행 중인 작업을 취소하고 작업 스레드가 끝나기를 잠시 기다립니다.
+        """
+        if getattr(self, '_worker', None) is not None:
+            self._worker.cancel()
+            self.thread_pool.waitForDone(CLOSE_WAIT_MS)
+        super().closeEvent(event)
+
     def select_race_selector(self, index):
         """
         Race 선택 ComboBox의 값이 변경될 때 호출됩니다.
@@ -803,6 +1011,9 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
             return
 
         selected_text = self.race_selector.currentText()
+
+        # 로그 테이블도 선택한 레이스만 표시
+        self._apply_log_filter()
         
         # start/end selector 초기화
         self.start_selector.clear()
@@ -811,6 +1022,7 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
         self.end_selector.setEnabled(False)
         
         self.selected_race = INVALID_RACE_NUM
+        self.race_transitions = []
         if selected_text == "전체 레이스":
             # 전체 레이스 선택 시 로그 데이터 범위 선택
             self.update_log_and_dashboard_range(
@@ -839,15 +1051,15 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
             self.update_log_and_dashboard_range(start_time, end_time)
 
 
-            # 섹션 변경 리스트 가져오기
-            section_changes_list = self.analysis_result.race_section_changes.get(race_number, [])
-            if not section_changes_list:
+            # 레이스 구간의 섹션 변경 (시간 인덱스에서 이분 탐색)
+            self.race_transitions = self._race_transitions(race_number, start_time, end_time)
+            if not self.race_transitions:
                 self.start_selector.addItem("섹션 변경 없음")
                 self.end_selector.addItem("섹션 변경 없음")
                 return
             
             # 섹션 변경 이벤트 항목 추가
-            for section_id, time in section_changes_list:
+            for _, section_id, time in self.race_transitions:
                 section_name = MODE_TABLE.get(section_id, f"UNKNOWN_{section_id.value}")
                 item_text = f"[{section_name}] ({time})"
                 
@@ -856,7 +1068,7 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
                 self.end_selector.addItem(item_text)
             
             # end_selector는 마지막 인덱스로 설정
-            last_index = len(section_changes_list) - 1
+            last_index = len(self.race_transitions) - 1
             if last_index >= 0:
                 self.end_selector.setCurrentIndex(last_index)
             
@@ -875,6 +1087,67 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
                 end_time = race_info.get("end") or "N/A"
                 self.update_log_and_dashboard_range(start_time, end_time)
 
+    def _apply_log_filter(self, *_):
+        """
+        Race 선택과 섹션 필터 값으로 로그 테이블의 표시 행을 거릅니다.
+        """
+        race = None
+        selected_text = self.race_selector.currentText()
+        if selected_text.startswith("Race "):
+            try:
+                race = int(selected_text.split(' ')[1])
+            except (IndexError, ValueError):
+                race = None
+        self.log_model.set_filter(race=race, section=self.section_filter_selector.currentData())
+
+    def _show_log_context_menu(self, pos):
+        """
+        로그 테이블 우클릭 메뉴: 선택한 행의 시간을 대시보드 시작/종료 시간으로 설정
+        """
+        index = self.log_view.indexAt(pos)
+        if not index.isValid() or self.current_state != UI_State.ANALYZE_STATE:
+            return
+
+        time_str = self.log_model.time_at(index.row())
+        if not time_str:
+            return
+
+        menu = QMenu(self)
+        start_action = menu.addAction(f"시작 시간으로 설정 ({time_str})")
+        end_action = menu.addAction(f"종료 시간으로 설정 ({time_str})")
+        chosen = menu.exec(self.log_view.viewport().mapToGlobal(pos))
+
+        if chosen is start_action:
+            self.set_range_from_log(start_time=time_str)
+        elif chosen is end_action:
+            self.set_range_from_log(end_time=time_str)
+
+    def set_range_from_log(self, start_time=None, end_time=None):
+        """
+        로그 테이블에서 고른 시간으로 대시보드 시작/종료 시간을 설정합니다. (지정하지 않은 쪽은 현재 값 유지)
+        """
+        new_start = start_time or self.start_time
+        new_end = end_time or self.end_time
+        if not new_start or not new_end:
+            self._show_messagebox(UI_NotiState.NOTI_ERR, "Race 데이터에 시간이 누락")
+            return False
+
+        if not self._is_time_before(new_start, new_end):
+            self._show_messagebox(UI_NotiState.NOTI_ERR, "시작 시간은 종료 시간보다 빨라야 합니다")
+            return False
+
+        self.update_log_and_dashboard_range(new_start, new_end)
+
+        # 고른 시간이 속한 레이스/섹션 표시 (시간 인덱스 조회)
+        if self.time_index is not None:
+            picked = start_time or end_time
+            race = self.time_index.race_at(picked)
+            section = self.time_index.section_at(picked)
+            section_name = MODE_TABLE.get(section, "N/A") if section is not None else "N/A"
+            race_text = f"Race {race}" if race is not None else "레이스 밖"
+            self.event_label.setText(f"{'시작' if start_time else '종료'} 시간 설정: {picked} ({race_text}, {section_name})")
+        return True
+
     def select_start_selector(self, index):
         """
         시작 시간(start_selector)이 변경될 때 호출됩니다.
@@ -884,18 +1157,15 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
             return
                 
         # 분석 완료 상태가 아니거나 유효하지 않은 인덱스(-1)일 경우 무시
-        if self.current_state != UI_State.ANALYZE_STATE or not self.analysis_result.race_section_changes:
+        if self.current_state != UI_State.ANALYZE_STATE or not self.race_transitions:
             return
         
-        race_number = self.selected_race
-        section_changes_list = self.analysis_result.race_section_changes.get(race_number, [])
-        
-        if index >= len(section_changes_list):
+        if index >= len(self.race_transitions):
             self._show_messagebox(UI_NotiState.NOTI_ERR, "R유효하지 않은 인덱스")
             return
 
         # 선택된 인덱스에서 시간 추출
-        new_start_time = section_changes_list[index][1] # (section_id, time) 튜플의 [1]번째 요소
+        new_start_time = self.race_transitions[index][2] # (race, section, time) 튜플의 [2]번째 요소
         
         # 현재 끝 시간 
         self.end_time
@@ -904,7 +1174,7 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
             return
 
         # 시간 비교
-        if new_start_time >= self.end_time:
+        if not self._is_time_before(new_start_time, self.end_time):
             self._show_messagebox(UI_NotiState.NOTI_ERR, "시작 시간은 종료 시간보다 빨라야 합니다")
             return
         
@@ -921,19 +1191,16 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
             return
                 
         # 분석 완료 상태 및 데이터 존재 여부 확인
-        if self.current_state != UI_State.ANALYZE_STATE or not self.analysis_result.race_section_changes:
+        if self.current_state != UI_State.ANALYZE_STATE or not self.race_transitions:
             return
         
-        race_number = self.selected_race
-        section_changes_list = self.analysis_result.race_section_changes.get(race_number, [])
-        
-        if index >= len(section_changes_list):
+        if index >= len(self.race_transitions):
             self._show_messagebox(UI_NotiState.NOTI_ERR, "R유효하지 않은 인덱스")
             return
 
         # 선택된 인덱스에서 시간 추출
-        # (section_id, time) 튜플의 [1]번째 요소
-        new_end_time = section_changes_list[index][1] 
+        # (race, section, time) 튜플의 [2]번째 요소
+        new_end_time = self.race_transitions[index][2]
         
         if not new_end_time or not self.start_time:
             self._show_messagebox(UI_NotiState.NOTI_ERR, "Race 데이터에 시간이 누락")
@@ -941,12 +1208,22 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
 
         # 시간 비교
         # 종료 시간이 시작 시간보다 늦어야 합니다.
-        if new_end_time <= self.start_time:
+        if not self._is_time_before(self.start_time, new_end_time):
             self._show_messagebox(UI_NotiState.NOTI_ERR, "종료 시간은 시작 시간보다 늦어야 합니다")
             return
         
         self.update_log_and_dashboard_range(self.start_time, new_end_time)
 
+    @staticmethod
+    def _is_time_before(t0: str, t1: str) -> bool:
+        """
+        t0이 t1보다 이른 시간인지 epoch 밀리초로 비교합니다. (변환할 수 없는 형식이면 문자열 비교)
+        """
+        ms0, ms1 = TimeIndex.to_ms(t0), TimeIndex.to_ms(t1)
+        if ms0 is None or ms1 is None:
+            return t0 < t1
+        return ms0 < ms1
+
     def update_log_and_dashboard_range(self, start_time, end_time):
         # 범위
         log_range = f"{start_time or 'N/A'} ~ {end_time or 'N/A'}"
@@ -970,57 +1247,60 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        if self._check_lock():
+        if self._check_lock() or self.is_task_running():
             return
         
         self._set_button_states(False)
         self.event_label.clear()
-        self.refresh_ui()
-        
-        try:
-            self.event_label.append("dash board 및 data source 삭제 시작")
+        self.event_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border: none;")
+
+        api = self.api
+        delete_workers = upload_pipeline.get_delete_workers(self.config)
+
+        def task(ctx):
+            # 삭제가 끝나는 항목마다 message 신호로 바로 출력
+            ctx.message("dash board 및 data source 삭제 시작")
             
-            # dash board 삭제
-            is_db_success, db_messages = self.api.delete_all_dashboards()
-            self.event_label.append("\n[대시보드 삭제 결과]")
-            for msg in db_messages:
-                self.event_label.append(msg)
+            # dash board 삭제 (동시 요청)
+            ctx.step(0, 2, "대시보드 삭제")
+            ctx.message("\n[대시보드 삭제 결과]")
+            is_db_success, _ = api.delete_all_dashboards(
+                max_workers=delete_workers, on_message=ctx.message, cancel_event=ctx.cancel_event
+            )
             
             db_status = "SUCCESS" if is_db_success else "FAILED"
-            self.event_label.append(f"최종 대시보드 삭제 상태: {db_status}")
+            ctx.message(f"최종 대시보드 삭제 상태: {db_status}")
+            ctx.check_cancelled()
             
-            # data source 삭제
-            is_ds_success, ds_messages = self.api.delete_all_datasources()
-            self.event_label.append("\n[데이터 소스 삭제 결과]")
-            for msg in ds_messages:
-                self.event_label.append(msg)
+            # data source 삭제 (동시 요청)
+            ctx.step(1, 2, "데이터 소스 삭제")
+            ctx.message("\n[데이터 소스 삭제 결과]")
+            is_ds_success, _ = api.delete_all_datasources(
+                max_workers=delete_workers, on_message=ctx.message, cancel_event=ctx.cancel_event
+            )
                 
             ds_status = "SUCCESS" if is_ds_success else "FAILED"
-            self.event_label.append(f"최종 데이터 소스 삭제 상태: {ds_status}")
+            ctx.message(f"최종 데이터 소스 삭제 상태: {ds_status}")
+            ctx.check_cancelled()
+            ctx.step(2, 2, "완료")
+            return is_db_success and is_ds_success
 
-            overall_success = is_db_success and is_ds_success
-            if overall_success:
-                final_status = "모든 항목을 삭제했습니다" 
-                self.event_label.setStyleSheet("padding: 10px; border: 1px solid green; background-color: #ebfff0;")
-                
-            else:
-                final_status = "일부 삭제 작업에 실패"
-                self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
-                
-            self.event_label.append(f"\n=== 최종 삭제 작업 요약: {final_status} ===")
+        self._start_task(task, on_finished=self._on_delete_finished, busy_text="삭제 중...")
 
-        except Exception as e:
-            error_msg = f"API 인스턴스 생성 또는 실행 중 예상치 못한 오류 발생: {e}"
-            self.event_label.append(f"ERROR: {error_msg}")
-            self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
+    def _on_delete_finished(self, overall_success: bool):
+        """
+        전체 삭제 완료 처리 (GUI 스레드)
+        """
+        if overall_success:
+            final_status = "모든 항목을 삭제했습니다" 
+            self.event_label.setStyleSheet("padding: 10px; border: 1px solid green; background-color: #ebfff0;")
             
+        else:
+            final_status = "일부 삭제 작업에 실패"
+            self.event_label.setStyleSheet("padding: 10px; border: 1px solid red; background-color: #ffebeb;")
             
-        # UI 스크롤을 맨 아래로 이동
-        self.event_label.ensureCursorVisible()
-
-        time.sleep(COOLDOWN_SECONDS)
-        self._set_button_states(True)
-        self.refresh_ui()
+        self.event_label.append(f"\n=== 최종 삭제 작업 요약: {final_status} ===")
+        self._finish_task()
         
     
     def _set_button_states(self, enable: bool):
@@ -1037,10 +1317,12 @@ all delete 버튼은 그라파나의 dash board, data source (csv 목록)을 모
             
             if self.current_state != UI_State.INIT_STATE:
                 self.upload_button.setEnabled(enable)
+                self.upload_all_button.setEnabled(enable)
             
         else: # 비활성화
             self.analyze_button.setEnabled(enable)
             self.upload_button.setEnabled(enable)
+            self.upload_all_button.setEnabled(enable)
             self.clear_button.setEnabled(enable)
             self.delete_all_button.setEnabled(enable)
             self.csv_browse_button.setEnabled(enable)
@@ -0,0 +1,124 @@
+import threading
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+import tracing
+from log_analyzer import AnalysisCancelled
+
+
+@dataclass
+class StepProgress:
+    """
+    단계 단위 진행 상황 (HTTP 요청 단계, 레이스 업로드 개수 등)
+    """
+    done: int
+    total: int
+    text: str = ""
+
+
+class TaskFailed(Exception):
+    """
+    작업 중 사용자에게 알려야 하는 오류. show_dialog가 True이면 메시지 박스도 띄웁니다.
+    """
+    def __init__(self, message: str, title: str = "Error", show_dialog: bool = False):
+        super().__init__(message)
+        self.message = message
+        self.title = title
+        self.show_dialog = show_dialog
+
+
+class WorkerSignals(QObject):
+    """
+    작업 스레드 → GUI 스레드 신호. (QRunnable은 QObject가 아니므로 신호를 별도 객체에 둠)
+    - message: 이벤트 로그에 추가할 문자열
+    - progress: AnalysisProgress 또는 StepProgress
+    - finished: 작업 함수의 반환값
+    - failed: TaskFailed 또는 예상하지 못한 예외
+    - cancelled: 취소되어 중단됨
+    """
+    message = Signal(str)
+    progress = Signal(object)
+    finished = Signal(object)
+    failed = Signal(object)
+    cancelled = Signal()
+
+
+class TaskContext:
+    """
+    작업 함수에 넘기는 객체. 작업 스레드에서 호출해도 되는 신호 발신 함수와 취소 이벤트를 제공합니다.
+    """
+    def __init__(self, signals: WorkerSignals, cancel_event: threading.Event):
+        self._signals = signals
+        self.cancel_event = cancel_event
+
+    def message(self, text: str):
+        self._signals.message.emit(text)
+
+    def progress(self, value: Any):
+        self._signals.progress.emit(value)
+
+    def step(self, done: int, total: int, text: str = ""):
+        self._signals.progress.emit(StepProgress(done, total, text))
+
+    def check_cancelled(self):
+        """
+        취소 요청이 있으면 AnalysisCancelled를 발생시켜 작업을 중단합니다.
+        """
+        if self.cancel_event.is_set():
+            raise AnalysisCancelled("작업이 취소되었습니다.")
+
+
+class Worker(QRunnable):
+    """
+    fn(ctx)를 QThreadPool 스레드에서 실행하고 결과를 신호로 전달합니다.
+    취소는 협조적으로 동작합니다: cancel()은 이벤트만 설정하고, 작업 함수가 ctx.cancel_event를 확인하여 멈춥니다.
+    작업이 끝난 뒤 취소 이벤트가 설정되어 있어도 반환값이 있으면 finished로 전달합니다. (부분 결과 표시용)
+    """
+    def __init__(self, fn: Callable[[TaskContext], Any]):
+        super().__init__()
+        self.fn = fn
+        self.signals = WorkerSignals()
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        ctx = TaskContext(self.signals, self.cancel_event)
+        try:
+            result = self.fn(ctx)
+        except AnalysisCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+def traced_task(fn: Callable[[TaskContext], Any], name: str, trace_dir: Optional[str] = None,
+                **args) -> Callable[[TaskContext], Any]:
+    """
+    fn 실행 전체를 name 구간으로 추적하는 작업 함수를 만듭니다.
+    작업이 끝나면(실패/취소 포함) 단계별 시간과 HTTP 요청 요약을 이벤트 로그에 추가하고,
+    trace_dir이 있으면 Chrome trace JSON 파일로 저장합니다.
+    """
+    def task(ctx: TaskContext):
+        tracer = tracing.Tracer(name)
+        try:
+            with tracing.activate(tracer), tracing.span(name, "ui", **args):
+                return fn(ctx)
+        finally:
+            ctx.message("\n[구간 추적]")
+            for line in tracer.summary_lines():
+                ctx.message(line)
+            if trace_dir:
+                try:
+                    path = tracer.write(tracing.trace_file_path(trace_dir, name))
+                    ctx.message(f"추적 파일: {path} (chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+                except OSError as e:
+                    ctx.message(f"추적 파일 저장 실패: {e}")
+    return task
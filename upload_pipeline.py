@@ -0,0 +1,464 @@
+import os
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, CancelledError, as_completed
+from typing import Callable, Optional, Tuple, Dict, Any, List
+
+import util
+import csv_window
+import csv_store
+import downsample
+import bulk_delete
+import tracing
+from dashboard_template import DashboardTemplate, get_template
+from config_manager import ConfigManager
+from grafana_api import (
+    GrafanaAPI, dashboard_uid_for_title, datasource_uid_for_path,
+    DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT_SEC, DEFAULT_RETRY_COUNT, DEFAULT_RETRY_BACKOFF_SEC, DEFAULT_DS_INDEX_TTL_SEC
+)
+from log_analyzer import LogAnalyzer, AnalysisResult, AnalysisSummary, ProgressCallback
+from analysis_cache import AnalysisCache
+
+# 업로드용 csv 저장 폴더 (실행 경로 기준)
+UPLOAD_CSV_DIR = "csv"
+
+# 진행 메시지 출력 함수 (UI는 이벤트 창, CLI는 print)
+LogFunc = Callable[[str], None]
+
+# 여러 대시보드를 한 번에 업로드할 때 동시 요청 수 기본값
+DEFAULT_UPLOAD_WORKERS = 4
+
+
+@dataclass
+class UploadOptions:
+    """
+    업로드 파이프라인 설정. (config.ini의 DEFAULT 섹션 값)
+    """
+    json_path: str
+    csv_dir: str
+    padding_sec: float = 0
+    downsample_points: int = 0
+    skip_unchanged: bool = True # 서버의 대시보드와 내용 해시가 같으면 업로드 생략
+    store_link_mode: str = csv_store.LINK_AUTO # 전체 로그를 csv 저장소에 넣는 방식 (auto, hardlink, copy)
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> "UploadOptions":
+        try:
+            padding_sec = float(config.get('CSV_WINDOW_PADDING_SEC', fallback=0))
+        except ValueError:
+            padding_sec = 0
+        try:
+            downsample_points = int(config.get('DOWNSAMPLE_POINTS', fallback=0))
+        except ValueError:
+            downsample_points = 0
+
+        return cls(
+            json_path=config.get('DEFAULT_DASHBOARD_JSON_PATH'),
+            csv_dir=os.path.join(os.getcwd(), UPLOAD_CSV_DIR),
+            padding_sec=padding_sec,
+            downsample_points=downsample_points,
+            skip_unchanged=str(config.get('SKIP_UNCHANGED_UPLOAD', fallback='true')).strip().lower() not in ('0', 'false', 'no', 'off'),
+            store_link_mode=str(config.get('CSV_STORE_LINK', fallback=csv_store.LINK_AUTO)).strip().lower()
+        )
+
+
+def get_analyze_workers(config: ConfigManager) -> int:
+    """
+    설정의 ANALYZE_WORKERS 값을 읽어 로그 분석 프로세스 수를 반환합니다. (0 또는 미설정: CPU 코어 수)
+    """
+    try:
+        workers = int(config.get('ANALYZE_WORKERS', fallback=0))
+    except ValueError:
+        workers = 0
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def create_analysis_cache(config: ConfigManager) -> AnalysisCache:
+    """
+    설정의 ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_MAX_MB로 분석 결과 캐시를 생성합니다. (MAX_MB가 0이면 사용 안 함)
+    """
+    cache_dir = config.get('ANALYSIS_CACHE_DIR', fallback='./cache')
+    try:
+        max_mb = float(config.get('ANALYSIS_CACHE_MAX_MB', fallback=512))
+    except ValueError:
+        max_mb = 0
+    return AnalysisCache(cache_dir=os.path.abspath(cache_dir), max_bytes=int(max_mb * 1024 * 1024))
+
+
+def get_trace_dir(config: ConfigManager) -> Optional[str]:
+    """
+    설정의 TRACE_DIR 값 (업로드 구간 추적 파일을 저장할 폴더, 비어 있으면 파일로 저장하지 않음)
+    """
+    trace_dir = str(config.get('TRACE_DIR', fallback='') or '').strip()
+    return os.path.abspath(trace_dir) if trace_dir else None
+
+
+def get_delete_workers(config: ConfigManager) -> int:
+    """
+    설정의 [API] DELETE_WORKERS 값을 읽어 일괄 삭제 시 동시 요청 수를 반환합니다.
+    """
+    try:
+        workers = int(config.get('DELETE_WORKERS', section='API', fallback=bulk_delete.DEFAULT_DELETE_WORKERS))
+    except ValueError:
+        workers = bulk_delete.DEFAULT_DELETE_WORKERS
+    return max(1, workers)
+
+
+def get_upload_workers(config: ConfigManager) -> int:
+    """
+    설정의 [API] UPLOAD_WORKERS 값을 읽어 여러 대시보드 업로드 시 동시 처리 수를 반환합니다.
+    """
+    try:
+        workers = int(config.get('UPLOAD_WORKERS', section='API', fallback=DEFAULT_UPLOAD_WORKERS))
+    except ValueError:
+        workers = DEFAULT_UPLOAD_WORKERS
+    return max(1, workers)
+
+
+def create_api(config: ConfigManager) -> Tuple[Optional[GrafanaAPI], str]:
+    """
+    config.ini의 [API] 섹션으로 GrafanaAPI를 생성합니다.
+    설정이 누락되었으면 (None, 오류 메시지)를 반환합니다.
+    """
+    api_key = config.get(section='API', key="api_key")
+    server_url = config.get(section='API', key="server_url")
+
+    if not api_key or not server_url:
+        error_msg = (
+            "오류: API 설정이 누락되었습니다.\n\n"
+            f"- server_url: {'OK' if server_url else 'X (누락)'}\n"
+            f"- api_key: {'OK' if api_key else 'X (누락)'}\n\n"
+            "config.ini 파일의 [API] 섹션을 확인하여 입력"
+        )
+        return None, error_msg
+
+    try:
+        pool_size = int(config.get('POOL_SIZE', section='API', fallback=DEFAULT_POOL_SIZE))
+        timeout = float(config.get('TIMEOUT_SEC', section='API', fallback=DEFAULT_TIMEOUT_SEC))
+        retries = int(config.get('RETRY_COUNT', section='API', fallback=DEFAULT_RETRY_COUNT))
+        backoff = float(config.get('RETRY_BACKOFF_SEC', section='API', fallback=DEFAULT_RETRY_BACKOFF_SEC))
+        ds_index_ttl = float(config.get('DATASOURCE_INDEX_TTL_SEC', section='API', fallback=DEFAULT_DS_INDEX_TTL_SEC))
+    except ValueError as e:
+        return None, f"오류: config.ini [API] 섹션의 연결 설정 값이 올바르지 않습니다. ({e})"
+
+    api = GrafanaAPI(
+        base_url=server_url,
+        api_key=api_key,
+        pool_size=max(1, pool_size),
+        timeout=timeout,
+        retries=max(0, retries),
+        backoff=backoff,
+        ds_index_ttl=ds_index_ttl
+    )
+    return api, "INFO: API 설정 확인 완료. Grafana API 객체 초기화 성공."
+
+
+def format_connection_stats(api: GrafanaAPI) -> str:
+    """
+    연결 풀 재사용 통계를 한 줄 메시지로 만듭니다.
+    """
+    stats = api.get_connection_stats()
+    return f"HTTP 요청 {stats['requests']}회, 새 연결 {stats['connections']}회 (연결 재사용 {stats['reused']}회)"
+
+
+@tracing.traced(cat="pipeline")
+def analyze_log(csv_path: str, analyzer: Optional[LogAnalyzer] = None, cache: Optional[AnalysisCache] = None,
+                workers: Optional[int] = None, progress: Optional[ProgressCallback] = None,
+                cancel_event: Optional[threading.Event] = None,
+                on_summary: Optional[Callable[[AnalysisSummary], None]] = None) -> AnalysisResult:
+    """
+    캐시를 먼저 확인하고, 없으면 로그를 분석하여 캐시에 저장합니다.
+    같은 analyzer로 같은 파일을 다시 분석하면 추가된 행만 이어서 분석합니다.
+    캐시를 사용한 경우에도 analyzer에 이어서 분석할 위치를 되돌리므로 다음 분석은 추가된 행만 읽습니다.
+    캐시에는 파일 끝까지 분석한 결과만 저장합니다. (개행 전의 마지막 줄을 보류한 결과는 저장 안 함)
+    취소되면 AnalysisCancelled가 발생하며 analyzer는 다시 만들어야 합니다.
+    on_summary는 실제로 분석했을 때만 측정 결과(AnalysisSummary)와 함께 호출됩니다. (캐시 사용 시 호출 안 함)
+    """
+    cached = cache.get_entry(csv_path) if cache is not None else None
+    if cached is not None:
+        result, resume_state = cached
+        if analyzer is not None and resume_state is not None:
+            analyzer.restore(csv_path, result, resume_state)
+        return result
+
+    analyzer = analyzer if analyzer is not None else LogAnalyzer()
+    result = analyzer.analyze_incremental(csv_path, workers=workers, progress=progress, cancel_event=cancel_event)
+    if cache is not None and not analyzer.has_pending_line:
+        cache.put(csv_path, result, analyzer.resume_state())
+    if on_summary is not None and analyzer.last_summary is not None:
+        on_summary(analyzer.last_summary)
+    return result
+
+
+def make_title(gr_name: str, title: str) -> str:
+    """
+    대시보드 제목을 [GR_ID]_Title 형태로 만듭니다. (GR ID는 대문자)
+    """
+    return f'[{gr_name.upper()}]_{title}'
+
+
+def race_label(race_num: Optional[int]) -> str:
+    """
+    레이스 번호를 제목용 문자열로 만듭니다. (3 → R03, None → ALL)
+    """
+    return f"R{race_num:02d}" if race_num is not None else "ALL"
+
+
+@dataclass
+class UploadJob:
+    """
+    대시보드 하나의 업로드 작업 (제목과 시간 범위, race는 표시용)
+    """
+    title: str
+    start_time: str
+    end_time: str
+    race: Optional[int] = None
+
+
+@dataclass
+class UploadJobResult:
+    """
+    업로드 작업 결과 (messages: 작업 중 출력된 메시지)
+    """
+    job: UploadJob
+    success: bool
+    url: str = ""
+    messages: Optional[List[str]] = None
+    unchanged: bool = False # 서버와 내용이 같아 업로드 생략
+    cancelled: bool = False # 시작 전에 취소됨
+
+
+def race_jobs(result: AnalysisResult, title: str, races: Optional[List[int]] = None) -> List[UploadJob]:
+    """
+    레이스마다 [GR]_Title_R03 형태의 제목으로 업로드 작업을 만듭니다.
+    races가 None이면 시작/종료 시간이 모두 있는 모든 레이스를 대상으로 합니다.
+    """
+    if races is None:
+        races = sorted(
+            race_num for race_num, times in result.race_times.items()
+            if times.get("start") and times.get("end")
+        )
+    jobs = []
+    for race_num in races:
+        times = result.race_times[race_num]
+        jobs.append(UploadJob(f"{title}_{race_label(race_num)}", times["start"], times["end"], race_num))
+    return jobs
+
+
+@tracing.traced(cat="pipeline")
+def prepare_upload_csv(result: AnalysisResult, original_csv_path: str,
+                       start_time: str, end_time: str, options: UploadOptions) -> str:
+    """
+    업로드할 csv를 options.csv_dir의 내용 주소 저장소(store/<내용 해시>.csv)에 준비하고 경로를 반환합니다.
+    전체 로그 범위가 아닌 구간(레이스/섹션)이 선택되어 있으면 분석 시 기록한 바이트 위치 인덱스로
+    해당 구간(앞뒤 CSV_WINDOW_PADDING_SEC 포함)의 행만 추출하고, 아니면 파일 전체를 넣습니다. (가능하면 reflink/하드 링크)
+    DOWNSAMPLE_POINTS가 0보다 크면 템플릿 패널 열별 포인트 수를 그 이하로 줄여서 저장합니다.
+    내용이 같으면 같은 경로가 되므로 제목을 바꿔 다시 올려도 파일과 데이터 소스가 늘지 않고,
+    같은 원본/설정으로 이미 만든 파일은 다시 만들지 않습니다.
+    """
+    store = csv_store.get_store(options.csv_dir, options.store_link_mode)
+
+    is_window = (start_time, end_time) != (result.first_time, result.last_time)
+    padding_ms = int(options.padding_sec * 1000)
+    columns = downsample.template_columns_from_file(options.json_path) if options.downsample_points > 0 else []
+
+    key = store.source_key(
+        original_csv_path,
+        window=[start_time, end_time, padding_ms] if is_window else None,
+        downsample=[options.downsample_points, columns] if options.downsample_points > 0 else None
+    )
+    cached_path = store.lookup(key)
+    tracing.annotate(window=is_window, downsample_points=options.downsample_points, cached=cached_path is not None)
+    if cached_path is not None:
+        return cached_path
+
+    if not is_window and options.downsample_points <= 0:
+        # 전체 로그: 압축된 로그는 압축을 풀면서 복사 (Grafana CSV 플러그인은 일반 csv만 읽음)
+        copy_csv_path, _ = store.add_source(original_csv_path, key)
+        return copy_csv_path
+
+    hasher = csv_store.new_hasher()
+    tmp_path = store.temp_path()
+    window_path = None
+    try:
+        if is_window:
+            window_path = store.temp_path() if options.downsample_points > 0 else tmp_path
+            csv_window.extract_window(
+                original_csv_path,
+                window_path,
+                start_time,
+                end_time,
+                row_index=result.row_index,
+                padding_ms=padding_ms,
+                hasher=None if options.downsample_points > 0 else hasher
+            )
+
+        if options.downsample_points > 0:
+            # 대시보드 템플릿의 패널 열마다 LTTB로 포인트 수를 줄여서 저장 (섹션 변경 행은 유지)
+            source_path = window_path if is_window else original_csv_path
+            downsample.downsample_csv(source_path, tmp_path, columns, options.downsample_points, hasher=hasher)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    finally:
+        if window_path is not None and window_path != tmp_path and os.path.exists(window_path):
+            os.remove(window_path)
+
+    return store.add_temp_file(tmp_path, hasher.hexdigest(), key)
+
+
+def load_dashboard_template(json_path: str) -> DashboardTemplate:
+    """
+    대시보드 템플릿을 읽습니다. 파일이 바뀌지 않았으면 이전에 파싱한 템플릿을 그대로 사용합니다.
+    (FileNotFoundError, json.JSONDecodeError는 호출한 쪽에서 처리)
+    """
+    return get_template(json_path)
+
+
+@tracing.traced(cat="pipeline")
+def upload_dashboard(api: GrafanaAPI, template: DashboardTemplate, csv_path: str, title: str, gr_name: str,
+                     first_time: str, start_time: str, end_time: str,
+                     log: LogFunc = print,
+                     skip_unchanged: bool = True) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    csv_path(Grafana 경로 형식)의 데이터 소스를 찾거나 생성하고, 대시보드를 생성 또는 덮어씁니다.
+    데이터 소스는 csv 경로 인덱스(목록 조회 최대 1회)로 찾고, 새로 만들 때는 경로로 정해지는 UID를 사용합니다.
+    대시보드 UID는 제목으로 정해지므로 검색 없이 바로 생성 또는 덮어씁니다.
+    template은 수정하지 않으므로 여러 번 업로드할 때도 같은 템플릿을 그대로 넘기면 됩니다.
+    skip_unchanged이면 서버의 대시보드와 내용 해시가 같을 때 POST하지 않고 성공으로 처리합니다.
+    (성공 여부, Grafana 응답 JSON)을 반환합니다.
+    """
+    # 기존 data source 확인 (url 인덱스: 이 기능 이전에 만든 데이터 소스도 경로로 찾음)
+    log("\n기존 datasource 확인...")
+    existing_ds_uid = api.find_datasource_by_csv_path(csv_file_path=csv_path)
+
+    if existing_ds_uid:
+        log(f"기존 데이터 소스 발견 (UID: {existing_ds_uid})")
+        target_ds_uid = existing_ds_uid
+    else:
+        log("새로운 데이터 소스를 생성합니다...")
+
+        ds_uid = datasource_uid_for_path(csv_path)
+        new_ds_uid = api.create_csv_datasource(
+            name=f"{gr_name}_{first_time}_{ds_uid[-6:]}",
+            csv_path=csv_path,
+            uid=ds_uid
+        )
+
+        # 동시에 같은 경로를 업로드하여 이미 생성된 경우 (UID가 같으므로 UID로 확인)
+        if not new_ds_uid and api.get_datasource_by_uid(ds_uid):
+            new_ds_uid = ds_uid
+
+        if new_ds_uid:
+            log(f"새로운 데이터 소스 생성 완료! (UID: {new_ds_uid})")
+            target_ds_uid = new_ds_uid
+        else:
+            log(f"오류: 데이터 소스 생성에 실패했습니다. (경로: {csv_path})")
+            return False, None
+
+    # 제목으로 정해지는 UID로 생성 또는 덮어쓰기 (검색 없이 POST 1회)
+    dashboard_uid = dashboard_uid_for_title(title)
+    log(f"\n대시보드 UID: {dashboard_uid} (같은 제목이 있으면 덮어쓰기)")
+
+    # 대시보드 업로드
+    log("\n대시보드 업로드 중...")
+    result_message, dashboard_data = api.post_dashboard(
+        dashboard_data=template,
+        target_uid=target_ds_uid,
+        start_time=start_time,
+        end_time=end_time,
+        overwrite=True,
+        title=title,
+        dashboard_uid=dashboard_uid,
+        skip_unchanged=skip_unchanged
+    )
+
+    # result_message를 라인별로 분리하여 출력 (가독성 향상)
+    if result_message:
+        for line in result_message.split('\n'):
+            if line.strip():  # 빈 줄이 아닌 경우만 출력
+                log(line)
+
+    # 성공/실패 판단
+    success_indicators = ['성공', 'success']
+    is_success = bool(dashboard_data) and any(indicator in result_message for indicator in success_indicators)
+    return is_success, dashboard_data
+
+
+@tracing.traced(cat="pipeline")
+def upload_many(api: GrafanaAPI, template: DashboardTemplate, result: AnalysisResult, original_csv_path: str,
+                gr_name: str, jobs: List[UploadJob], options: UploadOptions,
+                max_workers: int = DEFAULT_UPLOAD_WORKERS, log: LogFunc = print,
+                cancel_event: Optional[threading.Event] = None,
+                progress: Optional[Callable[[int, int], None]] = None) -> List[UploadJobResult]:
+    """
+    여러 업로드 작업(레이스별 대시보드 등)을 동시에 처리합니다.
+    데이터 소스는 api의 csv 경로 인덱스로 찾으므로 목록 조회는 모든 작업을 합쳐 최대 1회이고,
+    csv 준비와 HTTP 요청은 작업마다 스레드에서 진행합니다. (동시 처리 수는 연결 풀 크기 이하)
+    log는 호출한 스레드에서만 호출되므로 UI 위젯에 바로 출력해도 됩니다. (작업이 끝날 때마다 해당 작업의 메시지를 출력)
+    cancel_event가 설정되면 아직 시작하지 않은 작업은 취소(cancelled)하고 진행 중인 작업만 마칩니다.
+    progress(끝난 작업 수, 전체 작업 수)는 작업이 끝날 때마다 log와 같은 스레드에서 호출됩니다.
+    작업 순서대로 결과 리스트를 반환합니다.
+    """
+    if not jobs:
+        return []
+
+    def run_job(job: UploadJob) -> UploadJobResult:
+        if cancel_event is not None and cancel_event.is_set():
+            return UploadJobResult(job, False, messages=["취소됨"], cancelled=True)
+        messages: List[str] = []
+        with tracing.span("upload_job", "pipeline", title=job.title, race=job.race):
+            try:
+                copy_csv_path = prepare_upload_csv(result, original_csv_path, job.start_time, job.end_time, options)
+                is_success, dashboard_data = upload_dashboard(
+                    api=api,
+                    template=template,
+                    csv_path=util.normalize_path_for_grafana(absolute_path=copy_csv_path),
+                    title=job.title,
+                    gr_name=gr_name,
+                    first_time=result.first_time,
+                    start_time=job.start_time,
+                    end_time=job.end_time,
+                    log=messages.append,
+                    skip_unchanged=options.skip_unchanged
+                )
+            except Exception as e:
+                messages.append(f"업로드 오류: {e}")
+                is_success, dashboard_data = False, None
+        url = dashboard_data.get('url', '') if is_success and isinstance(dashboard_data, dict) else ""
+        unchanged = is_success and isinstance(dashboard_data, dict) and dashboard_data.get('status') == 'unchanged'
+        return UploadJobResult(job, is_success, url, messages, unchanged)
+
+    max_workers = max(1, min(max_workers, api.pool_size, len(jobs)))
+    log(f"대시보드 {len(jobs)}개 업로드 시작 (동시 처리: {max_workers}개)")
+
+    results: Dict[int, UploadJobResult] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_job, job): index for index, job in enumerate(jobs)}
+        cancel_requested = False
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                job_result = future.result()
+            except CancelledError:
+                job_result = UploadJobResult(jobs[index], False, messages=["취소됨"], cancelled=True)
+            results[index] = job_result
+            if progress is not None:
+                progress(len(results), len(jobs))
+
+            if cancel_event is not None and cancel_event.is_set() and not cancel_requested:
+                cancel_requested = True
+                log("업로드 취소: 진행 중인 작업만 마칩니다.")
+                for pending in futures:
+                    pending.cancel()
+
+            if job_result.cancelled:
+                continue
+            status = "생략 (변경 없음)" if job_result.unchanged else ("완료" if job_result.success else "실패")
+            log(f"[{len(results)}/{len(jobs)}] {job_result.job.title}: 업로드 {status} {job_result.url}".rstrip())
+            if not job_result.success:
+                for message in job_result.messages:
+                    if message.strip():
+                        log(f"    {message.strip()}")
+
+    return [results[index] for index in range(len(jobs))]
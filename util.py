@@ -1,4 +1,28 @@
 import os
+import io
+import sys
+import gzip
+import lzma
+import shutil
+import calendar
+from datetime import datetime, timedelta
+from typing import Optional
+
+try:
+    import resource # 최대 메모리 측정 (Unix), Windows에는 없음
+except ImportError:
+    resource = None
+
+# 로그 시간 문자열 형식: 'YYYY-MM-DD HH:MM:SS.sss'
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+_EPOCH = datetime(1970, 1, 1)
+
+# 지원하는 압축 로그 확장자
+COMPRESSED_EXTENSIONS = ('.gz', '.xz', '.zst')
+LOG_FILE_EXTENSIONS = ('.csv',) + tuple(f'.csv{ext}' for ext in COMPRESSED_EXTENSIONS)
+
+# 압축 해제 복사 버퍼 크기
+COPY_BUFFER_BYTES = 1024 * 1024
 
 def normalize_path_for_grafana(absolute_path: str) -> str:
     """
@@ -10,4 +34,123 @@ def normalize_path_for_grafana(absolute_path: str) -> str:
     # 역슬래시를 포워드 슬래시로 변환
     normalized_path = absolute_path.replace('\\', '/')
     
-    return normalized_path    
\ No newline at end of file
+    return normalized_path    
+
+def time_str_to_ms(time_str: str) -> Optional[int]:
+    """
+    'YYYY-MM-DD HH:MM:SS.sss' → epoch 밀리초 (시간대 변환 없이 문자열 그대로의 시각)
+    형식이 다르면 None을 반환합니다.
+    """
+    if len(time_str) != 23 or time_str[4] != '-' or time_str[10] != ' ' or time_str[19] != '.':
+        return None
+    try:
+        seconds = calendar.timegm((
+            int(time_str[0:4]), int(time_str[5:7]), int(time_str[8:10]),
+            int(time_str[11:13]), int(time_str[14:16]), int(time_str[17:19])
+        ))
+        return seconds * 1000 + int(time_str[20:23])
+    except ValueError:
+        return None
+
+def ms_to_time_str(ms: int) -> str:
+    """
+    epoch 밀리초 → 'YYYY-MM-DD HH:MM:SS.sss'
+    """
+    dt = _EPOCH + timedelta(milliseconds=ms)
+    return f"{dt:%Y-%m-%d %H:%M:%S}.{ms % 1000:03d}"
+
+
+def is_compressed_path(path: str) -> bool:
+    """
+    압축된 로그 파일(.gz / .xz / .zst)인지 확장자로 확인합니다.
+    """
+    return path.lower().endswith(COMPRESSED_EXTENSIONS)
+
+def is_log_file_path(path: str) -> bool:
+    """
+    분석 가능한 로그 파일(.csv, .csv.gz, .csv.xz, .csv.zst)인지 확장자로 확인합니다.
+    """
+    return path.lower().endswith(LOG_FILE_EXTENSIONS)
+
+def open_log_file(path: str):
+    """
+    로그 파일을 바이너리 읽기 모드로 엽니다.
+    압축 파일은 압축을 푼 내용을 스트리밍으로 읽는 파일 객체를 반환합니다. (디스크에 풀지 않음)
+    .zst는 zstandard 패키지가 설치되어 있어야 합니다.
+    """
+    lower = path.lower()
+    if lower.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if lower.endswith('.xz'):
+        return lzma.open(path, 'rb')
+    if lower.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(".zst 로그를 읽으려면 zstandard 패키지가 필요합니다. (pip install zstandard)")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        return io.BufferedReader(reader, buffer_size=COPY_BUFFER_BYTES)
+    return open(path, 'rb')
+
+def skip_forward(f, position: int, target: int):
+    """
+    파일 위치를 position에서 target으로 앞으로 옮깁니다.
+    seek를 지원하지 않는 스트림(zstd 등)은 읽어서 버립니다.
+    """
+    if target <= position:
+        return
+    if f.seekable():
+        f.seek(target)
+        return
+    remaining = target - position
+    while remaining > 0:
+        block = f.read(min(remaining, COPY_BUFFER_BYTES))
+        if not block:
+            break
+        remaining -= len(block)
+
+def copy_log_file(src_path: str, dst_path: str):
+    """
+    로그 파일을 dst_path에 복사합니다. 압축 파일이면 압축을 풀면서 바로 저장합니다.
+    """
+    if not is_compressed_path(src_path):
+        shutil.copy(src_path, dst_path)
+        return
+    with open_log_file(src_path) as fin, open(dst_path, 'wb') as fout:
+        shutil.copyfileobj(fin, fout, COPY_BUFFER_BYTES)
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    현재 프로세스의 최대 메모리 사용량(peak RSS / peak working set, 바이트)을 반환합니다.
+    측정할 수 없는 환경이면 None.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024 # macOS는 바이트, Linux는 KB 단위
+    if os.name == 'nt':
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.PeakWorkingSetSize
+        except (OSError, AttributeError):
+            pass
+    return None